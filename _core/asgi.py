@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_core.settings")
 
 application = get_asgi_application()
+
+from movies.id_filter import movie_id_filter  # noqa: E402
+from users.revocation import token_denylist  # noqa: E402
+
+movie_id_filter.warm_on_startup()
+token_denylist.warm_on_startup()
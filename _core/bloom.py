@@ -0,0 +1,151 @@
+import hashlib
+import math
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from django.db import DatabaseError, connections
+from django.utils import timezone
+
+from .cache import get_version
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom sobre UUIDs: `in` nunca dá falso negativo e dá falso
+    positivo com probabilidade próxima de `error_rate` até `capacity` itens
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity = max(capacity, 1)
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.size / 8))
+        self.count = 0
+        # Chave aleatória por processo: ninguém consegue escolher UUIDs que
+        # colidam de propósito
+        self._key = os.urandom(16)
+
+    def _positions(self, item: uuid.UUID):
+        digest = hashlib.blake2b(item.bytes, digest_size=16, key=self._key).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: uuid.UUID) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: uuid.UUID) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class CatchUpBloomFilter:
+    """
+    Filtro de Bloom em memória sobre os ids de uma tabela.
+
+    É carregado inteiro no primeiro uso e depois recebe as linhas novas por
+    um catch-up pelo índice de uma coluna de data, a partir da marca d'água
+    do catch-up anterior. O catch-up roda a cada `REFRESH_INTERVAL` segundos,
+    ou antes se a versão de `version_resource` no cache de respostas mudar.
+
+    As subclasses informam a configuração (`get_settings`, com `CAPACITY`,
+    `ERROR_RATE` e `REFRESH_INTERVAL`), os ids da carga (`load_ids`) e os
+    gravados desde uma data (`recent_ids`).
+    """
+
+    version_resource: str
+
+    # Folga do catch-up para transações que gravaram a data antes do início
+    # do último catch-up, mas só fizeram commit depois dele
+    catch_up_slack = timedelta(minutes=1)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.bloom: BloomFilter | None = None
+        self.watermark = None
+        self.version = None
+        self.refreshed_at = 0.0
+
+    def get_settings(self) -> dict:
+        raise NotImplementedError
+
+    def load_ids(self) -> Iterable[uuid.UUID]:
+        raise NotImplementedError
+
+    def recent_ids(self, since: datetime) -> Iterable[uuid.UUID]:
+        raise NotImplementedError
+
+    def _load(self, capacity: int, error_rate: float) -> None:
+        self.watermark = timezone.now()
+        self.bloom = BloomFilter(capacity, error_rate)
+        for item in self.load_ids():
+            self.bloom.add(item)
+
+        self.version = get_version(self.version_resource)
+        self.refreshed_at = time.monotonic()
+
+    def _warm(self, config: dict) -> None:
+        self._load(config["CAPACITY"], config["ERROR_RATE"])
+
+        # Mais itens que a capacidade configurada: recarrega com folga
+        if self.bloom.count > self.bloom.capacity:
+            self._load(2 * self.bloom.count, config["ERROR_RATE"])
+
+    def _catch_up(self, config: dict) -> None:
+        started = timezone.now()
+        for item in self.recent_ids(self.watermark - self.catch_up_slack):
+            if item not in self.bloom:
+                self.bloom.add(item)
+        self.watermark = started
+
+        # Filtro cheio demais perde precisão: recarrega com o dobro do tamanho
+        if self.bloom.count > self.bloom.capacity:
+            self._load(2 * self.bloom.count, config["ERROR_RATE"])
+
+    def _refresh(self, config: dict) -> None:
+        version = get_version(self.version_resource)
+        elapsed = time.monotonic() - self.refreshed_at
+        if version == self.version and elapsed < config["REFRESH_INTERVAL"]:
+            return
+
+        self._catch_up(config)
+        self.version = version
+        self.refreshed_at = time.monotonic()
+
+    def warm(self) -> None:
+        """
+        Carrega o filtro antecipadamente, para que a primeira requisição não
+        pague a carga
+        """
+        with self._lock:
+            self._warm(self.get_settings())
+
+    def warm_on_startup(self) -> None:
+        """
+        Carga ao subir o servidor (wsgi/asgi). Se o banco ainda não estiver
+        pronto, o filtro é carregado na primeira requisição.
+        """
+        try:
+            self.warm()
+        except DatabaseError:
+            self.reset()
+        finally:
+            # Não deixa uma conexão aberta para ser herdada por workers forkados
+            connections.close_all()
+
+    def add(self, item: uuid.UUID) -> None:
+        with self._lock:
+            if self.bloom is not None and item not in self.bloom:
+                self.bloom.add(item)
@@ -0,0 +1,154 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.views import Request
+
+
+def get_response_cache() -> BaseCache:
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def get_version(resource: str, create: bool = True) -> int | None:
+    """
+    Versão atual de um recurso (`movies`, `reviews:<movie_id>`...). Quando a
+    chave não existe (cache novo ou despejo), começa de um timestamp em ns
+    para nunca reaproveitar uma versão antiga que ainda esteja em cache. Com
+    `create=False`, devolve None em vez de criar a chave.
+    """
+    cache = get_response_cache()
+    key = f"version:{resource}"
+
+    version = cache.get(key)
+    if version is None and create:
+        start_version(resource)
+        version = cache.get(key)
+
+    return version
+
+
+def start_version(resource: str) -> int | None:
+    """
+    Cria a versão de um recurso que ainda não tem uma. Devolve None se outra
+    requisição (ou uma escrita) criou a chave antes.
+    """
+    version = time.time_ns()
+    if get_response_cache().add(f"version:{resource}", version, timeout=None):
+        return version
+
+    return None
+
+
+def _incr_version(resource: str) -> None:
+    cache = get_response_cache()
+    try:
+        cache.incr(f"version:{resource}")
+    except ValueError:
+        start_version(resource)
+
+
+def bump_version(*resources: str) -> None:
+    """
+    Invalida as respostas em cache dos recursos informados. Incrementa agora
+    e de novo no commit, para que uma leitura feita durante a transação não
+    deixe em cache, sob a versão nova, dados ainda não commitados.
+    """
+    for resource in resources:
+        _incr_version(resource)
+
+    transaction.on_commit(lambda: [_incr_version(resource) for resource in resources])
+
+
+class VersionedCacheMixin:
+    """
+    Cache das respostas GET de uma view, com chave composta por URL, query
+    string, `Accept` e a versão de cada recurso de `get_cache_resources`.
+
+    Emite ETags fortes e responde `If-None-Match` com 304 antes mesmo de
+    autenticar ou montar o queryset, ou seja, sem tocar no ORM.
+    """
+
+    cache_timeout = 60 * 5
+
+    def get_cache_resources(self) -> list[str]:
+        raise NotImplementedError
+
+    def dispatch(self, request: Request, *args, **kwargs) -> HttpResponse:
+        if request.method != "GET":
+            return super().dispatch(request, *args, **kwargs)
+
+        self.args, self.kwargs = args, kwargs
+        versions = {
+            resource: get_version(resource, create=False)
+            for resource in self.get_cache_resources()
+        }
+        if None in versions.values():
+            return self._dispatch_unversioned(request, versions, *args, **kwargs)
+
+        etag, digest = self._etag(request, versions)
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            return response
+
+        cache = get_response_cache()
+        cached = cache.get(f"response:{digest}")
+        if cached is not None:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+            response["ETag"] = etag
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+
+        return self._store(response, etag, digest)
+
+    def _dispatch_unversioned(
+        self, request: Request, versions: dict, *args, **kwargs
+    ) -> HttpResponse:
+        """
+        Algum recurso ainda não tem versão. Ela só é criada depois de uma
+        resposta 200, para que 404s de ids aleatórios (scrapers) não encham
+        o cache de chaves permanentes. Se outra requisição ou uma escrita
+        criou a versão enquanto isso, a resposta não vai para o cache.
+        """
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+
+        for resource, version in versions.items():
+            if version is None:
+                version = start_version(resource)
+                if version is None:
+                    return response
+                versions[resource] = version
+
+        return self._store(response, *self._etag(request, versions))
+
+    @staticmethod
+    def _etag(request: Request, versions: dict) -> tuple[str, str]:
+        variant = f"{request.get_full_path()}|{request.META.get('HTTP_ACCEPT', '')}"
+        joined = ":".join(str(version) for version in versions.values())
+        digest = hashlib.sha1(f"{variant}|{joined}".encode()).hexdigest()
+
+        return f'"{digest}"', digest
+
+    def _store(self, response: HttpResponse, etag: str, digest: str) -> HttpResponse:
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+
+        get_response_cache().set(
+            f"response:{digest}",
+            (response.content, response["Content-Type"]),
+            self.cache_timeout,
+        )
+        response["ETag"] = etag
+        response["X-Cache"] = "MISS"
+        return response
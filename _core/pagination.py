@@ -0,0 +1,193 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from functools import partial
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import Request, View
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por cursor (keyset) sobre uma chave composta e indexada.
+
+    Ao contrário da `PageNumberPagination`, não faz `COUNT(*)` nem `OFFSET`:
+    cada página é um `WHERE (a, b) > (x, y) ORDER BY a, b LIMIT n`, então a
+    página 10.000 custa o mesmo que a primeira. O último campo de `ordering`
+    precisa ser único (normalmente o `id`) para que a chave seja estável.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    ordering: tuple[str, ...] = ()
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: View = None
+    ) -> list:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+
+        position, reverse = self.decode_cursor(request)
+
+        order_by = [self._flip(field) if reverse else field for field in self.ordering]
+        queryset = queryset.order_by(*order_by)
+        if position is not None:
+            # O formato já foi checado em `decode_cursor`, mas os valores de um
+            # cursor adulterado ainda podem ser do tipo errado para o campo
+            try:
+                queryset = queryset.filter(self._after(order_by, position))
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # Busca um item a mais só para saber se existe página seguinte
+        rows = list(queryset[: self.page_size + 1])
+        has_following = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data: list) -> Response:
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def decode_cursor(self, request: Request) -> tuple[list | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position, reverse = payload["p"], bool(payload["r"])
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        payload = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _position(self, instance) -> list:
+        values = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip("-"))
+            values.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+
+        return values
+
+    @staticmethod
+    def _flip(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(order_by: list[str], position: list) -> Q:
+        """
+        Monta `a >= x AND ((a > x) OR (a = x AND b > y) OR ...)` respeitando
+        a direção de cada campo. O primeiro termo é redundante, mas é ele que
+        permite ao SQLite fazer um range seek no índice em vez de varrê-lo.
+        """
+        first, value = order_by[0], position[0]
+        lookup = "lte" if first.startswith("-") else "gte"
+        bound = Q(**{f"{first.lstrip('-')}__{lookup}": value})
+
+        condition = Q()
+        equal = Q()
+        for field, value in zip(order_by, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        return bound & condition
+
+
+class KnownCountPaginator(Paginator):
+    """
+    `Paginator` que aceita o total já conhecido, evitando o `COUNT(*)`
+    """
+
+    def __init__(self, object_list, per_page, count: int | None = None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            self.count = count
+
+
+class KnownCountPagination(PageNumberPagination):
+    """
+    Paginação numerada que usa o total informado pela view em
+    `get_known_count()`, normalmente um contador desnormalizado. Se a view
+    não souber o total (retorna None), cai no `COUNT(*)` padrão.
+    """
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: View = None
+    ) -> list | None:
+        known_count = getattr(view, "get_known_count", lambda: None)()
+        self.django_paginator_class = partial(KnownCountPaginator, count=known_count)
+
+        return super().paginate_queryset(queryset, request, view)
+
+
+class CursorOptInMixin:
+    """
+    Mixin de views genéricas: a paginação por cursor é opt-in, bastando
+    enviar `?cursor=` (vazio na primeira página). Sem ele, mantém a
+    paginação numerada padrão, com `count`.
+    """
+
+    cursor_pagination_class: type[KeysetPagination]
+
+    @property
+    def paginator(self) -> BasePagination | None:
+        if not hasattr(self, "_paginator"):
+            cursor_param = self.cursor_pagination_class.cursor_query_param
+            if cursor_param in self.request.query_params:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+
+        return self._paginator
@@ -0,0 +1,29 @@
+import csv
+import json
+from typing import Callable, Iterable, Iterator
+
+from django.core.management.base import CommandError
+
+
+def read_records(
+    source: Iterable[str],
+    file_format: str,
+    clean_csv_row: Callable[[dict], dict] | None = None,
+) -> Iterator[tuple[int, dict]]:
+    """
+    Lê um arquivo NDJSON ou CSV como stream, um registro por vez, junto do
+    número da linha. `clean_csv_row` adapta cada linha do CSV, onde todos os
+    valores chegam como texto, ao formato dos registros do NDJSON.
+    """
+    if file_format == "csv":
+        for line, row in enumerate(csv.DictReader(source), start=2):
+            yield line, clean_csv_row(row) if clean_csv_row else row
+        return
+
+    for line, raw in enumerate(source, start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line, json.loads(raw)
+        except json.JSONDecodeError as err:
+            raise CommandError(f"Line {line}: invalid JSON ({err.msg}).")
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -95,6 +96,69 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+#
+# O alias "responses" guarda as listagens cacheadas por _core/cache.py. O
+# LocMemCache vale só para o processo atual; com vários workers, troque por
+# um backend compartilhado, como FileBasedCache ou DatabaseCache (SQLite,
+# após `manage.py createcachetable`).
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+RESPONSE_CACHE_ALIAS = "responses"
+
+
+# Filtro de ids de filmes (movies/id_filter.py)
+#
+# Filtro de Bloom em memória com os ids dos filmes existentes: as rotas de
+# reviews respondem 404 para ids desconhecidos sem consultar o banco. Filmes
+# criados em outro processo entram no filtro em até REFRESH_INTERVAL segundos.
+
+MOVIE_ID_FILTER = {
+    "ENABLED": True,
+    "CAPACITY": 100_000,
+    "ERROR_RATE": 0.001,
+    "REFRESH_INTERVAL": 5.0,
+}
+
+# Ranking de filmes (`/api/movies/top/`)
+#
+# Média bayesiana: (stars_sum + PRIOR_MEAN * PRIOR_WEIGHT) / (reviews_count +
+# PRIOR_WEIGHT). Depois de alterar estes valores, rode
+# `manage.py rebuild_review_stats` para recalcular as notas.
+
+MOVIE_RANKING = {
+    "PRIOR_MEAN": 3.0,
+    "PRIOR_WEIGHT": 10,
+}
+
+# Ingestão write-behind de reviews
+#
+# Com ENABLED, o POST de review valida a requisição, grava no journal SQLite
+# em JOURNAL e responde 202; a thread de flush grava as reviews no banco em
+# lotes de até BATCH_SIZE a cada FLUSH_INTERVAL segundos. Em processos que não
+# devem gravar em segundo plano, use BACKGROUND_FLUSHER = False e esvazie a
+# fila com `manage.py review_queue drain`.
+
+REVIEW_WRITE_BEHIND = {
+    "ENABLED": False,
+    "JOURNAL": BASE_DIR / "review_queue.sqlite3",
+    "BATCH_SIZE": 1000,
+    "FLUSH_INTERVAL": 0.5,
+    "BACKGROUND_FLUSHER": True,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -113,9 +177,77 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Perfis de hash de senha
+# https://docs.djangoproject.com/en/4.1/topics/auth/passwords/
+#
+# "default" usa os hashers padrão do Django (PBKDF2). "fast" coloca o MD5 na
+# frente para testes e cargas de dados de exemplo, onde o custo do PBKDF2 só
+# queima CPU; senhas já gravadas com PBKDF2 continuam sendo verificadas.
+# Nunca use "fast" em produção.
+
+PASSWORD_HASHER_PROFILES = {
+    "default": [
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+        "django.contrib.auth.hashers.Argon2PasswordHasher",
+        "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+        "django.contrib.auth.hashers.ScryptPasswordHasher",
+    ],
+}
+PASSWORD_HASHER_PROFILES["fast"] = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+    *PASSWORD_HASHER_PROFILES["default"],
+]
+
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[
+    os.environ.get("PASSWORD_HASHER_PROFILE", "default")
+]
+
+# Criação de usuários em lote (users/hashing.py): a partir de MIN_POOL_SIZE
+# senhas, o hash roda em WORKERS processos (padrão: um por CPU)
+
+PASSWORD_HASHING = {
+    "WORKERS": None,
+    "MIN_POOL_SIZE": 256,
+}
+
+# Login assíncrono (users/login.py): a senha é conferida em um pool de
+# WORKERS threads com no máximo MAX_PENDING checagens na fila, e cada username
+# tem até MAX_ATTEMPTS tentativas a cada WINDOW segundos
+
+LOGIN = {
+    "WORKERS": 4,
+    "MAX_PENDING": 64,
+    "MAX_ATTEMPTS": 5,
+    "WINDOW": 300,
+    "MAX_TRACKED_USERS": 100_000,
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=24),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    "TOKEN_OBTAIN_SERIALIZER": "users.tokens.ClaimsTokenObtainPairSerializer",
+    "AUTH_TOKEN_CLASSES": ("users.tokens.RevocableAccessToken",),
+}
+
+# Revogação de tokens (users/revocation.py): os jtis revogados e ainda não
+# expirados ficam num filtro de Bloom em memória, e só um acerto do filtro
+# consulta o banco. Revogações de outros processos valem em até
+# REFRESH_INTERVAL segundos; os expirados são apagados a cada PRUNE_INTERVAL
+
+TOKEN_DENYLIST = {
+    "CAPACITY": 100_000,
+    "ERROR_RATE": 0.001,
+    "REFRESH_INTERVAL": 5.0,
+    "PRUNE_INTERVAL": 3600.0,
+}
+
+# Autenticação por claims (users/authentication.py): as views de filmes e
+# reviews montam o usuário a partir do access token, sem query. Mudanças de
+# permissão só valem no próximo login.
+
+JWT_CLAIMS_AUTH = {
+    "ENABLED": False,
 }
 
 REST_FRAMEWORK = {
@@ -0,0 +1,143 @@
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import Request
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Permite instanciar o serializer com `fields=` para devolver só um
+    subconjunto dos campos. Os atributos de classe descrevem o que cada campo
+    precisa carregar do banco, usados por `apply_sparse_fields`:
+
+    - `sparse_columns`: campo -> colunas do model (padrão: o próprio nome)
+    - `sparse_select`: campo -> relação para `select_related`
+    - `sparse_prefetch`: campo -> relação para `prefetch_related`
+
+    Campos em `sparse_select` ou `sparse_prefetch` também podem ser pedidos
+    via `?expand=`.
+    """
+
+    sparse_columns: dict[str, tuple[str, ...]] = {}
+    sparse_select: dict[str, str] = {}
+    sparse_prefetch: dict[str, str] = {}
+
+    def __init__(self, *args, fields: set[str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def _split(value: str | None) -> set[str]:
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def readable_fields(serializer_class: type[serializers.Serializer]) -> set[str]:
+    """
+    Campos que aparecem na resposta: os `write_only`, como a senha, nem
+    podem ser pedidos nem devem ter a coluna lida
+    """
+    return {
+        name
+        for name, field in serializer_class().fields.items()
+        if not field.write_only
+    }
+
+
+def parse_sparse_fields(
+    request: Request, serializer_class: type[serializers.Serializer]
+) -> set[str] | None:
+    """
+    Lê `?fields=` e `?expand=`. Retorna None quando `fields` não foi enviado
+    ou está vazio, ou seja, quando a resposta deve ter todos os campos.
+    """
+    if not request.query_params.get("fields"):
+        return None
+
+    available = readable_fields(serializer_class)
+    expandable = {*serializer_class.sparse_select, *serializer_class.sparse_prefetch}
+    fields = _split(request.query_params.get("fields"))
+    expand = _split(request.query_params.get("expand"))
+
+    errors = {}
+    if unknown := fields - available:
+        errors["fields"] = [f"Unknown fields: {', '.join(sorted(unknown))}."]
+    if unknown := expand - expandable:
+        errors["expand"] = [f"Unknown relations: {', '.join(sorted(unknown))}."]
+    if errors:
+        raise ValidationError(errors)
+
+    return fields | expand
+
+
+def apply_sparse_fields(
+    queryset: QuerySet,
+    serializer_class: type[serializers.Serializer],
+    fields: set[str],
+    always: tuple[str, ...] = (),
+) -> QuerySet:
+    """
+    Restringe o SELECT às colunas que os campos pedidos usam (`only()`) e faz
+    os joins e prefetches apenas das relações pedidas. `always` lista colunas
+    que a view precisa mesmo fora da resposta, como as da ordenação do cursor.
+    """
+    columns, select, prefetch = list(always), [], []
+    for name in fields:
+        if name in serializer_class.sparse_prefetch:
+            prefetch.append(serializer_class.sparse_prefetch[name])
+            continue
+
+        columns.extend(serializer_class.sparse_columns.get(name, (name,)))
+        if name in serializer_class.sparse_select:
+            select.append(serializer_class.sparse_select[name])
+
+    queryset = queryset.only(*columns) if columns else queryset.only("pk")
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+
+    return queryset
+
+
+class SparseFieldsViewMixin:
+    """
+    Liga `?fields=`/`?expand=` ao queryset e ao serializer de views genéricas
+    nas requisições GET
+    """
+
+    sparse_always: tuple[str, ...] = ()
+
+    @property
+    def sparse_fields(self) -> set[str] | None:
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = None
+            if self.request.method == "GET":
+                self._sparse_fields = parse_sparse_fields(
+                    self.request, self.get_serializer_class()
+                )
+
+        return self._sparse_fields
+
+    def filter_sparse_fields(self, queryset: QuerySet) -> QuerySet:
+        """
+        Sem `?fields=` aplica todos os campos do serializer: continua lendo só
+        as colunas usadas e resolve todas as relações com select/prefetch, o
+        que mantém a listagem livre de N+1.
+        """
+        serializer_class = self.get_serializer_class()
+        fields = self.sparse_fields
+        if fields is None:
+            fields = readable_fields(serializer_class)
+
+        return apply_sparse_fields(
+            queryset, serializer_class, fields, self.sparse_always
+        )
+
+    def get_serializer(self, *args, **kwargs) -> serializers.Serializer:
+        if self.sparse_fields is not None:
+            kwargs.setdefault("fields", self.sparse_fields)
+
+        return super().get_serializer(*args, **kwargs)
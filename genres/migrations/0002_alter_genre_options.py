@@ -0,0 +1,17 @@
+# Generated by Django 4.1 on 2026-10-17 15:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genres", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="genre",
+            options={"ordering": ("name",)},
+        ),
+    ]
@@ -1,5 +1,15 @@
+import uuid
+
 from django.db import models
 
 
 class Genre(models.Model):
-    ...
+    """
+    Classe modelo de gêneros de filmes
+    """
+
+    id = models.UUIDField(default=uuid.uuid4, primary_key=True, editable=False)
+    name = models.CharField(max_length=127, unique=True)
+
+    class Meta:
+        ordering = ("name",)
@@ -1 +1,6 @@
+from rest_framework import serializers
 
+
+class GenreSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(max_length=127)
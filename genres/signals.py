@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from _core.cache import bump_version
+
+from .models import Genre
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_movie_listing(**kwargs) -> None:
+    """
+    Os gêneros aparecem aninhados nos filmes, então qualquer escrita neles
+    invalida a listagem de filmes
+    """
+    bump_version("movies")
@@ -0,0 +1,66 @@
+from decimal import Decimal, InvalidOperation
+from typing import Callable
+
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_date, parse_duration
+from rest_framework.exceptions import ValidationError
+
+
+def _parse_decimal(value: str) -> Decimal | None:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        return None
+
+    # NaN e Infinity são Decimals válidos, mas o DecimalField os recusa
+    return number if number.is_finite() else None
+
+
+# parâmetro de query -> (lookup do ORM, parser, mensagem de erro)
+MOVIE_FILTERS: dict[str, tuple[str, Callable, str]] = {
+    "genre": ("genres__name", str, ""),
+    "premiere_from": ("premiere__gte", parse_date, "Enter a valid date (YYYY-MM-DD)."),
+    "premiere_to": ("premiere__lte", parse_date, "Enter a valid date (YYYY-MM-DD)."),
+    "budget_min": ("budget__gte", _parse_decimal, "A valid number is required."),
+    "budget_max": ("budget__lte", _parse_decimal, "A valid number is required."),
+    "duration_min": (
+        "duration__gte",
+        parse_duration,
+        "Enter a valid duration (HH:MM:SS).",
+    ),
+    "duration_max": (
+        "duration__lte",
+        parse_duration,
+        "Enter a valid duration (HH:MM:SS).",
+    ),
+}
+
+
+def filter_movies(queryset: QuerySet, params: dict) -> QuerySet:
+    """
+    Aplica os filtros da listagem de filmes. Cada filtro tem um índice
+    composto correspondente em `Movie.Meta.indexes`, então nenhuma
+    combinação cai num full scan (ver tests/movies/test_movie_filters.py).
+    """
+    lookups, errors = {}, {}
+    for param, (lookup, parse, error_message) in MOVIE_FILTERS.items():
+        raw = params.get(param)
+        if raw is None or raw == "":
+            continue
+
+        try:
+            value = parse(raw)
+        except (ValueError, OverflowError):
+            # datas/durações bem formadas, mas impossíveis (2020-13-45)
+            value = None
+
+        if value is None:
+            errors[param] = [error_message]
+            continue
+
+        lookups[lookup] = value
+
+    if errors:
+        raise ValidationError(errors)
+
+    return queryset.filter(**lookups)
@@ -0,0 +1,71 @@
+import uuid
+from datetime import datetime
+from typing import Iterable
+
+from django.conf import settings
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from _core.bloom import CatchUpBloomFilter
+
+from .models import Movie
+
+
+class MovieIdFilter(CatchUpBloomFilter):
+    """
+    Conjunto em memória dos ids de filmes existentes, para recusar ids
+    inexistentes sem ir ao banco.
+
+    Recebe os filmes criados neste processo pelo signal de `post_save`.
+    Filmes criados por outros processos ou via `bulk_create` entram pelo
+    catch-up pelo índice de `updated_at`, feito só quando um id não é
+    encontrado. Filmes removidos continuam no filtro, o que só custa a query
+    que já seria feita sem ele.
+    """
+
+    version_resource = "movies"
+
+    def get_settings(self) -> dict:
+        return settings.MOVIE_ID_FILTER
+
+    def load_ids(self) -> Iterable[uuid.UUID]:
+        movie_ids = Movie.objects.values_list("id", flat=True).order_by()
+        return movie_ids.iterator(chunk_size=10000)
+
+    def recent_ids(self, since: datetime) -> Iterable[uuid.UUID]:
+        recent = Movie.objects.filter(updated_at__gte=since)
+        return recent.values_list("id", flat=True).order_by()
+
+    def warm(self) -> None:
+        if self.get_settings()["ENABLED"]:
+            super().warm()
+
+    def might_exist(self, movie_id: uuid.UUID) -> bool:
+        config = self.get_settings()
+        if not config["ENABLED"]:
+            return True
+
+        with self._lock:
+            if self.bloom is None:
+                self._warm(config)
+
+            if movie_id in self.bloom:
+                return True
+
+            self._refresh(config)
+
+            return movie_id in self.bloom
+
+
+movie_id_filter = MovieIdFilter()
+
+
+def get_movie_or_404(movie_id: uuid.UUID, *fields: str) -> Movie:
+    """
+    Busca um filme pelo id carregando só o pk e os `fields` pedidos. Ids que
+    o `movie_id_filter` garante não existirem viram 404 sem query.
+    """
+    if not movie_id_filter.might_exist(movie_id):
+        raise Http404
+
+    return get_object_or_404(Movie.objects.only("id", *fields), pk=movie_id)
@@ -0,0 +1,262 @@
+import json
+import os
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+from _core.cache import bump_version
+from _core.records import read_records
+from genres.models import Genre
+from movies.id_filter import movie_id_filter
+from movies.models import Movie
+from movies.serializers import MovieSerializer
+from reviews.models import CriticStats, Review
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa um catálogo de filmes (NDJSON ou CSV) em lotes, com gêneros "
+        "e reviews, usando bulk_create em uma transação por lote."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="Arquivo .ndjson/.jsonl ou .csv")
+        parser.add_argument(
+            "--format",
+            choices=("ndjson", "csv"),
+            help="Formato do arquivo. Por padrão é inferido pela extensão.",
+        )
+        parser.add_argument(
+            "--owner",
+            help="Username do admin dono dos filmes. Padrão: o primeiro superuser.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--checkpoint",
+            help="Arquivo de checkpoint. Se existir, a importação é retomada dele.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File `{path}` not found.")
+
+        file_format = options["format"] or (
+            "csv" if path.suffix.lower() == ".csv" else "ndjson"
+        )
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("`--chunk-size` must be a positive integer.")
+
+        owner = self._get_owner(options["owner"])
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+        done = self._read_checkpoint(checkpoint, path)
+        if done:
+            self.stdout.write(f"Resuming `{path}` after {done} rows.")
+
+        self.genre_ids = dict(Genre.objects.values_list("name", "id"))
+        self.movie_fields = MovieSerializer().fields
+        self.critic_ids = {}
+
+        with path.open(newline="", encoding="utf-8") as source:
+            records = read_records(source, file_format, self._clean_csv_row)
+            records = islice(records, done, None)
+
+            started = time.perf_counter()
+            imported_movies = imported_reviews = 0
+            while chunk := list(islice(records, chunk_size)):
+                movies, reviews = self._import_chunk(chunk, owner)
+                done += len(chunk)
+                imported_movies += movies
+                imported_reviews += reviews
+                self._write_checkpoint(checkpoint, path, done)
+                bump_version("movies")
+
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{done} rows committed "
+                    + f"({imported_movies / elapsed:.0f} movies/s, "
+                    + f"{imported_reviews / elapsed:.0f} reviews/s)"
+                )
+
+        elapsed = time.perf_counter() - started
+        rate = (imported_movies + imported_reviews) / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported_movies} movies and {imported_reviews} reviews "
+                + f"in {elapsed:.2f}s ({rate:.0f} rows/s)."
+            )
+        )
+
+    def _get_owner(self, username: str | None) -> User:
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f"User `{username}` not found.")
+
+        owner = User.objects.filter(is_superuser=True).order_by("username").first()
+        if owner is None:
+            raise CommandError("No superuser found. Use `--owner` or create_admin.")
+
+        return owner
+
+    @staticmethod
+    def _clean_csv_row(row: dict) -> dict:
+        row["genres"] = [name.strip() for name in (row.get("genres") or "").split("|")]
+        return row
+
+    @transaction.atomic
+    def _import_chunk(
+        self, chunk: list[tuple[int, dict]], owner: User
+    ) -> tuple[int, int]:
+        movies, movie_genres, reviews_data = [], [], []
+
+        for line, record in chunk:
+            movie = self._build_movie(line, record, owner)
+            movies.append(movie)
+            movie_genres.append((movie, self._genre_names(record)))
+            reviews_data.extend(
+                (line, movie, review) for review in record.get("reviews") or []
+            )
+
+        self._resolve_genres({name for _, names in movie_genres for name in names})
+        self._resolve_critics(
+            {str(review.get("critic")) for _, _, review in reviews_data}
+        )
+
+        reviews = [
+            self._build_review(line, movie, review_data)
+            for line, movie, review_data in reviews_data
+        ]
+        # Os filmes ainda não existem no banco, então os agregados de reviews
+        # já são calculados em memória e gravados junto no bulk_create
+        for review in reviews:
+            review.movie.count_review(review.stars, review.spoilers)
+
+        Movie.objects.bulk_create(movies)
+        for movie in movies:
+            movie_id_filter.add(movie.pk)
+
+        through_model = Movie.genres.through
+        through_model.objects.bulk_create(
+            [
+                through_model(movie_id=movie.pk, genre_id=self.genre_ids[name])
+                for movie, names in movie_genres
+                for name in names
+            ]
+        )
+        Review.objects.bulk_create(reviews)
+        CriticStats.objects.record_reviews(reviews)
+
+        return len(movies), len(reviews)
+
+    def _build_movie(self, line: int, record: dict, owner: User) -> Movie:
+        """
+        Valida o registro com os mesmos campos do `MovieSerializer` da API:
+        datas e durações impossíveis, NaN ou orçamentos acima de `max_digits`
+        viram erro da linha, não exceções ou filmes ilegíveis no banco
+        """
+        if not isinstance(record, dict):
+            raise CommandError(f"Line {line}: expected a JSON object.")
+
+        values, errors = {}, []
+        for name in ("title", "duration", "premiere", "budget"):
+            try:
+                values[name] = self.movie_fields[name].run_validation(
+                    record.get(name, empty)
+                )
+            except serializers.ValidationError as err:
+                errors.append(f"`{name}` {' '.join(err.detail)}")
+            except (ValueError, OverflowError):
+                errors.append(f"`{name}` has an invalid value.")
+
+        reviews = record.get("reviews") or []
+        if not isinstance(reviews, list) or not all(
+            isinstance(review, dict) for review in reviews
+        ):
+            errors.append("`reviews` must be a list of objects.")
+
+        if errors:
+            raise CommandError(f"Line {line}: {'; '.join(errors)}")
+
+        return Movie(
+            **values,
+            overview=record.get("overview") or None,
+            user=owner,
+        )
+
+    def _build_review(self, line: int, movie: Movie, review_data: dict) -> Review:
+        stars = review_data.get("stars")
+        if not isinstance(stars, int) or not 1 <= stars <= 5:
+            raise CommandError(f"Line {line}: review `stars` must be between 1 and 5.")
+
+        return Review(
+            stars=stars,
+            review=review_data.get("review") or "",
+            spoilers=bool(review_data.get("spoilers", False)),
+            movie=movie,
+            critic_id=self.critic_ids[str(review_data.get("critic"))],
+        )
+
+    @staticmethod
+    def _genre_names(record: dict) -> list[str]:
+        names = [
+            genre["name"] if isinstance(genre, dict) else genre
+            for genre in record.get("genres") or []
+        ]
+        return list(dict.fromkeys(name for name in names if name))
+
+    def _resolve_genres(self, names: set[str]) -> None:
+        missing = [name for name in names if name not in self.genre_ids]
+        if not missing:
+            return
+
+        Genre.objects.bulk_create(
+            [Genre(name=name) for name in missing], ignore_conflicts=True
+        )
+        self.genre_ids.update(
+            Genre.objects.filter(name__in=missing).values_list("name", "id")
+        )
+
+    def _resolve_critics(self, usernames: set[str]) -> None:
+        missing = [name for name in usernames if name not in self.critic_ids]
+        if not missing:
+            return
+
+        self.critic_ids.update(
+            User.objects.filter(username__in=missing).values_list("username", "id")
+        )
+        unknown = [name for name in missing if name not in self.critic_ids]
+        if unknown:
+            raise CommandError(f"Unknown critics: {', '.join(sorted(unknown))}.")
+
+    @staticmethod
+    def _read_checkpoint(checkpoint: Path | None, path: Path) -> int:
+        if checkpoint is None or not checkpoint.exists():
+            return 0
+
+        data = json.loads(checkpoint.read_text())
+        if data.get("source") != str(path.resolve()):
+            raise CommandError(f"Checkpoint `{checkpoint}` belongs to another file.")
+
+        return int(data["rows"])
+
+    @staticmethod
+    def _write_checkpoint(checkpoint: Path | None, path: Path, rows: int) -> None:
+        if checkpoint is None:
+            return
+
+        # Escreve num arquivo temporário e troca atomicamente, para que uma
+        # interrupção nunca deixe um checkpoint pela metade
+        tmp = checkpoint.with_suffix(checkpoint.suffix + ".tmp")
+        tmp.write_text(json.dumps({"source": str(path.resolve()), "rows": rows}))
+        os.replace(tmp, checkpoint)
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from _core.cache import bump_version
+from movies.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Reconstrói o índice FTS5 de busca por título e sinopse dos filmes."
+
+    def handle(self, *args, **options) -> None:
+        if connection.vendor != "sqlite":
+            raise CommandError("The movie search index is only available on SQLite.")
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            rebuild_search_index()
+            bump_version("movies")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Movie search index rebuilt in {elapsed:.2f}s.")
+        )
@@ -0,0 +1,323 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from _core.cache import bump_version
+from genres.models import Genre
+from movies.id_filter import movie_id_filter
+from movies.models import Movie
+from reviews.models import Review
+
+User = get_user_model()
+
+GENRES = [
+    "Action",
+    "Animation",
+    "Comedy",
+    "Crime",
+    "Documentary",
+    "Drama",
+    "Fantasy",
+    "Horror",
+    "Romance",
+    "Science Fiction",
+    "Thriller",
+    "Western",
+]
+WORDS = (
+    "night star river city ghost king queen road shadow storm heart fire "
+    "winter summer dream silent last lost secret golden dark wild broken "
+    "iron glass blue red garden ocean empire journey return edge"
+).split()
+FIRST_NAMES = "Ana Bruno Carla Diego Elisa Felipe Gabriela Heitor Iara João".split()
+LAST_NAMES = "Almeida Barbosa Costa Duarte Esteves Ferreira Gomes Lima Rocha".split()
+REVIEWS = [
+    "Uma obra-prima do gênero.",
+    "Bom, mas longo demais.",
+    "Roteiro fraco, elenco excelente.",
+    "Vale pela fotografia.",
+    "Não recomendo.",
+    "Assistiria de novo.",
+]
+# Distribuição das estrelas: reviews reais tendem às notas altas
+STARS_WEIGHTS = list(accumulate([5, 10, 20, 35, 30]))
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera um catálogo sintético (usuários, filmes, gêneros e reviews) para "
+        "testes de carga, em lotes com bulk_create e sementes determinísticas."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--movies", type=int, default=1000)
+        parser.add_argument("--reviews", type=int, default=10000)
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Semente dos dados. A mesma semente gera os mesmos dados.",
+        )
+        parser.add_argument(
+            "--critic-ratio",
+            type=float,
+            default=0.2,
+            help="Fração dos usuários gerados que são críticos.",
+        )
+        parser.add_argument(
+            "--password",
+            default="1313",
+            help="Senha de todos os usuários gerados, hasheada uma única vez.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=10000)
+
+    def handle(self, *args, **options) -> None:
+        for option in ("movies", "reviews", "users"):
+            if options[option] < 0:
+                raise CommandError(f"`--{option}` must not be negative.")
+        if options["chunk_size"] < 1:
+            raise CommandError("`--chunk-size` must be a positive integer.")
+        if not 0 <= options["critic_ratio"] <= 1:
+            raise CommandError("`--critic-ratio` must be between 0 and 1.")
+        if options["reviews"] and not options["movies"]:
+            raise CommandError("`--reviews` requires `--movies`.")
+
+        self.rng = random.Random(options["seed"])
+        self.seed = options["seed"]
+        self.chunk_size = options["chunk_size"]
+        self.prefix = f"seed{options['seed']}_"
+        if (
+            options["users"]
+            and User.objects.filter(username__startswith=self.prefix).exists()
+        ):
+            raise CommandError(
+                f"Users from seed {options['seed']} already exist. "
+                + "Use another `--seed`."
+            )
+
+        self.started = time.perf_counter()
+        self.rows = 0
+
+        owner, critic_ids = self._seed_users(
+            options["users"], options["critic_ratio"], options["password"]
+        )
+        if options["movies"]:
+            owner = owner or self._get_owner()
+        if options["reviews"] and not critic_ids:
+            critic_ids = list(
+                User.objects.filter(is_critic=True).values_list("id", flat=True)
+            )
+            if not critic_ids:
+                raise CommandError("No critic found. Use `--users` to create some.")
+
+        genre_ids = self._seed_genres()
+        self._seed_movies(
+            options["movies"], options["reviews"], owner, critic_ids, genre_ids
+        )
+
+        if options["reviews"]:
+            # Um único GROUP BY sobre reviews no lugar de um UPDATE por crítico
+            call_command("rebuild_critic_stats", stdout=self.stdout)
+
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {options['users']} users, {options['movies']} movies and "
+                + f"{options['reviews']} reviews in {elapsed:.2f}s "
+                + f"({self.rows / elapsed:.0f} rows/s)."
+            )
+        )
+
+    def _uuids(self, quantity: int) -> list[uuid.UUID]:
+        bits = self.rng.getrandbits
+        return [uuid.UUID(int=bits(128), version=4) for _ in range(quantity)]
+
+    def _report(self, label: str, done: int, total: int) -> None:
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(
+            f"{done}/{total} {label} committed ({self.rows / elapsed:.0f} rows/s)"
+        )
+
+    def _get_owner(self) -> User:
+        owner = User.objects.filter(is_superuser=True).order_by("username").first()
+        if owner is None:
+            raise CommandError("No superuser found. Use `--users` or create_admin.")
+
+        return owner
+
+    def _seed_users(
+        self, quantity: int, critic_ratio: float, password: str
+    ) -> tuple[User | None, list[uuid.UUID]]:
+        """
+        Gera os usuários com uma única senha já hasheada. O primeiro é um
+        superuser (`<prefixo>admin`), dono dos filmes gerados.
+        """
+        # Um PBKDF2 por usuário levaria horas para 100k usuários
+        password = make_password(password)
+        owner, critic_ids = None, []
+
+        for start in range(0, quantity, self.chunk_size):
+            size = min(self.chunk_size, quantity - start)
+            ids = self._uuids(size)
+            first_names = self.rng.choices(FIRST_NAMES, k=size)
+            last_names = self.rng.choices(LAST_NAMES, k=size)
+            critics = [self.rng.random() < critic_ratio for _ in range(size)]
+
+            users = []
+            for index, pk, first_name, last_name, is_critic in zip(
+                range(start, start + size), ids, first_names, last_names, critics
+            ):
+                username = f"{self.prefix}user{index}"
+                users.append(
+                    User(
+                        id=pk,
+                        username=username,
+                        email=f"{username}@seed.kenziebuster.com",
+                        first_name=first_name,
+                        last_name=last_name,
+                        password=password,
+                        is_critic=is_critic,
+                    )
+                )
+                if is_critic:
+                    critic_ids.append(pk)
+
+            if start == 0:
+                owner = users[0]
+                owner.username = f"{self.prefix}admin"
+                owner.email = f"{owner.username}@seed.kenziebuster.com"
+                owner.is_superuser = owner.is_staff = True
+
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+            self.rows += size
+            self._report("users", start + size, quantity)
+
+        return owner, critic_ids
+
+    def _seed_genres(self) -> dict[str, uuid.UUID]:
+        Genre.objects.bulk_create(
+            [Genre(name=name) for name in GENRES], ignore_conflicts=True
+        )
+
+        return dict(Genre.objects.filter(name__in=GENRES).values_list("name", "id"))
+
+    def _seed_movies(
+        self,
+        quantity: int,
+        reviews_total: int,
+        owner: User | None,
+        critic_ids: list[uuid.UUID],
+        genre_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """
+        Gera os filmes em lotes e, junto de cada lote, a sua parte das
+        reviews. Os agregados de reviews são calculados em memória antes do
+        bulk_create, como no `import_catalog`.
+        """
+        reviews_done = 0
+        for start in range(0, quantity, self.chunk_size):
+            size = min(self.chunk_size, quantity - start)
+            movies = self._build_movies(size, owner)
+            # Reviews proporcionais ao tamanho do lote, somando `reviews_total`
+            end_reviews = reviews_total * (start + size) // quantity
+            reviews = self._build_reviews(
+                movies, end_reviews - reviews_done, critic_ids
+            )
+            reviews_done = end_reviews
+
+            names = list(genre_ids)
+            through_model = Movie.genres.through
+            movie_genres = [
+                through_model(movie_id=movie.pk, genre_id=genre_ids[name])
+                for movie in movies
+                for name in self.rng.sample(names, self.rng.randint(1, 3))
+            ]
+
+            # A mesma semente com os mesmos parâmetros gera os mesmos ids
+            if Movie.objects.filter(pk__in=[movie.pk for movie in movies]).exists():
+                raise CommandError(
+                    f"Movies from seed {self.seed} already exist. "
+                    + "Use another `--seed`."
+                )
+
+            with transaction.atomic():
+                Movie.objects.bulk_create(movies)
+                through_model.objects.bulk_create(movie_genres)
+                Review.objects.bulk_create(reviews)
+                bump_version("movies")
+
+            for movie in movies:
+                movie_id_filter.add(movie.pk)
+
+            self.rows += len(movies) + len(movie_genres) + len(reviews)
+            self._report("movies", start + size, quantity)
+
+    def _build_movies(self, size: int, owner: User) -> list[Movie]:
+        rng = self.rng
+        ids = self._uuids(size)
+        titles = rng.choices(WORDS, k=3 * size)
+        overviews = rng.choices(WORDS, k=12 * size)
+        durations = [rng.randint(75, 200) for _ in range(size)]
+        premieres = [rng.randint(0, 75 * 365) for _ in range(size)]
+        budgets = [rng.randrange(100_000, 300_000_000, 1000) for _ in range(size)]
+
+        return [
+            Movie(
+                id=ids[index],
+                title=" ".join(titles[3 * index : 3 * index + 3]).title(),
+                duration=timedelta(minutes=durations[index]),
+                premiere=date(1950, 1, 1) + timedelta(days=premieres[index]),
+                budget=Decimal(budgets[index]),
+                overview=" ".join(overviews[12 * index : 12 * index + 12]) + ".",
+                user=owner,
+            )
+            for index in range(size)
+        ]
+
+    def _build_reviews(
+        self, movies: list[Movie], quantity: int, critic_ids: list[uuid.UUID]
+    ) -> list[Review]:
+        """
+        Sorteia as reviews do lote com popularidade de cauda longa: poucos
+        filmes concentram boa parte das reviews, como em produção
+        """
+        if not quantity:
+            return []
+
+        rng = self.rng
+        popularity = list(accumulate(rng.paretovariate(1.2) for _ in movies))
+        targets = rng.choices(movies, cum_weights=popularity, k=quantity)
+        critics = rng.choices(critic_ids, k=quantity)
+        stars = rng.choices(range(1, 6), cum_weights=STARS_WEIGHTS, k=quantity)
+        texts = rng.choices(REVIEWS, k=quantity)
+        ids = self._uuids(quantity)
+
+        reviews = []
+        for pk, movie, critic_id, review_stars, text in zip(
+            ids, targets, critics, stars, texts
+        ):
+            spoilers = rng.random() < 0.1
+            movie.count_review(review_stars, spoilers)
+            reviews.append(
+                Review(
+                    id=pk,
+                    stars=review_stars,
+                    review=text,
+                    spoilers=spoilers,
+                    movie=movie,
+                    critic_id=critic_id,
+                )
+            )
+
+        return reviews
@@ -0,0 +1,54 @@
+# Generated by Django 4.1 on 2026-10-17 15:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("genres", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Movie",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("title", models.CharField(max_length=127)),
+                ("duration", models.DurationField()),
+                ("premiere", models.DateField()),
+                ("budget", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("overview", models.TextField(blank=True, default=None, null=True)),
+                (
+                    "genres",
+                    models.ManyToManyField(related_name="movies", to="genres.genre"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="movies",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["premiere", "id"], name="movie_premiere_id_idx"),
+        ),
+    ]
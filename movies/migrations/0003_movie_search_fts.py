@@ -0,0 +1,63 @@
+from django.db import migrations
+
+# Índice FTS5 com conteúdo externo: guarda só os tokens e aponta para o
+# rowid de movies_movie. Os triggers cobrem também bulk_create e updates
+# em massa, que não disparam signals.
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE movies_movie_fts USING fts5(
+        title, overview, content='movies_movie', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_ai AFTER INSERT ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(rowid, title, overview)
+        VALUES (new.rowid, new.title, new.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_ad AFTER DELETE ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(movies_movie_fts, rowid, title, overview)
+        VALUES ('delete', old.rowid, old.title, old.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_au AFTER UPDATE OF title, overview
+    ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(movies_movie_fts, rowid, title, overview)
+        VALUES ('delete', old.rowid, old.title, old.overview);
+        INSERT INTO movies_movie_fts(rowid, title, overview)
+        VALUES (new.rowid, new.title, new.overview);
+    END
+    """,
+    "INSERT INTO movies_movie_fts(movies_movie_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS movies_movie_fts_au",
+    "DROP TRIGGER IF EXISTS movies_movie_fts_ad",
+    "DROP TRIGGER IF EXISTS movies_movie_fts_ai",
+    "DROP TABLE IF EXISTS movies_movie_fts",
+]
+
+
+def run_on_sqlite(statements: list[str]):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0002_movie_review_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_sqlite(CREATE_SQL), run_on_sqlite(DROP_SQL)),
+    ]
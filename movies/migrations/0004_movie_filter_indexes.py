@@ -0,0 +1,25 @@
+# Generated by Django 4.1 on 2026-10-17 15:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0003_movie_search_fts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["budget", "premiere"], name="movie_budget_premiere_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["duration", "premiere"], name="movie_duration_premiere_idx"
+            ),
+        ),
+    ]
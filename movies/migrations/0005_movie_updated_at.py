@@ -0,0 +1,36 @@
+# Generated by Django 4.1 on 2026-10-17 15:38
+
+from importlib import import_module
+
+from django.db import migrations, models
+
+# O SQLite recria movies_movie ao adicionar colunas, o que apaga os triggers
+# do índice de busca. Reaproveita o SQL congelado da 0003: recria os
+# triggers (CREATE_SQL sem a tabela) e reindexa no fim.
+search_fts = import_module("movies.migrations.0003_movie_search_fts")
+reinstall_search_triggers = search_fts.run_on_sqlite(
+    search_fts.DROP_SQL[:3] + search_fts.CREATE_SQL[1:]
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0004_movie_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search_triggers),
+        migrations.AddField(
+            model_name="movie",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["updated_at", "id"], name="movie_updated_at_id_idx"
+            ),
+        ),
+        migrations.RunPython(reinstall_search_triggers, migrations.RunPython.noop),
+    ]
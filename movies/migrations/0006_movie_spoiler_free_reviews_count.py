@@ -0,0 +1,50 @@
+# Generated by Django 4.1 on 2026-10-17 15:46
+
+from importlib import import_module
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Mesma recriação dos triggers de busca da 0005
+search_fts = import_module("movies.migrations.0003_movie_search_fts")
+reinstall_search_triggers = search_fts.run_on_sqlite(
+    search_fts.DROP_SQL[:3] + search_fts.CREATE_SQL[1:]
+)
+
+
+def backfill_spoiler_free_reviews_count(apps, schema_editor) -> None:
+    Movie = apps.get_model("movies", "Movie")
+    Review = apps.get_model("reviews", "Review")
+
+    spoiler_free = (
+        Review.objects.filter(movie=OuterRef("pk"), spoilers=False)
+        .order_by()
+        .values("movie")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Movie.objects.filter(reviews_count__gt=0).update(
+        spoiler_free_reviews_count=Coalesce(Subquery(spoiler_free), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0005_movie_updated_at"),
+        ("reviews", "0002_review_created_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search_triggers),
+        migrations.AddField(
+            model_name="movie",
+            name="spoiler_free_reviews_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(reinstall_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(
+            backfill_spoiler_free_reviews_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1 on 2026-10-17 15:55
+
+from importlib import import_module
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+# Mesma recriação dos triggers de busca da 0005
+search_fts = import_module("movies.migrations.0003_movie_search_fts")
+reinstall_search_triggers = search_fts.run_on_sqlite(
+    search_fts.DROP_SQL[:3] + search_fts.CREATE_SQL[1:]
+)
+
+
+def backfill_bayesian_score(apps, schema_editor) -> None:
+    """
+    Média bayesiana como era nesta migration, congelada aqui para não mudar
+    se `movies.models.bayesian_average` mudar depois
+    """
+    Movie = apps.get_model("movies", "Movie")
+    config = {"PRIOR_MEAN": 3.0, "PRIOR_WEIGHT": 10, **settings.MOVIE_RANKING}
+
+    Movie.objects.filter(reviews_count__gt=0).update(
+        bayesian_score=(
+            Cast(F("stars_sum"), FloatField())
+            + config["PRIOR_MEAN"] * config["PRIOR_WEIGHT"]
+        )
+        / (F("reviews_count") + config["PRIOR_WEIGHT"])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0006_movie_spoiler_free_reviews_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search_triggers),
+        migrations.AddField(
+            model_name="movie",
+            name="bayesian_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["-bayesian_score", "id"], name="movie_bayesian_score_idx"
+            ),
+        ),
+        migrations.RunPython(reinstall_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(backfill_bayesian_score, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,130 @@
+import uuid
+from collections import Counter, defaultdict
+from typing import Iterable
+
+from django.conf import settings
 from django.db import models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, Now
+
+STARS_HISTOGRAM_FIELDS = ("stars_1", "stars_2", "stars_3", "stars_4", "stars_5")
+
+
+def bayesian_average(stars_sum, reviews_count):
+    """
+    Média bayesiana das estrelas: a média do filme puxada para `PRIOR_MEAN`
+    com o peso de `PRIOR_WEIGHT` reviews, para que poucas reviews não
+    coloquem um filme no topo. Aceita números ou expressões do ORM.
+    """
+    config = settings.MOVIE_RANKING
+
+    return (stars_sum + config["PRIOR_MEAN"] * config["PRIOR_WEIGHT"]) / (
+        reviews_count + config["PRIOR_WEIGHT"]
+    )
+
+
+class MovieQuerySet(models.QuerySet):
+    def record_reviews(self, reviews: Iterable) -> None:
+        """
+        Incrementa os agregados de reviews dos filmes com um único UPDATE
+        por filme, usando F() para não depender do valor lido em memória.
+        Deve rodar na mesma transação que grava as reviews.
+        """
+        deltas = defaultdict(Counter)
+        for review in reviews:
+            delta = deltas[review.movie_id]
+            delta["reviews_count"] += 1
+            delta["stars_sum"] += review.stars
+            delta[f"stars_{review.stars}"] += 1
+            delta["spoiler_free_reviews_count"] += not review.spoilers
+
+        for movie_id, delta in deltas.items():
+            # No UPDATE, o lado direito enxerga os valores antigos da linha
+            score = bayesian_average(
+                Cast(F("stars_sum") + delta["stars_sum"], FloatField()),
+                F("reviews_count") + delta["reviews_count"],
+            )
+            self.filter(pk=movie_id).update(
+                updated_at=Now(),
+                bayesian_score=score,
+                **{field: F(field) + value for field, value in delta.items()},
+            )
 
 
 class Movie(models.Model):
-    ...
+    """
+    Classe modelo de filmes
+    """
+
+    id = models.UUIDField(default=uuid.uuid4, primary_key=True, editable=False)
+    title = models.CharField(max_length=127)
+    duration = models.DurationField()
+    premiere = models.DateField()
+    budget = models.DecimalField(max_digits=12, decimal_places=2)
+    overview = models.TextField(null=True, blank=True, default=None)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Agregados das reviews, mantidos incrementalmente a cada review gravada
+    # e reconstruídos pelo comando `rebuild_review_stats`
+    reviews_count = models.PositiveIntegerField(default=0)
+    stars_sum = models.PositiveIntegerField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+    # Total de reviews sem spoilers: dá o `count` da listagem `?spoilers=false`
+    # sem precisar de COUNT
+    spoiler_free_reviews_count = models.PositiveIntegerField(default=0)
+    # Nota do ranking `/movies/top/`; só é significativa com reviews_count > 0
+    bayesian_score = models.FloatField(default=0)
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="movies",
+    )
+    genres = models.ManyToManyField("genres.Genre", related_name="movies")
+
+    objects = MovieQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["premiere", "id"], name="movie_premiere_id_idx"),
+            models.Index(
+                fields=["budget", "premiere"], name="movie_budget_premiere_idx"
+            ),
+            models.Index(
+                fields=["duration", "premiere"], name="movie_duration_premiere_idx"
+            ),
+            models.Index(fields=["updated_at", "id"], name="movie_updated_at_id_idx"),
+            models.Index(
+                fields=["-bayesian_score", "id"], name="movie_bayesian_score_idx"
+            ),
+        ]
+
+    @property
+    def average_stars(self) -> float | None:
+        if not self.reviews_count:
+            return None
+
+        return round(self.stars_sum / self.reviews_count, 2)
+
+    @property
+    def stars_histogram(self) -> dict[str, int]:
+        return {
+            field.removeprefix("stars_"): getattr(self, field)
+            for field in STARS_HISTOGRAM_FIELDS
+        }
+
+    def count_review(self, stars: int, spoilers: bool = False) -> None:
+        """
+        Versão em memória de `record_reviews`, para filmes ainda não salvos
+        """
+        self.reviews_count += 1
+        self.stars_sum += stars
+        field = f"stars_{stars}"
+        setattr(self, field, getattr(self, field) + 1)
+        self.spoiler_free_reviews_count += not spoilers
+        self.bayesian_score = bayesian_average(self.stars_sum, self.reviews_count)
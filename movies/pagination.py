@@ -0,0 +1,10 @@
+from _core.pagination import KeysetPagination
+
+
+class MovieCursorPagination(KeysetPagination):
+    """
+    Modo cursor da listagem de filmes (`?cursor=`), ordenado pelo índice
+    `movie_premiere_id_idx`
+    """
+
+    ordering = ("premiere", "id")
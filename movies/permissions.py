@@ -0,0 +1,23 @@
+from rest_framework import permissions
+from rest_framework.views import Request, View
+
+
+class IsAdminOrReadOnly(permissions.BasePermission):
+    """
+    Leitura liberada para todos, escrita apenas para administradores
+    """
+
+    def has_permission(self, request: Request, view: View) -> bool:
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
+        return bool(request.user.is_authenticated and request.user.is_superuser)
+
+
+class IsAdmin(permissions.BasePermission):
+    """
+    Acesso apenas para administradores
+    """
+
+    def has_permission(self, request: Request, view: View) -> bool:
+        return bool(request.user.is_authenticated and request.user.is_superuser)
@@ -0,0 +1,51 @@
+import re
+
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+FTS_TABLE = "movies_movie_fts"
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def build_match_query(term: str) -> str:
+    """
+    Converte o texto digitado numa query FTS5 segura: cada palavra vira um
+    token entre aspas com busca por prefixo (`"godf"*`), para atender o
+    autocomplete sem expor a sintaxe do FTS5 ao cliente.
+    """
+    return " ".join(f'"{token}"*' for token in TOKEN_PATTERN.findall(term))
+
+
+def search_movies(queryset: QuerySet, term: str) -> QuerySet:
+    """
+    Filtra `queryset` pelo termo buscado em título e sinopse, ordenando pelo
+    bm25 do índice FTS5. Fora do SQLite cai para `icontains`.
+    """
+    match = build_match_query(term)
+    if not match:
+        return queryset.none()
+
+    if connection.vendor != "sqlite":
+        return queryset.filter(Q(title__icontains=term) | Q(overview__icontains=term))
+
+    return queryset.extra(
+        tables=[FTS_TABLE],
+        where=[
+            f"{FTS_TABLE}.rowid = movies_movie.rowid",
+            f"{FTS_TABLE} MATCH %s",
+        ],
+        params=[match],
+        select={"search_rank": f"bm25({FTS_TABLE})"},
+        order_by=["search_rank", "id"],
+    )
+
+
+def rebuild_search_index() -> None:
+    """
+    Reconstrói o índice a partir de movies_movie. Necessário após um VACUUM,
+    que pode renumerar os rowids nos quais o índice se apoia.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
@@ -0,0 +1,80 @@
+from django.db import transaction
+from rest_framework import serializers
+
+from _core.sparse import SparseFieldsSerializerMixin
+from genres.models import Genre
+from genres.serializers import GenreSerializer
+
+from .models import STARS_HISTOGRAM_FIELDS, Movie
+
+
+class MovieSerializer(SparseFieldsSerializerMixin, serializers.Serializer):
+    sparse_prefetch = {"genres": "genres"}
+
+    id = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(max_length=127)
+    duration = serializers.DurationField()
+    premiere = serializers.DateField()
+    budget = serializers.DecimalField(max_digits=12, decimal_places=2)
+    overview = serializers.CharField(allow_null=True, default=None)
+    genres = GenreSerializer(many=True)
+
+    @transaction.atomic
+    def create(self, validated_data: dict) -> Movie:
+        genres_data = validated_data.pop("genres")
+        movie = Movie.objects.create(**validated_data)
+
+        genres = resolve_genres([genre_data["name"] for genre_data in genres_data])
+
+        through_model = Movie.genres.through
+        through_model.objects.bulk_create(
+            [through_model(movie_id=movie.pk, genre_id=genre.pk) for genre in genres]
+        )
+
+        return movie
+
+
+class MovieDetailSerializer(MovieSerializer):
+    """
+    Saída da listagem e do detalhe de filmes, com os agregados de reviews
+    lidos das colunas desnormalizadas de `Movie`
+    """
+
+    sparse_columns = {
+        "average_stars": ("reviews_count", "stars_sum"),
+        "stars_histogram": STARS_HISTOGRAM_FIELDS,
+    }
+
+    reviews_count = serializers.IntegerField(read_only=True)
+    average_stars = serializers.FloatField(read_only=True, allow_null=True)
+    stars_histogram = serializers.DictField(
+        child=serializers.IntegerField(), read_only=True
+    )
+    updated_at = serializers.DateTimeField(read_only=True)
+
+
+class MovieTopSerializer(MovieDetailSerializer):
+    bayesian_score = serializers.FloatField(read_only=True)
+
+
+def resolve_genres(names: list[str]) -> list[Genre]:
+    """
+    Resolve uma lista de nomes de gênero em um número fixo de queries:
+    um `IN` para os já existentes e um `bulk_create` só para os que faltam.
+    Retorna os gêneros na ordem dos nomes recebidos, sem repetições.
+    """
+    names = list(dict.fromkeys(names))
+    genres = {genre.name: genre for genre in Genre.objects.filter(name__in=names)}
+
+    missing = [name for name in names if name not in genres]
+    if missing:
+        # ignore_conflicts cobre a corrida com outro request criando o mesmo
+        # gênero; por isso os ids são relidos do banco em seguida
+        Genre.objects.bulk_create(
+            [Genre(name=name) for name in missing], ignore_conflicts=True
+        )
+        genres.update(
+            (genre.name, genre) for genre in Genre.objects.filter(name__in=missing)
+        )
+
+    return [genres[name] for name in names]
@@ -0,0 +1,24 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from _core.cache import bump_version
+
+from .id_filter import movie_id_filter
+from .models import Movie
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+@receiver(m2m_changed, sender=Movie.genres.through)
+def invalidate_movie_listing(**kwargs) -> None:
+    """
+    Invalida as listagens de filmes em cache. Escritas em lote (bulk_create,
+    update) não disparam signals e devem chamar `bump_version` diretamente.
+    """
+    bump_version("movies")
+
+
+@receiver(post_save, sender=Movie)
+def register_movie_id(instance: Movie, created: bool, **kwargs) -> None:
+    if created:
+        movie_id_filter.add(instance.pk)
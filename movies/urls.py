@@ -5,5 +5,9 @@ from reviews import views as review_views
 
 urlpatterns = [
     path("movies/", views.MovieView.as_view()),
+    path("movies/top/", views.MovieTopView.as_view()),
+    path("movies/export.ndjson", views.MovieExportView.as_view()),
+    path("movies/reviews/batch/", review_views.ReviewBatchView.as_view()),
+    path("movies/<uuid:movie_id>/", views.MovieDetailView.as_view()),
     path("movies/<uuid:movie_id>/reviews/", review_views.ReviewView.as_view()),
 ]
@@ -1,5 +1,155 @@
+from typing import Iterator
+
+from django.db.models import Exists, OuterRef, QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView, Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from _core.cache import VersionedCacheMixin
+from _core.pagination import CursorOptInMixin
+from _core.sparse import SparseFieldsViewMixin
+
+from users.authentication import ClaimsJWTAuthentication, get_request_user
+
+from .filters import filter_movies
+from .models import Movie
+from .pagination import MovieCursorPagination
+from .permissions import IsAdmin, IsAdminOrReadOnly
+from .search import search_movies
+from .serializers import MovieDetailSerializer, MovieSerializer, MovieTopSerializer
+
+
+class MovieView(
+    VersionedCacheMixin,
+    CursorOptInMixin,
+    SparseFieldsViewMixin,
+    generics.ListCreateAPIView,
+):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAdminOrReadOnly]
+    cursor_pagination_class = MovieCursorPagination
+    # colunas lidas pelo cursor mesmo quando fora de `?fields=`
+    sparse_always = ("premiere",)
+
+    queryset = Movie.objects.order_by("premiere", "id")
+
+    def get_cache_resources(self) -> list[str]:
+        return ["movies"]
+
+    def get_queryset(self) -> QuerySet:
+        queryset = filter_movies(super().get_queryset(), self.request.query_params)
+
+        term = self.request.query_params.get("search")
+        if term:
+            queryset = search_movies(queryset, term)
+
+        return self.filter_sparse_fields(queryset)
+
+    def get_serializer_class(self) -> type[MovieSerializer]:
+        if self.request.method == "POST":
+            return MovieSerializer
+
+        return MovieDetailSerializer
+
+    def perform_create(self, serializer: MovieSerializer) -> None:
+        serializer.save(user=get_request_user(self.request))
+
+
+class MovieDetailView(VersionedCacheMixin, generics.RetrieveAPIView):
+    queryset = Movie.objects.all()
+    serializer_class = MovieDetailSerializer
+    lookup_url_kwarg = "movie_id"
+
+    def get_cache_resources(self) -> list[str]:
+        return ["movies"]
+
+
+class MovieTopView(VersionedCacheMixin, generics.ListAPIView):
+    """
+    Ranking de filmes pela média bayesiana das estrelas, lida da coluna
+    `bayesian_score` (mantida a cada review) pelo índice
+    `movie_bayesian_score_idx`: nenhuma agregação sobre reviews
+    """
+
+    serializer_class = MovieTopSerializer
+    pagination_class = None
+
+    default_limit = 10
+    max_limit = 100
+
+    def get_cache_resources(self) -> list[str]:
+        return ["movies"]
+
+    def get_limit(self) -> int:
+        try:
+            limit = int(self.request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            limit = 0
+
+        if not 1 <= limit <= self.max_limit:
+            raise ValidationError(
+                {"limit": [f"Ensure this value is between 1 and {self.max_limit}."]}
+            )
+
+        return limit
+
+    def get_queryset(self) -> QuerySet:
+        queryset = Movie.objects.filter(reviews_count__gt=0).order_by(
+            "-bayesian_score", "id"
+        )
+
+        genre = self.request.query_params.get("genre")
+        if genre:
+            # EXISTS correlacionado em vez de JOIN: o SQLite segue o índice da
+            # nota, testa o gênero de cada filme e para ao atingir o limite
+            in_genre = Movie.genres.through.objects.filter(
+                movie_id=OuterRef("pk"), genre__name=genre
+            )
+            queryset = queryset.filter(Exists(in_genre))
+
+        return queryset.prefetch_related("genres")[: self.get_limit()]
+
+
+class MovieExportView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+
+    chunk_size = 2000
+
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """
+        Exportação do catálogo completo em NDJSON, um filme por linha.
+
+        Os filmes são lidos em blocos com `iterator(chunk_size=...)`, que
+        também faz o prefetch dos gêneros uma vez por bloco, então a memória
+        não cresce com o tamanho do catálogo. `?since=` exporta apenas os
+        filmes alterados depois do instante informado.
+        """
+        movies = Movie.objects.order_by("updated_at", "id").prefetch_related("genres")
+
+        since = request.query_params.get("since")
+        if since:
+            try:
+                since_datetime = parse_datetime(since)
+            except ValueError:
+                # bem formado, mas impossível (2020-13-01T00:00:00)
+                since_datetime = None
+            if since_datetime is None:
+                raise ValidationError({"since": ["Enter a valid date/time."]})
+            if timezone.is_naive(since_datetime):
+                since_datetime = timezone.make_aware(since_datetime)
+            movies = movies.filter(updated_at__gt=since_datetime)
 
+        return StreamingHttpResponse(
+            self._stream(movies), content_type="application/x-ndjson"
+        )
 
-class MovieView(generics.ListCreateAPIView):
-    ...
+    def _stream(self, movies: QuerySet) -> Iterator[str]:
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for movie in movies.iterator(chunk_size=self.chunk_size):
+            yield encoder.encode(MovieDetailSerializer(movie).data) + "\n"
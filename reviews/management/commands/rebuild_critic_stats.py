@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from movies.models import STARS_HISTOGRAM_FIELDS
+from reviews.models import CriticStats, Review
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstrói a tabela de estatísticas dos críticos (ranking e "
+        "`/users/<id>/reviews/stats/`) a partir da tabela de reviews."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    @transaction.atomic
+    def handle(self, *args, **options) -> None:
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("`--batch-size` must be a positive integer.")
+
+        CriticStats.objects.all().delete()
+
+        # Um único GROUP BY sobre reviews, lido em stream e gravado em lotes
+        aggregates = (
+            Review.objects.order_by()
+            .values("critic_id")
+            .annotate(
+                reviews_count=Count("id"),
+                stars_sum=Sum("stars"),
+                **{
+                    field: Count("id", filter=Q(stars=int(field[-1])))
+                    for field in STARS_HISTOGRAM_FIELDS
+                },
+            )
+        )
+
+        batch, rebuilt = [], 0
+        for row in aggregates.iterator(chunk_size=batch_size):
+            average_stars = row["stars_sum"] / row["reviews_count"]
+            batch.append(CriticStats(average_stars=average_stars, **row))
+            if len(batch) == batch_size:
+                rebuilt += self._flush(batch)
+
+        rebuilt += self._flush(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Review stats rebuilt for {rebuilt} critics.")
+        )
+
+    @staticmethod
+    def _flush(batch: list[CriticStats]) -> int:
+        CriticStats.objects.bulk_create(batch)
+        flushed = len(batch)
+        batch.clear()
+
+        return flushed
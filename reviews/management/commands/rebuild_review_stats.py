@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from _core.cache import bump_version
+from movies.models import STARS_HISTOGRAM_FIELDS, Movie, bayesian_average
+from reviews.models import Review
+
+STATS_FIELDS = (
+    "reviews_count",
+    "stars_sum",
+    "spoiler_free_reviews_count",
+    "bayesian_score",
+    *STARS_HISTOGRAM_FIELDS,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstrói os agregados de reviews (contagem, soma de estrelas, "
+        "reviews sem spoilers, histograma e nota do ranking) de todos os "
+        "filmes a partir da tabela de reviews."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    @transaction.atomic
+    def handle(self, *args, **options) -> None:
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("`--batch-size` must be a positive integer.")
+
+        Movie.objects.update(**{field: 0 for field in STATS_FIELDS})
+
+        # Um único GROUP BY sobre reviews, lido em stream e gravado em lotes
+        aggregates = (
+            Review.objects.order_by()
+            .values("movie_id")
+            .annotate(
+                reviews_count=Count("id"),
+                stars_sum=Sum("stars"),
+                spoiler_free_reviews_count=Count("id", filter=Q(spoilers=False)),
+                **{
+                    field: Count("id", filter=Q(stars=int(field[-1])))
+                    for field in STARS_HISTOGRAM_FIELDS
+                },
+            )
+        )
+
+        batch, rebuilt = [], 0
+        for row in aggregates.iterator(chunk_size=batch_size):
+            score = bayesian_average(row["stars_sum"], row["reviews_count"])
+            batch.append(Movie(id=row.pop("movie_id"), bayesian_score=score, **row))
+            if len(batch) == batch_size:
+                rebuilt += self._flush(batch, batch_size)
+
+        rebuilt += self._flush(batch, batch_size)
+        bump_version("movies")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Review stats rebuilt for {rebuilt} movies.")
+        )
+
+    @staticmethod
+    def _flush(batch: list[Movie], batch_size: int) -> int:
+        Movie.objects.bulk_update(batch, STATS_FIELDS, batch_size=batch_size)
+        flushed = len(batch)
+        batch.clear()
+
+        return flushed
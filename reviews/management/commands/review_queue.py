@@ -0,0 +1,46 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from reviews.queue import ReviewQueue
+
+
+class Command(BaseCommand):
+    help = (
+        "Opera a fila write-behind de reviews: `stats` mostra profundidade e "
+        "latência de flush, `drain` grava toda a fila no banco e `replay` "
+        "grava as reviews de outro journal (por exemplo, copiado de outro "
+        "servidor)."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("action", choices=("stats", "drain", "replay"))
+        parser.add_argument("journal", nargs="?")
+        parser.add_argument("--batch-size", type=int)
+
+    def handle(self, *args, **options) -> None:
+        config = settings.REVIEW_WRITE_BEHIND
+        batch_size = options["batch_size"] or config["BATCH_SIZE"]
+        if batch_size < 1:
+            raise CommandError("`--batch-size` must be a positive integer.")
+
+        if options["action"] == "replay":
+            if not options["journal"]:
+                raise CommandError("`replay` requires the journal path.")
+            queue = ReviewQueue(options["journal"])
+        else:
+            queue = ReviewQueue(options["journal"] or config["JOURNAL"])
+
+        if options["action"] == "stats":
+            self.stdout.write(json.dumps(queue.stats()))
+            return
+
+        result = queue.drain(batch_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.items} queued reviews flushed, {result.inserted} inserted "
+                + f"in {result.latency_ms:.1f} ms."
+            )
+        )
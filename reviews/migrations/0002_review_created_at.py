@@ -0,0 +1,28 @@
+# Generated by Django 4.1 on 2026-10-17 15:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["movie", "created_at", "id"], name="review_movie_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1 on 2026-10-17 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0002_review_created_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                condition=models.Q(("spoilers", False)),
+                fields=["movie", "created_at", "id"],
+                name="review_spoiler_free_idx",
+            ),
+        ),
+    ]
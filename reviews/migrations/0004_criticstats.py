@@ -0,0 +1,80 @@
+# Generated by Django 4.1 on 2026-10-17 15:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q, Sum
+
+
+def backfill_critic_stats(apps, schema_editor) -> None:
+    Review = apps.get_model("reviews", "Review")
+    CriticStats = apps.get_model("reviews", "CriticStats")
+
+    aggregates = (
+        Review.objects.order_by()
+        .values("critic_id")
+        .annotate(
+            reviews_count=Count("id"),
+            stars_sum=Sum("stars"),
+            **{
+                f"stars_{stars}": Count("id", filter=Q(stars=stars))
+                for stars in range(1, 6)
+            },
+        )
+    )
+    CriticStats.objects.bulk_create(
+        [
+            CriticStats(average_stars=row["stars_sum"] / row["reviews_count"], **row)
+            for row in aggregates.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_alter_user_options"),
+        ("reviews", "0003_review_review_spoiler_free_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CriticStats",
+            fields=[
+                (
+                    "critic",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="review_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("reviews_count", models.PositiveIntegerField(default=0)),
+                ("stars_sum", models.PositiveIntegerField(default=0)),
+                ("average_stars", models.FloatField(default=0)),
+                ("stars_1", models.PositiveIntegerField(default=0)),
+                ("stars_2", models.PositiveIntegerField(default=0)),
+                ("stars_3", models.PositiveIntegerField(default=0)),
+                ("stars_4", models.PositiveIntegerField(default=0)),
+                ("stars_5", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="criticstats",
+            index=models.Index(
+                fields=["-reviews_count", "-average_stars", "critic"],
+                name="critic_stats_volume_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="criticstats",
+            index=models.Index(
+                fields=["-average_stars", "-reviews_count", "critic"],
+                name="critic_stats_average_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_critic_stats, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,130 @@
+import uuid
+from collections import Counter, defaultdict
+from typing import Iterable
+
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+from movies.models import STARS_HISTOGRAM_FIELDS
 
 
 class Review(models.Model):
-    ...
+    """
+    Classe modelo de críticas de filmes
+    """
+
+    id = models.UUIDField(default=uuid.uuid4, primary_key=True, editable=False)
+    stars = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)]
+    )
+    review = models.TextField()
+    spoilers = models.BooleanField(default=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    movie = models.ForeignKey(
+        "movies.Movie",
+        on_delete=models.CASCADE,
+        related_name="reviews",
+    )
+    critic = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="reviews",
+    )
+
+    class Meta:
+        indexes = [
+            # Listagem de reviews de um filme em ordem de criação: cobre o
+            # filtro por filme e a ordenação da paginação por cursor
+            models.Index(
+                fields=["movie", "created_at", "id"],
+                name="review_movie_created_id_idx",
+            ),
+            # Listagem `?spoilers=false`: índice parcial só com as reviews sem
+            # spoilers, na mesma ordem da paginação
+            models.Index(
+                fields=["movie", "created_at", "id"],
+                condition=models.Q(spoilers=False),
+                name="review_spoiler_free_idx",
+            ),
+        ]
+
+
+class CriticStatsQuerySet(models.QuerySet):
+    def record_reviews(self, reviews: Iterable[Review]) -> None:
+        """
+        Incrementa as estatísticas dos críticos das reviews: cria as linhas
+        que faltam com um único INSERT e faz um UPDATE com F() por crítico.
+        Deve rodar na mesma transação que grava as reviews.
+        """
+        deltas = defaultdict(Counter)
+        for review in reviews:
+            delta = deltas[review.critic_id]
+            delta["reviews_count"] += 1
+            delta["stars_sum"] += review.stars
+            delta[f"stars_{review.stars}"] += 1
+
+        if not deltas:
+            return
+
+        self.bulk_create(
+            [CriticStats(critic_id=critic_id) for critic_id in deltas],
+            ignore_conflicts=True,
+        )
+        for critic_id, delta in deltas.items():
+            # No UPDATE, o lado direito enxerga os valores antigos da linha
+            average_stars = Cast(F("stars_sum") + delta["stars_sum"], FloatField()) / (
+                F("reviews_count") + delta["reviews_count"]
+            )
+
+            self.filter(pk=critic_id).update(
+                average_stars=average_stars,
+                **{field: F(field) + value for field, value in delta.items()},
+            )
+
+
+class CriticStats(models.Model):
+    """
+    Estatísticas das reviews de cada crítico, mantidas incrementalmente a
+    cada review gravada e reconstruídas pelo comando `rebuild_critic_stats`
+    """
+
+    critic = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="review_stats",
+    )
+    reviews_count = models.PositiveIntegerField(default=0)
+    stars_sum = models.PositiveIntegerField(default=0)
+    average_stars = models.FloatField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+
+    objects = CriticStatsQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Um índice por ordenação do ranking: cada página é um range seek
+            models.Index(
+                fields=["-reviews_count", "-average_stars", "critic"],
+                name="critic_stats_volume_idx",
+            ),
+            models.Index(
+                fields=["-average_stars", "-reviews_count", "critic"],
+                name="critic_stats_average_idx",
+            ),
+        ]
+
+    @property
+    def stars_histogram(self) -> dict[str, int]:
+        return {
+            field.removeprefix("stars_"): getattr(self, field)
+            for field in STARS_HISTOGRAM_FIELDS
+        }
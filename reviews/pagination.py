@@ -0,0 +1,28 @@
+from _core.pagination import KeysetPagination
+
+
+class ReviewCursorPagination(KeysetPagination):
+    """
+    Modo cursor da listagem de reviews de um filme (`?cursor=`), ordenado
+    pelo índice `review_movie_created_id_idx`
+    """
+
+    ordering = ("created_at", "id")
+
+
+class CriticReviewsCountPagination(KeysetPagination):
+    """
+    Ranking de críticos por volume de reviews, pelo índice
+    `critic_stats_volume_idx`
+    """
+
+    ordering = ("-reviews_count", "-average_stars", "critic_id")
+
+
+class CriticAverageStarsPagination(KeysetPagination):
+    """
+    Ranking de críticos pela média de estrelas dadas, pelo índice
+    `critic_stats_average_idx`
+    """
+
+    ordering = ("-average_stars", "-reviews_count", "critic_id")
@@ -0,0 +1,17 @@
+from rest_framework import permissions
+from rest_framework.views import Request, View
+
+
+class IsCriticOrAdminOrReadOnly(permissions.BasePermission):
+    """
+    Leitura liberada para todos, escrita apenas para críticos e administradores
+    """
+
+    def has_permission(self, request: Request, view: View) -> bool:
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
+        return bool(
+            request.user.is_authenticated
+            and (request.user.is_critic or request.user.is_superuser)
+        )
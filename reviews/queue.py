@@ -0,0 +1,274 @@
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from _core.cache import bump_version
+from movies.models import Movie
+from users.models import User
+
+from .models import CriticStats, Review
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS queued_review (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL,
+        movie_id TEXT NOT NULL,
+        critic_id TEXT NOT NULL,
+        stars INTEGER NOT NULL,
+        review TEXT NOT NULL,
+        spoilers INTEGER NOT NULL,
+        enqueued_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS flush_log (
+        flushed_at REAL NOT NULL,
+        items INTEGER NOT NULL,
+        inserted INTEGER NOT NULL,
+        latency_ms REAL NOT NULL
+    )
+    """,
+]
+
+
+@dataclass
+class FlushResult:
+    items: int = 0
+    inserted: int = 0
+    latency_ms: float = 0.0
+
+
+class ReviewQueue:
+    """
+    Fila durável de reviews num journal SQLite separado do banco principal.
+
+    Cada `append` é um commit curto e com `synchronous=FULL` no journal, sem
+    disputar o lock de escrita do banco principal; o flusher depois grava as
+    reviews em lote no banco principal.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = str(path)
+        self._local = threading.local()
+
+        with self._connection() as connection:
+            for statement in JOURNAL_SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Conexões do sqlite3 não podem ser compartilhadas entre threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            self._local.connection = connection
+
+        return connection
+
+    def append(self, review: Review) -> None:
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO queued_review "
+                + "(id, movie_id, critic_id, stars, review, spoilers, enqueued_at) "
+                + "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(review.id),
+                    str(review.movie_id),
+                    str(review.critic_id),
+                    review.stars,
+                    review.review,
+                    int(review.spoilers),
+                    time.time(),
+                ),
+            )
+
+    def peek(self, limit: int) -> list[tuple[int, Review]]:
+        rows = self._connection().execute(
+            "SELECT seq, id, movie_id, critic_id, stars, review, spoilers "
+            + "FROM queued_review ORDER BY seq LIMIT ?",
+            (limit,),
+        )
+        return [
+            (
+                seq,
+                Review(
+                    id=uuid.UUID(review_id),
+                    movie_id=uuid.UUID(movie_id),
+                    critic_id=uuid.UUID(critic_id),
+                    stars=stars,
+                    review=text,
+                    spoilers=bool(spoilers),
+                ),
+            )
+            for seq, review_id, movie_id, critic_id, stars, text, spoilers in rows
+        ]
+
+    def ack(self, last_seq: int, result: FlushResult) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM queued_review WHERE seq <= ?", (last_seq,))
+            connection.execute(
+                "INSERT INTO flush_log VALUES (?, ?, ?, ?)",
+                (time.time(), result.items, result.inserted, result.latency_ms),
+            )
+            connection.execute(
+                "DELETE FROM flush_log WHERE rowid NOT IN "
+                + "(SELECT rowid FROM flush_log ORDER BY flushed_at DESC LIMIT 1000)"
+            )
+
+    def stats(self) -> dict:
+        connection = self._connection()
+        depth, oldest = connection.execute(
+            "SELECT COUNT(*), MIN(enqueued_at) FROM queued_review"
+        ).fetchone()
+        flushes, items, avg_latency, max_latency = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(items), 0), AVG(latency_ms), "
+            + "MAX(latency_ms) FROM flush_log"
+        ).fetchone()
+
+        return {
+            "depth": depth,
+            "oldest_age_s": round(time.time() - oldest, 3) if oldest else None,
+            "flushes": flushes,
+            "flushed_items": items,
+            "avg_flush_latency_ms": round(avg_latency, 3) if avg_latency else None,
+            "max_flush_latency_ms": round(max_latency, 3) if max_latency else None,
+        }
+
+    def flush(self, batch_size: int) -> FlushResult:
+        """
+        Grava até `batch_size` reviews da fila numa única transação e só
+        então as remove do journal. Idempotente: se o processo cair entre o
+        commit e o `ack`, as reviews já gravadas são ignoradas no próximo
+        flush, sem contar duas vezes nos agregados dos filmes.
+        """
+        entries = self.peek(batch_size)
+        if not entries:
+            return FlushResult()
+
+        started = time.perf_counter()
+        reviews = [review for _, review in entries]
+
+        with transaction.atomic():
+            already_saved = set(
+                Review.objects.filter(
+                    id__in=[review.id for review in reviews]
+                ).values_list("id", flat=True)
+            )
+            existing_movies = set(
+                Movie.objects.filter(
+                    id__in={review.movie_id for review in reviews}
+                ).values_list("id", flat=True)
+            )
+            existing_critics = set(
+                User.objects.filter(
+                    id__in={review.critic_id for review in reviews}
+                ).values_list("id", flat=True)
+            )
+            # Filmes ou críticos removidos depois do enfileiramento descartam
+            # suas reviews; senão a FK falharia no commit e travaria o lote
+            pending = [
+                review
+                for review in reviews
+                if review.id not in already_saved
+                and review.movie_id in existing_movies
+                and review.critic_id in existing_critics
+            ]
+
+            Review.objects.bulk_create(pending)
+            Movie.objects.record_reviews(pending)
+            CriticStats.objects.record_reviews(pending)
+
+            movie_ids = {review.movie_id for review in pending}
+            if movie_ids:
+                bump_version("movies", *(f"reviews:{pk}" for pk in movie_ids))
+
+        result = FlushResult(
+            items=len(entries),
+            inserted=len(pending),
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
+        self.ack(entries[-1][0], result)
+
+        return result
+
+    def drain(self, batch_size: int) -> FlushResult:
+        total = FlushResult()
+        while True:
+            result = self.flush(batch_size)
+            if not result.items:
+                break
+            total.items += result.items
+            total.inserted += result.inserted
+            total.latency_ms += result.latency_ms
+
+        return total
+
+
+class ReviewFlusher(threading.Thread):
+    """
+    Thread em segundo plano que esvazia a fila em lotes a cada intervalo
+    """
+
+    def __init__(self, queue: ReviewQueue, batch_size: int, interval: float) -> None:
+        super().__init__(name="review-flusher", daemon=True)
+        self.queue = queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            close_old_connections()
+            try:
+                self.queue.drain(self.batch_size)
+            except Exception:
+                # A fila é durável: o próximo ciclo tenta de novo
+                logger.exception("Review queue flush failed")
+                continue
+            finally:
+                close_old_connections()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+
+_queue_lock = threading.Lock()
+_queue: ReviewQueue | None = None
+_flusher: ReviewFlusher | None = None
+
+
+def get_review_queue() -> ReviewQueue:
+    """
+    Fila do processo atual, criada sob demanda. Inicia o flusher em segundo
+    plano na primeira chamada, a menos que `BACKGROUND_FLUSHER` seja False.
+    """
+    global _queue, _flusher
+
+    with _queue_lock:
+        config = settings.REVIEW_WRITE_BEHIND
+        if _queue is None or _queue.path != str(config["JOURNAL"]):
+            if _flusher is not None:
+                _flusher.stop()
+                _flusher = None
+            _queue = ReviewQueue(config["JOURNAL"])
+
+        if config["BACKGROUND_FLUSHER"] and (
+            _flusher is None or not _flusher.is_alive()
+        ):
+            _flusher = ReviewFlusher(
+                _queue, config["BATCH_SIZE"], config["FLUSH_INTERVAL"]
+            )
+            _flusher.start()
+
+        return _queue
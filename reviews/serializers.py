@@ -1 +1,113 @@
+import uuid
 
+from django.db import transaction
+from rest_framework import serializers
+
+from _core.cache import bump_version
+from _core.sparse import SparseFieldsSerializerMixin
+from movies.id_filter import movie_id_filter
+from movies.models import Movie
+
+from .models import CriticStats, Review
+
+
+class CriticSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+
+
+class CriticStatsSerializer(serializers.Serializer):
+    critic = CriticSerializer(read_only=True)
+    reviews_count = serializers.IntegerField(read_only=True)
+    average_stars = serializers.SerializerMethodField()
+    stars_histogram = serializers.DictField(
+        child=serializers.IntegerField(), read_only=True
+    )
+
+    def get_average_stars(self, stats: CriticStats) -> float | None:
+        if not stats.reviews_count:
+            return None
+
+        return round(stats.average_stars, 2)
+
+
+class ReviewSerializer(SparseFieldsSerializerMixin, serializers.Serializer):
+    sparse_columns = {
+        "movie_id": ("movie",),
+        "critic": ("critic__id", "critic__first_name", "critic__last_name"),
+    }
+    sparse_select = {"critic": "critic"}
+
+    id = serializers.UUIDField(read_only=True)
+    stars = serializers.IntegerField(min_value=1, max_value=5)
+    review = serializers.CharField()
+    spoilers = serializers.BooleanField(default=False)
+    movie_id = serializers.UUIDField(read_only=True)
+    critic = CriticSerializer(read_only=True)
+
+    @transaction.atomic
+    def create(self, validated_data: dict) -> Review:
+        review = Review.objects.create(**validated_data)
+        Movie.objects.record_reviews([review])
+        CriticStats.objects.record_reviews([review])
+
+        return review
+
+
+class ReviewBatchListSerializer(serializers.ListSerializer):
+    max_items = 500
+
+    def to_internal_value(self, data: list) -> list[dict]:
+        """
+        Antes de validar os itens, resolve todos os filmes citados no lote
+        com um único `IN`, para que cada item valide seu `movie_id` sem query
+        """
+        if isinstance(data, list) and len(data) > self.max_items:
+            raise serializers.ValidationError(
+                {"non_field_errors": [f"Send at most {self.max_items} reviews."]}
+            )
+
+        movie_ids = set()
+        for item in data if isinstance(data, list) else []:
+            try:
+                movie_ids.add(uuid.UUID(str(item.get("movie_id"))))
+            except (AttributeError, ValueError):
+                continue
+
+        # Ids que o filtro garante não existirem nem entram no IN
+        movie_ids = {pk for pk in movie_ids if movie_id_filter.might_exist(pk)}
+        self.child.existing_movie_ids = (
+            set(Movie.objects.filter(pk__in=movie_ids).values_list("pk", flat=True))
+            if movie_ids
+            else set()
+        )
+
+        return super().to_internal_value(data)
+
+    @transaction.atomic
+    def create(self, validated_data: list[dict]) -> list[Review]:
+        reviews = Review.objects.bulk_create(
+            [Review(**item) for item in validated_data]
+        )
+        Movie.objects.record_reviews(reviews)
+        CriticStats.objects.record_reviews(reviews)
+
+        # bulk_create não dispara os signals que invalidam o cache
+        movie_ids = {review.movie_id for review in reviews}
+        bump_version("movies", *(f"reviews:{movie_id}" for movie_id in movie_ids))
+
+        return reviews
+
+
+class ReviewBatchItemSerializer(ReviewSerializer):
+    movie_id = serializers.UUIDField()
+
+    class Meta:
+        list_serializer_class = ReviewBatchListSerializer
+
+    def validate_movie_id(self, value: uuid.UUID) -> uuid.UUID:
+        if value not in self.existing_movie_ids:
+            raise serializers.ValidationError("Not found.")
+
+        return value
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from _core.cache import bump_version
+
+from .models import Review
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_listing(instance: Review, **kwargs) -> None:
+    """
+    Invalida as reviews do filme e a listagem de filmes, que exibe os
+    agregados de reviews
+    """
+    bump_version("movies", f"reviews:{instance.movie_id}")
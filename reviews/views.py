@@ -1,5 +1,167 @@
+from django.conf import settings
+from django.db.models import QuerySet
+from django.shortcuts import get_object_or_404
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView, Request, Response, status
 
+from _core.cache import VersionedCacheMixin
+from _core.pagination import CursorOptInMixin, KnownCountPagination
+from _core.sparse import SparseFieldsViewMixin
 
-class ReviewView(generics.ListCreateAPIView):
-    ...
+from movies.id_filter import get_movie_or_404
+from users.authentication import ClaimsJWTAuthentication, get_request_user
+from users.models import User
+
+from .models import CriticStats, Review
+from .pagination import (
+    CriticAverageStarsPagination,
+    CriticReviewsCountPagination,
+    ReviewCursorPagination,
+)
+from .permissions import IsCriticOrAdminOrReadOnly
+from .queue import get_review_queue
+from .serializers import (
+    CriticStatsSerializer,
+    ReviewBatchItemSerializer,
+    ReviewSerializer,
+)
+
+
+class ReviewView(
+    VersionedCacheMixin,
+    CursorOptInMixin,
+    SparseFieldsViewMixin,
+    generics.ListCreateAPIView,
+):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsCriticOrAdminOrReadOnly]
+    pagination_class = KnownCountPagination
+    cursor_pagination_class = ReviewCursorPagination
+    sparse_always = ("created_at",)
+
+    serializer_class = ReviewSerializer
+
+    def get_cache_resources(self) -> list[str]:
+        return [f"reviews:{self.kwargs['movie_id']}"]
+
+    def get_spoilers_filter(self) -> bool | None:
+        value = self.request.query_params.get("spoilers")
+        if value is None:
+            return None
+        if value.lower() not in ("true", "false"):
+            raise ValidationError({"spoilers": ["Must be `true` or `false`."]})
+
+        return value.lower() == "true"
+
+    def get_queryset(self) -> QuerySet:
+        self.movie = get_movie_or_404(
+            self.kwargs["movie_id"], "reviews_count", "spoiler_free_reviews_count"
+        )
+
+        queryset = Review.objects.filter(movie=self.movie).order_by("created_at", "id")
+
+        # `spoilers=false` usa o índice parcial `review_spoiler_free_idx`
+        spoilers = self.get_spoilers_filter()
+        if spoilers is not None:
+            queryset = queryset.filter(spoilers=spoilers)
+
+        return self.filter_sparse_fields(queryset)
+
+    def get_known_count(self) -> int | None:
+        """
+        Total da listagem `?spoilers=false` a partir do agregado do filme,
+        sem COUNT. As demais listagens seguem com o COUNT da paginação.
+        """
+        if self.get_spoilers_filter() is False:
+            return self.movie.spoiler_free_reviews_count
+
+        return None
+
+    def create(self, request: Request, *args, **kwargs) -> Response:
+        """
+        No modo write-behind, a review validada vai para a fila durável e a
+        resposta 202 já traz o id definitivo; a gravação no banco fica a
+        cargo do flusher.
+        """
+        if not settings.REVIEW_WRITE_BEHIND["ENABLED"]:
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        movie = get_movie_or_404(self.kwargs["movie_id"])
+        review = Review(
+            movie=movie, critic=get_request_user(request), **serializer.validated_data
+        )
+        get_review_queue().append(review)
+
+        return Response(ReviewSerializer(review).data, status.HTTP_202_ACCEPTED)
+
+    def perform_create(self, serializer: ReviewSerializer) -> None:
+        movie = get_movie_or_404(self.kwargs["movie_id"])
+
+        serializer.save(movie=movie, critic=get_request_user(self.request))
+
+
+class ReviewBatchView(APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsCriticOrAdminOrReadOnly]
+
+    def post(self, request: Request) -> Response:
+        """
+        Criação de reviews em lote, para qualquer combinação de filmes.
+
+        Tudo ou nada: se algum item for inválido, nada é gravado e a resposta
+        traz a lista de erros na mesma ordem dos itens enviados.
+        """
+        serializer = ReviewBatchItemSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        serializer.save(critic=get_request_user(request))
+
+        return Response(serializer.data, status.HTTP_201_CREATED)
+
+
+class CriticLeaderboardView(generics.ListAPIView):
+    """
+    Ranking de críticos a partir da tabela `CriticStats`: cada página é um
+    range seek no índice da ordenação escolhida, sem GROUP BY sobre reviews
+    """
+
+    serializer_class = CriticStatsSerializer
+    orderings = {
+        "reviews_count": CriticReviewsCountPagination,
+        "average_stars": CriticAverageStarsPagination,
+    }
+
+    def get_queryset(self) -> QuerySet:
+        return CriticStats.objects.filter(critic__is_critic=True).select_related(
+            "critic"
+        )
+
+    @property
+    def paginator(self) -> CriticReviewsCountPagination:
+        if not hasattr(self, "_paginator"):
+            ordering = self.request.query_params.get("ordering", "reviews_count")
+            if ordering not in self.orderings:
+                raise ValidationError(
+                    {"ordering": [f"Choose one of: {', '.join(self.orderings)}."]}
+                )
+            self._paginator = self.orderings[ordering]()
+
+        return self._paginator
+
+
+class CriticReviewStatsView(generics.RetrieveAPIView):
+    serializer_class = CriticStatsSerializer
+
+    def get_object(self) -> CriticStats:
+        """
+        Estatísticas de reviews de um usuário; quem ainda não publicou
+        reviews não tem linha em `CriticStats` e recebe tudo zerado
+        """
+        user_id = self.kwargs["user_id"]
+        stats = CriticStats.objects.select_related("critic").filter(pk=user_id)
+
+        return stats.first() or CriticStats(critic=get_object_or_404(User, pk=user_id))
@@ -0,0 +1,321 @@
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from io import StringIO
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver
+from rest_framework.test import APITestCase
+
+from _core.cache import get_response_cache
+from movies.models import Movie
+from tests.factories import create_user_with_token
+from users.models import User
+from users.tokens import ClaimsRefreshToken
+
+BENCH_MOVIES = int(os.environ.get("BENCH_MOVIES", 2000))
+BENCH_REVIEWS = int(os.environ.get("BENCH_REVIEWS", 20_000))
+BENCH_USERS = int(os.environ.get("BENCH_USERS", 200))
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", 30))
+# Folga sobre o baseline antes de falhar: latência é ruidosa, queries não.
+# O percentil comparado é o p50 por padrão, que com poucas rodadas é o único
+# estável; diferenças abaixo de BENCH_LATENCY_FLOOR_MS são ignoradas.
+BENCH_LATENCY_GATE = os.environ.get("BENCH_LATENCY_GATE", "p50")
+BENCH_LATENCY_THRESHOLD = float(os.environ.get("BENCH_LATENCY_THRESHOLD", 1.0))
+BENCH_LATENCY_FLOOR_MS = float(os.environ.get("BENCH_LATENCY_FLOOR_MS", 1.0))
+BENCH_BYTES_THRESHOLD = float(os.environ.get("BENCH_BYTES_THRESHOLD", 0.1))
+BENCH_UPDATE_BASELINE = os.environ.get("BENCH_UPDATE_BASELINE") == "1"
+BENCH_BASELINE = Path(
+    os.environ.get(
+        "BENCH_BASELINE", Path(__file__).parent / "baselines" / "endpoints.json"
+    )
+)
+
+# Request montada fora da medição: (url, dados, token)
+RequestBuilder = Callable[[int], tuple[str, object, str | None]]
+
+
+@dataclass
+class EndpointStats:
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries: int
+    bytes: int
+
+
+def calibrate() -> float:
+    """
+    Tempo, em ms, de uma carga fixa de CPU. A razão entre a calibração atual
+    e a do baseline desconta a velocidade da máquina nas latências.
+    """
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        sum(index * index for index in range(200_000))
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+
+def api_routes(patterns=None, prefix: str = "") -> set[str]:
+    """
+    Rotas registradas em `_core/urls.py`, fora o admin do Django
+    """
+    routes = set()
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace != "admin":
+                routes |= api_routes(
+                    pattern.url_patterns, prefix + str(pattern.pattern)
+                )
+        else:
+            routes.add(prefix + str(pattern.pattern))
+
+    return routes
+
+
+@pytest.mark.bench
+class EndpointBenchmark(APITestCase):
+    """
+    Passa por todas as rotas da API com o test client, contra um catálogo
+    gerado pelo `seed_catalog` (BENCH_MOVIES, BENCH_REVIEWS, BENCH_USERS), e
+    compara p50/p95/p99, queries por requisição e bytes da resposta com o
+    baseline em JSON do mesmo tamanho de catálogo.
+
+    Falha quando o percentil BENCH_LATENCY_GATE passa do baseline em mais
+    de BENCH_LATENCY_THRESHOLD, quando as queries aumentam ou quando a
+    resposta cresce mais que BENCH_BYTES_THRESHOLD. Com
+    BENCH_UPDATE_BASELINE=1, grava o baseline; as latências dependem da
+    máquina, então grave-o na máquina que vai comparar.
+    O cache de respostas é limpo antes de cada requisição, para medir a view.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command(
+            "seed_catalog",
+            movies=BENCH_MOVIES,
+            reviews=BENCH_REVIEWS,
+            users=BENCH_USERS,
+            critic_ratio=0.5,
+            stdout=StringIO(),
+        )
+        cls.admin = User.objects.get(username="seed0_admin")
+        cls.critic = User.objects.filter(is_critic=True).order_by("username").first()
+        cls.admin_token = str(ClaimsRefreshToken.for_user(cls.admin).access_token)
+        cls.critic_token = str(ClaimsRefreshToken.for_user(cls.critic).access_token)
+        cls.movie = Movie.objects.order_by("-reviews_count", "id").first()
+        cls.movie_ids = list(Movie.objects.values_list("id", flat=True)[:10])
+
+    def _fresh_token(self) -> str:
+        _, token = create_user_with_token()
+        return token
+
+    def _movie_data(self, index: int) -> dict:
+        return {
+            "title": f"Bench Movie {index}",
+            "duration": "01:50:00",
+            "premiere": "1999-03-31",
+            "budget": "63000000.00",
+            "overview": "Filme criado pelo benchmark",
+            "genres": [{"name": "Drama"}, {"name": "Action"}],
+        }
+
+    def _user_data(self, index: int, prefix: str = "bench") -> dict:
+        return {
+            "username": f"{prefix}_{index}",
+            "email": f"{prefix}_{index}@kenziebuster.com",
+            "password": "1313",
+            "first_name": "Bench",
+            "last_name": "User",
+        }
+
+    def scenarios(self) -> dict[tuple[str, str], RequestBuilder]:
+        movie_id, critic_id = self.movie.pk, self.critic.pk
+        admin, critic = self.admin_token, self.critic_token
+
+        def review(index: int) -> dict:
+            return {
+                "movie_id": str(self.movie_ids[index % len(self.movie_ids)]),
+                "stars": index % 5 + 1,
+                "review": f"Review {index}",
+            }
+
+        return {
+            ("GET", "api/users/"): lambda i: ("/api/users/", None, admin),
+            ("POST", "api/users/"): lambda i: (
+                "/api/users/",
+                self._user_data(i),
+                None,
+            ),
+            ("POST", "api/users/bulk/"): lambda i: (
+                "/api/users/bulk/",
+                [self._user_data(10 * i + n, prefix="bulk") for n in range(10)],
+                admin,
+            ),
+            ("POST", "api/login/"): lambda i: (
+                "/api/login/",
+                {"username": self.critic.username, "password": "1313"},
+                None,
+            ),
+            ("POST", "api/logout/"): lambda i: (
+                "/api/logout/",
+                None,
+                self._fresh_token(),
+            ),
+            ("POST", "api/tokens/revoke/"): lambda i: (
+                "/api/tokens/revoke/",
+                {"token": self._fresh_token()},
+                None,
+            ),
+            ("GET", "api/critics/"): lambda i: ("/api/critics/", None, None),
+            ("GET", "api/users/<uuid:user_id>/reviews/stats/"): lambda i: (
+                f"/api/users/{critic_id}/reviews/stats/",
+                None,
+                None,
+            ),
+            ("GET", "api/movies/"): lambda i: ("/api/movies/", None, None),
+            ("POST", "api/movies/"): lambda i: (
+                "/api/movies/",
+                self._movie_data(i),
+                admin,
+            ),
+            ("GET", "api/movies/top/"): lambda i: ("/api/movies/top/", None, None),
+            ("GET", "api/movies/export.ndjson"): lambda i: (
+                "/api/movies/export.ndjson",
+                None,
+                admin,
+            ),
+            ("POST", "api/movies/reviews/batch/"): lambda i: (
+                "/api/movies/reviews/batch/",
+                [review(10 * i + n) for n in range(10)],
+                critic,
+            ),
+            ("GET", "api/movies/<uuid:movie_id>/"): lambda i: (
+                f"/api/movies/{movie_id}/",
+                None,
+                None,
+            ),
+            ("GET", "api/movies/<uuid:movie_id>/reviews/"): lambda i: (
+                f"/api/movies/{movie_id}/reviews/",
+                None,
+                None,
+            ),
+            ("POST", "api/movies/<uuid:movie_id>/reviews/"): lambda i: (
+                f"/api/movies/{movie_id}/reviews/",
+                review(i),
+                critic,
+            ),
+        }
+
+    def measure(self, method: str, build: RequestBuilder) -> EndpointStats:
+        latencies, queries, sizes = [], [], []
+
+        # Uma requisição de aquecimento fora da contagem (caches do processo)
+        for index in range(-1, BENCH_ROUNDS):
+            url, data, token = build(index)
+            self.client.credentials(
+                **({"HTTP_AUTHORIZATION": "Bearer " + token} if token else {})
+            )
+            get_response_cache().clear()
+
+            send = getattr(self.client, method.lower())
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = send(url, data=data, format="json")
+                body = (
+                    b"".join(response.streaming_content)
+                    if response.streaming
+                    else response.content
+                )
+                elapsed = time.perf_counter() - started
+
+            self.assertLess(response.status_code, 400, f"{method} {url}: {body[:200]}")
+            if index >= 0:
+                latencies.append(elapsed * 1000)
+                queries.append(len(captured.captured_queries))
+                sizes.append(len(body))
+
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        return EndpointStats(
+            p50_ms=round(statistics.median(latencies), 3),
+            p95_ms=round(percentiles[94], 3),
+            p99_ms=round(percentiles[98], 3),
+            queries=max(queries),
+            bytes=round(statistics.median(sizes)),
+        )
+
+    def regressions(
+        self, stats: EndpointStats, baseline: dict, speed: float
+    ) -> list[str]:
+        problems = []
+        field = f"{BENCH_LATENCY_GATE}_ms"
+        latency, expected = getattr(stats, field), baseline[field] * speed
+        limit = max(
+            expected * (1 + BENCH_LATENCY_THRESHOLD),
+            expected + BENCH_LATENCY_FLOOR_MS,
+        )
+        if latency > limit:
+            problems.append(f"{BENCH_LATENCY_GATE} {latency:.2f}ms > {limit:.2f}ms")
+        if stats.queries > baseline["queries"]:
+            problems.append(f"{stats.queries} queries > {baseline['queries']}")
+        limit = baseline["bytes"] * (1 + BENCH_BYTES_THRESHOLD)
+        if stats.bytes > limit:
+            problems.append(f"{stats.bytes} bytes > {limit:.0f}")
+
+        return problems
+
+    def test_every_route_has_a_scenario(self):
+        covered = {route for _, route in self.scenarios()}
+
+        msg = "\nVerifique se toda rota nova ganhou um cenário no benchmark"
+        self.assertSetEqual(api_routes(), covered, msg)
+
+    def test_endpoints_against_baseline(self):
+        scale = f"{BENCH_MOVIES}m-{BENCH_REVIEWS}r-{BENCH_USERS}u"
+        baselines = (
+            json.loads(BENCH_BASELINE.read_text()) if BENCH_BASELINE.exists() else {}
+        )
+        baseline = baselines.get(scale, {"calibration_ms": None, "endpoints": {}})
+
+        calibration = calibrate()
+        results = {}
+        for (method, route), build in self.scenarios().items():
+            results[f"{method} /{route}"] = self.measure(method, build)
+        # Mede de novo ao final, para acompanhar a máquina durante a rodada
+        calibration = (calibration + calibrate()) / 2
+        speed = calibration / (baseline["calibration_ms"] or calibration)
+
+        print(
+            f"\n[endpoints] {scale}, {BENCH_ROUNDS} rounds, "
+            + f"máquina {speed:.2f}x o tempo do baseline"
+        )
+        for key, stats in results.items():
+            print(
+                f"{key:<48} p50 {stats.p50_ms:7.2f}  p95 {stats.p95_ms:7.2f}  "
+                + f"p99 {stats.p99_ms:7.2f} ms  {stats.queries:3} queries  "
+                + f"{stats.bytes} bytes"
+            )
+
+            if key in baseline["endpoints"] and not BENCH_UPDATE_BASELINE:
+                with self.subTest(key):
+                    problems = self.regressions(
+                        stats, baseline["endpoints"][key], speed
+                    )
+                    self.assertFalse(problems, f"\n{key}: {'; '.join(problems)}")
+
+        if BENCH_UPDATE_BASELINE:
+            baselines[scale] = {
+                "calibration_ms": round(calibration, 3),
+                "endpoints": {key: asdict(stats) for key, stats in results.items()},
+            }
+            BENCH_BASELINE.parent.mkdir(parents=True, exist_ok=True)
+            BENCH_BASELINE.write_text(json.dumps(baselines, indent=2, sort_keys=True))
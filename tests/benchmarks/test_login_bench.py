@@ -0,0 +1,62 @@
+import asyncio
+import os
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import AsyncClient, TransactionTestCase, override_settings
+
+from users.models import User
+
+BENCH_LOGINS = int(os.environ.get("BENCH_LOGINS", 64))
+BENCH_WORKERS = [
+    int(workers) for workers in os.environ.get("BENCH_WORKERS", "1,2,4,8").split(",")
+]
+
+
+@pytest.mark.bench
+@override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHER_PROFILES["default"])
+class LoginBenchmark(TransactionTestCase):
+    """
+    Mede logins/s do login assíncrono para cada tamanho do pool de checagem
+    de senha, com BENCH_LOGINS logins simultâneos e o PBKDF2 de produção
+    """
+
+    def setUp(self) -> None:
+        self.users = [f"bench_user_{index}" for index in range(BENCH_LOGINS)]
+        for username in self.users:
+            User.objects.create_user(
+                username=username,
+                email=f"{username}@kenziebuster.com",
+                first_name="Bench",
+                last_name="User",
+                password="1313",
+            )
+
+    async def _login_all(self) -> list[int]:
+        client = AsyncClient()
+
+        async def login(username: str) -> int:
+            response = await client.post(
+                "/api/login/",
+                data={"username": username, "password": "1313"},
+                content_type="application/json",
+            )
+            return response.status_code
+
+        return await asyncio.gather(*(login(username) for username in self.users))
+
+    def test_logins_per_second_by_worker_count(self):
+        for workers in BENCH_WORKERS:
+            login = {**settings.LOGIN, "WORKERS": workers, "MAX_PENDING": BENCH_LOGINS}
+            with override_settings(LOGIN=login):
+                started = time.perf_counter()
+                statuses = async_to_sync(self._login_all)()
+                elapsed = time.perf_counter() - started
+
+            self.assertEqual([200] * BENCH_LOGINS, statuses)
+            print(
+                f"\n{workers} workers: {BENCH_LOGINS / elapsed:.1f} logins/s "
+                + f"({elapsed * 1000 / BENCH_LOGINS:.1f}ms por login)"
+            )
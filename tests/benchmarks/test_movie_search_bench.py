@@ -0,0 +1,92 @@
+import os
+import random
+import time
+from datetime import date, timedelta
+
+import pytest
+from django.db.models import Q
+from django.test import TestCase
+
+from movies.models import Movie
+from movies.search import search_movies
+from tests.factories import create_user_with_token
+
+BENCH_MOVIES = int(os.environ.get("BENCH_MOVIES", 1_000_000))
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", 5))
+
+SYLLABLES = "ka lo mi ne ru sa te vo zi pa da fe gu hi jo".split()
+
+
+def build_vocabulary(rng: random.Random, size: int) -> list[str]:
+    """
+    Vocabulário sintético grande o bastante para que cada palavra apareça
+    numa fração pequena do catálogo, como acontece com títulos reais
+    """
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+
+    return sorted(words)
+
+
+@pytest.mark.bench
+class MovieSearchBenchmark(TestCase):
+    """
+    Compara a busca FTS5 com o `icontains` (LIKE) sobre BENCH_MOVIES filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        rng = random.Random(42)
+        words = build_vocabulary(rng, 20_000)
+        cls.search_terms = [
+            words[100],
+            words[200][:4],
+            f"{words[300]} {words[400]}",
+            "godfather",
+        ]
+
+        for start in range(0, BENCH_MOVIES, 10_000):
+            Movie.objects.bulk_create(
+                [
+                    Movie(
+                        title=" ".join(rng.choices(words, k=3)).title(),
+                        overview=" ".join(rng.choices(words, k=20)),
+                        duration=timedelta(minutes=rng.randint(80, 200)),
+                        premiere=date(1950, 1, 1)
+                        + timedelta(days=rng.randint(0, 27000)),
+                        budget=rng.randint(10_000, 300_000_000),
+                        user=admin,
+                    )
+                    for _ in range(start, min(start + 10_000, BENCH_MOVIES))
+                ]
+            )
+
+    def _timed(self, build_queryset) -> float:
+        started = time.perf_counter()
+        for _ in range(BENCH_ROUNDS):
+            for term in self.search_terms:
+                # Primeira página (PAGE_SIZE 4) + COUNT, como a listagem faz
+                queryset = build_queryset(term)
+                list(queryset[:4])
+                queryset.count()
+
+        return (time.perf_counter() - started) / (BENCH_ROUNDS * len(self.search_terms))
+
+    def test_fts_vs_like(self):
+        base = Movie.objects.order_by("premiere", "id")
+
+        fts = self._timed(lambda term: search_movies(base, term))
+        like = self._timed(
+            lambda term: base.filter(
+                Q(title__icontains=term) | Q(overview__icontains=term)
+            )
+        )
+
+        print(
+            f"\n[movie search] {BENCH_MOVIES} movies: "
+            + f"FTS5 {fts * 1000:.2f} ms/query, LIKE {like * 1000:.2f} ms/query "
+            + f"({like / fts:.1f}x)"
+        )
+        self.assertLess(fts, like)
@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+from rest_framework.test import APITestCase
+
+from tests.factories import create_multiple_movies, create_user_with_token
+
+BENCH_BATCH = int(os.environ.get("BENCH_BATCH", 500))
+
+
+@pytest.mark.bench
+class ReviewBatchBenchmark(APITestCase):
+    """
+    Compara BENCH_BATCH POSTs individuais de review com um único POST em lote
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        _, cls.critic_token = create_user_with_token(is_critic=True)
+        cls.movies = create_multiple_movies(quantity=50, user=admin)
+
+    def _items(self) -> list[dict]:
+        return [
+            {
+                "movie_id": str(self.movies[index % len(self.movies)].pk),
+                "stars": index % 5 + 1,
+                "review": f"Review {index}",
+            }
+            for index in range(BENCH_BATCH)
+        ]
+
+    def test_batch_vs_single_posts(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        items = self._items()
+
+        started = time.perf_counter()
+        for item in items:
+            url = f"/api/movies/{item['movie_id']}/reviews/"
+            self.client.post(url, data=item, format="json")
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = self.client.post(
+            "/api/movies/reviews/batch/", data=items, format="json"
+        )
+        batch = time.perf_counter() - started
+        self.assertEqual(201, response.status_code)
+
+        print(
+            f"\n[review batch] {BENCH_BATCH} reviews: "
+            + f"single {BENCH_BATCH / single:.0f} reviews/s, "
+            + f"batch {BENCH_BATCH / batch:.0f} reviews/s ({single / batch:.1f}x)"
+        )
+        self.assertLess(batch, single)
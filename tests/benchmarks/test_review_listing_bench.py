@@ -0,0 +1,76 @@
+import os
+import time
+
+import pytest
+from rest_framework.test import APITestCase
+
+from reviews.models import Review
+from reviews.pagination import ReviewCursorPagination
+from tests.factories import create_multiple_movies, create_user_with_token
+
+BENCH_REVIEWS = int(os.environ.get("BENCH_REVIEWS", 100_000))
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", 20))
+
+
+@pytest.mark.bench
+class ReviewListingBenchmark(APITestCase):
+    """
+    Compara uma página profunda das reviews de um filme com BENCH_REVIEWS
+    reviews: paginação numerada (OFFSET + COUNT) contra cursor
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        critic, _ = create_user_with_token(is_critic=True)
+        cls.movie, other_movie = create_multiple_movies(quantity=2, user=admin)
+
+        for movie, quantity in ((cls.movie, BENCH_REVIEWS), (other_movie, 10_000)):
+            for start in range(0, quantity, 10_000):
+                Review.objects.bulk_create(
+                    [
+                        Review(
+                            stars=index % 5 + 1,
+                            review=f"Review {index}",
+                            movie=movie,
+                            critic=critic,
+                        )
+                        for index in range(start, min(start + 10_000, quantity))
+                    ]
+                )
+
+        cls.BASE_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+
+    def _timed(self, url: str) -> float:
+        started = time.perf_counter()
+        for _ in range(BENCH_ROUNDS):
+            # Query string variando para não cair no cache de respostas
+            response = self.client.get(f"{url}&_={time.perf_counter_ns()}")
+            self.assertEqual(200, response.status_code)
+
+        return (time.perf_counter() - started) / BENCH_ROUNDS
+
+    def test_deep_page_offset_vs_cursor(self):
+        page = BENCH_REVIEWS // 4 - 1
+        anchor = (
+            Review.objects.filter(movie=self.movie)
+            .order_by("created_at", "id")
+            .only("created_at")[page * 4 - 1]
+        )
+        pagination = ReviewCursorPagination()
+        pagination.base_url = f"http://testserver{self.BASE_URL}"
+        deep_cursor_url = pagination.encode_cursor(
+            pagination._position(anchor), reverse=False
+        )
+
+        first_offset = self._timed(f"{self.BASE_URL}?page=1")
+        deep_offset = self._timed(f"{self.BASE_URL}?page={page + 1}")
+        first_cursor = self._timed(f"{self.BASE_URL}?cursor=")
+        deep_cursor = self._timed(deep_cursor_url)
+
+        print(
+            f"\n[review listing] {BENCH_REVIEWS} reviews, page {page + 1}: "
+            + f"offset {first_offset * 1000:.2f} -> {deep_offset * 1000:.2f} ms, "
+            + f"cursor {first_cursor * 1000:.2f} -> {deep_cursor * 1000:.2f} ms"
+        )
+        self.assertLess(deep_cursor, deep_offset)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from genres.models import Genre
+from movies.models import Movie
+from tests.factories import create_multiple_movies, create_user_with_token
+
+BENCH_MOVIES = int(os.environ.get("BENCH_MOVIES", 2_000))
+BENCH_PAGES = int(os.environ.get("BENCH_PAGES", 50))
+
+
+@pytest.mark.bench
+class SparseFieldsBenchmark(APITestCase):
+    """
+    Mede bytes e queries economizados por `?fields=` na listagem de filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        movies = create_multiple_movies(quantity=BENCH_MOVIES, user=admin)
+        Movie.objects.update(overview="Uma sinopse longa. " * 20)
+
+        genres = Genre.objects.bulk_create(
+            [Genre(name=f"Genre {index}") for index in range(10)]
+        )
+        through_model = Movie.genres.through
+        through_model.objects.bulk_create(
+            [
+                through_model(movie_id=movie.pk, genre_id=genres[offset].pk)
+                for index, movie in enumerate(movies)
+                for offset in (index % 10, (index + 3) % 10, (index + 7) % 10)
+            ]
+        )
+
+    def _walk(self, params: dict) -> tuple[int, int]:
+        total_bytes = total_queries = 0
+        for page in range(1, BENCH_PAGES + 1):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get("/api/movies/", {**params, "page": page})
+
+            total_bytes += len(response.content)
+            total_queries += len(queries.captured_queries)
+
+        return total_bytes, total_queries
+
+    def test_sparse_fields_savings(self):
+        full_bytes, full_queries = self._walk({})
+        sparse_bytes, sparse_queries = self._walk({"fields": "id,title,premiere"})
+
+        print(
+            f"\n[sparse fields] {BENCH_PAGES} pages: "
+            + f"full {full_bytes} B / {full_queries} queries, "
+            + f"sparse {sparse_bytes} B / {sparse_queries} queries "
+            + f"({100 - sparse_bytes * 100 / full_bytes:.0f}% fewer bytes)"
+        )
+        self.assertLess(sparse_bytes, full_bytes)
+        self.assertLessEqual(sparse_queries, full_queries)
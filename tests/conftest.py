@@ -0,0 +1,60 @@
+import pytest
+from django.conf import settings
+from django.test import TransactionTestCase, override_settings
+
+from _core.cache import get_response_cache
+from movies.id_filter import movie_id_filter
+from users.login import login_limiter
+from users.revocation import token_denylist
+
+
+def pytest_configure(config):
+    """
+    Os testes criam muitos usuários e não dependem do custo do PBKDF2: roda
+    tudo com o perfil "fast" de hash de senha
+    """
+    override_settings(
+        PASSWORD_HASHERS=settings.PASSWORD_HASHER_PROFILES["fast"]
+    ).enable()
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """
+    O banco volta ao estado inicial a cada teste, mas o cache em memória não.
+    Os factories usam bulk_create sem passar pelas views, então nada
+    invalidaria as respostas cacheadas por um teste anterior.
+    """
+    get_response_cache().clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_movie_id_filter():
+    """
+    Pelo mesmo motivo, o filtro de ids de filmes é recarregado a cada teste
+    """
+    movie_id_filter.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_login_limiter():
+    """
+    E o limite de tentativas de login, também em memória, é zerado
+    """
+    login_limiter.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_token_denylist(request, django_db_blocker):
+    """
+    A denylist de tokens revogados é recarregada da tabela do teste, ainda
+    vazia, antes que as queries do teste comecem a ser contadas
+    """
+    token_denylist.reset()
+    if isinstance(request.instance, TransactionTestCase):
+        with django_db_blocker.unblock():
+            token_denylist.warm()
+    yield
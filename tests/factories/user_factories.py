@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User as UserType
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.tokens import ClaimsRefreshToken
+
 from .faker_factory import fake
 
 User: UserType = get_user_model()
@@ -31,7 +33,7 @@ def create_user_with_token(
     else:
         user = User.objects.create_user(**user_data)
 
-    token: RefreshToken = RefreshToken.for_user(user)
+    token: ClaimsRefreshToken = ClaimsRefreshToken.for_user(user)
 
     return user, str(token.access_token)
 
@@ -49,6 +51,6 @@ def create_multiple_critic_users(quantity: int) -> list[User]:
         for index in range(1, quantity + 1)
     ]
 
-    users = [User.objects.create_user(**user_data) for user_data in users_data]
+    users = User.objects.bulk_create_users(users_data)
 
     return users
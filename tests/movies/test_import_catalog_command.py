@@ -0,0 +1,144 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import base, call_command
+from django.test import TestCase
+
+from genres.models import Genre
+from movies.models import Movie
+from reviews.models import Review
+from tests.factories import create_genre_by_name, create_user_with_token
+
+
+class ImportCatalogCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, _ = create_user_with_token(is_critic=True)
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write(self, name: str, content: str) -> str:
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def _ndjson(self, quantity: int) -> str:
+        records = [
+            {
+                "title": f"Movie {index}",
+                "duration": "01:50:00",
+                "premiere": "1972-09-10",
+                "budget": "13000000.00",
+                "genres": ["Crime", {"name": "Drama"}],
+                "reviews": [
+                    {"stars": 4, "review": "Bom", "critic": self.critic.username}
+                ],
+            }
+            for index in range(quantity)
+        ]
+        return "\n".join(json.dumps(record) for record in records) + "\n"
+
+    def test_import_ndjson_with_genres_and_reviews(self):
+        crime = create_genre_by_name("Crime")
+        path = self._write("catalog.ndjson", self._ndjson(5))
+
+        out = StringIO()
+        call_command("import_catalog", path, chunk_size=2, stdout=out)
+
+        msg = "Verifique se todos os filmes, gêneros e reviews foram importados"
+        self.assertEqual(5, Movie.objects.count(), msg)
+        self.assertEqual(5, Review.objects.filter(critic=self.critic).count(), msg)
+        self.assertEqual(2, Genre.objects.count(), msg)
+        self.assertEqual(5, crime.movies.count(), msg)
+        self.assertIn("Imported 5 movies and 5 reviews", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+
+    def test_import_csv(self):
+        content = (
+            "title,duration,premiere,budget,overview,genres\n"
+            + "Movie 1,01:50:00,1972-09-10,13000000.00,Uma sinopse,Crime|Drama\n"
+            + "Movie 2,02:00:00,1974-12-20,13000000.00,,\n"
+        )
+        path = self._write("catalog.csv", content)
+
+        call_command("import_catalog", path, stdout=StringIO())
+
+        movie_1 = Movie.objects.get(title="Movie 1")
+        movie_2 = Movie.objects.get(title="Movie 2")
+        self.assertEqual("Uma sinopse", movie_1.overview)
+        self.assertEqual(2, movie_1.genres.count())
+        self.assertIsNone(movie_2.overview)
+        self.assertEqual(self.admin, movie_2.user)
+
+    def test_import_resumes_from_checkpoint(self):
+        path = self._write("catalog.ndjson", self._ndjson(3) + "{broken\n")
+        checkpoint = str(Path(self.tmp_dir.name) / "catalog.checkpoint")
+
+        with self.assertRaises(base.CommandError) as err:
+            call_command(
+                "import_catalog",
+                path,
+                chunk_size=1,
+                checkpoint=checkpoint,
+                stdout=StringIO(),
+            )
+        self.assertIn("Line 4", err.exception.args[0])
+        self.assertEqual(3, Movie.objects.count())
+
+        # Corrige a linha quebrada e retoma sem duplicar os filmes já importados
+        Path(path).write_text(self._ndjson(4), encoding="utf-8")
+        out = StringIO()
+        call_command("import_catalog", path, checkpoint=checkpoint, stdout=out)
+
+        msg = "Verifique se a importação é retomada a partir do checkpoint"
+        self.assertIn("Resuming", out.getvalue(), msg)
+        self.assertEqual(4, Movie.objects.count(), msg)
+
+    def test_import_with_unknown_critic(self):
+        record = json.loads(self._ndjson(1))
+        record["reviews"][0]["critic"] = "nobody"
+        path = self._write("catalog.ndjson", json.dumps(record))
+
+        with self.assertRaises(base.CommandError) as err:
+            call_command("import_catalog", path, stdout=StringIO())
+
+        self.assertEqual("Unknown critics: nobody.", err.exception.args[0])
+        self.assertEqual(0, Movie.objects.count())
+
+    def test_import_rejects_invalid_rows(self):
+        record = json.loads(self._ndjson(1))
+        invalid_rows = [
+            ("budget", json.dumps({**record, "budget": "NaN"})),
+            ("budget", json.dumps({**record, "budget": "1e20"})),
+            ("duration", json.dumps({**record, "duration": "99999999999 00:00:00"})),
+            ("premiere", json.dumps({**record, "premiere": "2000-13-01"})),
+            ("JSON object", json.dumps([1, 2])),
+            ("reviews", json.dumps({**record, "reviews": [1]})),
+        ]
+        for expected, row in invalid_rows:
+            path = self._write("catalog.ndjson", self._ndjson(1) + row + "\n")
+
+            with self.assertRaises(base.CommandError) as err:
+                call_command("import_catalog", path, stdout=StringIO())
+
+            msg = f"\nVerifique se a linha inválida ({row}) vira CommandError"
+            self.assertTrue(err.exception.args[0].startswith("Line 2: "), msg)
+            self.assertIn(expected, err.exception.args[0], msg)
+            self.assertEqual(0, Movie.objects.count(), msg)
+
+    def test_import_csv_with_impossible_date(self):
+        content = (
+            "title,duration,premiere,budget,overview,genres\n"
+            + "Movie 1,01:50:00,2000-13-01,13000000.00,,Crime\n"
+        )
+        path = self._write("catalog.csv", content)
+
+        with self.assertRaises(base.CommandError) as err:
+            call_command("import_catalog", path, stdout=StringIO())
+
+        self.assertTrue(err.exception.args[0].startswith("Line 2: `premiere`"))
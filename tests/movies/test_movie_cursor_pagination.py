@@ -0,0 +1,101 @@
+import base64
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class MovieCursorPaginationTest(APITestCase):
+    """
+    Classe para testar o modo de paginação por cursor da listagem de filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.movies = create_multiple_movies(quantity=10, user=cls.admin)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _walk_forward(self) -> tuple[list[str], list[str]]:
+        response = self.client.get(self.BASE_URL, {"cursor": ""})
+        ids, pages = [], []
+        while True:
+            resulted_data = response.json()
+            ids.extend(movie["id"] for movie in resulted_data["results"])
+            pages.append(response.request["QUERY_STRING"])
+            if not resulted_data["next"]:
+                return ids, pages
+            response = self.client.get(resulted_data["next"])
+
+    def test_cursor_pagination_keys(self):
+        response = self.client.get(self.BASE_URL, {"cursor": ""})
+
+        # STATUS CODE
+        expected_status_code = status.HTTP_200_OK
+        msg = (
+            "\nVerifique se o status code retornado do GET "
+            + f"em `{self.BASE_URL}?cursor=` é {expected_status_code}"
+        )
+        self.assertEqual(expected_status_code, response.status_code, msg)
+
+        # RETORNO JSON
+        resulted_data = response.json()
+        expected_keys = {"next", "previous", "results"}
+        msg = "\nVerifique se a paginação por cursor não retorna `count`"
+        self.assertSetEqual(expected_keys, set(resulted_data.keys()), msg)
+        self.assertEqual(4, len(resulted_data["results"]))
+        self.assertIsNone(resulted_data["previous"])
+
+    def test_cursor_pagination_walks_every_movie_once(self):
+        ids, _ = self._walk_forward()
+
+        expected_ids = sorted(str(movie.pk) for movie in self.movies)
+        msg = "\nVerifique se o cursor percorre todos os filmes exatamente uma vez"
+        self.assertListEqual(expected_ids, ids, msg)
+
+    def test_cursor_pagination_previous_link(self):
+        first_page = self.client.get(self.BASE_URL, {"cursor": ""}).json()
+        second_page = self.client.get(first_page["next"]).json()
+        back_page = self.client.get(second_page["previous"]).json()
+
+        msg = "\nVerifique se o link `previous` retorna à página anterior"
+        self.assertListEqual(first_page["results"], back_page["results"], msg)
+
+    def test_cursor_pagination_runs_without_count_or_offset(self):
+        first_page = self.client.get(self.BASE_URL, {"cursor": ""}).json()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(first_page["next"])
+
+        sql = " ".join(query["sql"] for query in queries.captured_queries).upper()
+        msg = "\nVerifique se a paginação por cursor evita COUNT e OFFSET"
+        self.assertNotIn("COUNT(", sql, msg)
+        self.assertNotIn("OFFSET", sql, msg)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.BASE_URL, {"cursor": "not-a-cursor"})
+
+        expected_status_code = status.HTTP_404_NOT_FOUND
+        self.assertEqual(expected_status_code, response.status_code)
+
+    def test_tampered_cursor(self):
+        positions = [[1, 2], ["2020-02-31", "x"], [None, {}]]
+        for position in positions:
+            payload = json.dumps({"p": position, "r": 0}).encode("ascii")
+            cursor = base64.urlsafe_b64encode(payload).decode("ascii")
+
+            response = self.client.get(self.BASE_URL, {"cursor": cursor})
+
+            expected_status_code = status.HTTP_404_NOT_FOUND
+            msg = (
+                "\nVerifique se um cursor com valores inválidos "
+                + f"({position}) retorna {expected_status_code}"
+            )
+            self.assertEqual(expected_status_code, response.status_code, msg)
@@ -0,0 +1,100 @@
+import json
+import warnings
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from movies.models import Movie
+from movies.views import MovieExportView
+from tests.factories import (
+    create_genre_by_name,
+    create_multiple_movies,
+    create_user_with_token,
+)
+
+
+class MovieExportViewTest(APITestCase):
+    """
+    Classe para testar a exportação do catálogo em NDJSON
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/export.ndjson"
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        _, cls.non_admin_token = create_user_with_token()
+        cls.movies = create_multiple_movies(quantity=5, user=cls.admin)
+
+        drama = create_genre_by_name("Drama")
+        for movie in cls.movies:
+            movie.genres.add(drama)
+
+    def _export(self, params: dict = None) -> list[dict]:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.get(self.BASE_URL, params)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+        content = b"".join(response.streaming_content).decode()
+
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_without_admin_token(self):
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.non_admin_token)
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_export_streams_every_movie_with_genres(self):
+        MovieExportView.chunk_size = 2
+        self.addCleanup(setattr, MovieExportView, "chunk_size", 2000)
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self._export()
+
+        msg = "\nVerifique se todos os filmes são exportados com seus gêneros"
+        self.assertSetEqual(
+            {str(movie.pk) for movie in self.movies}, {row["id"] for row in rows}, msg
+        )
+        self.assertTrue(all(row["genres"][0]["name"] == "Drama" for row in rows), msg)
+
+        # usuário do token, um SELECT lido em stream e um prefetch por bloco
+        msg = "\nVerifique se os gêneros são buscados uma vez por bloco"
+        self.assertEqual(1 + 1 + 3, len(queries.captured_queries), msg)
+
+    def test_incremental_export_since(self):
+        since = self._export()[-1]["updated_at"]
+
+        movie = Movie.objects.get(pk=self.movies[0].pk)
+        movie.title = "Atualizado"
+        movie.save()
+
+        rows = self._export({"since": since})
+
+        msg = "\nVerifique se `?since=` exporta apenas os filmes alterados"
+        self.assertListEqual(["Atualizado"], [row["title"] for row in rows], msg)
+
+    def test_export_with_invalid_since(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.get(self.BASE_URL, {"since": "ontem"})
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_export_with_impossible_since(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.get(self.BASE_URL, {"since": "2020-13-01T00:00:00"})
+
+        msg = "\nVerifique se uma data impossível em `?since=` retorna 400"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+
+    def test_export_with_naive_since(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            rows = self._export({"since": "2000-01-01"})
+
+        msg = "\nVerifique se `?since=` sem fuso é interpretado no fuso do projeto"
+        self.assertEqual(len(self.movies), len(rows), msg)
@@ -0,0 +1,119 @@
+import itertools
+
+from django.db import connection
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from movies.filters import filter_movies
+from movies.models import Movie
+from tests.factories import (
+    create_genre_by_name,
+    create_multiple_movies,
+    create_user_with_token,
+)
+
+FILTER_GROUPS = {
+    "genre": {"genre": "Drama"},
+    "premiere": {"premiere_from": "2000-01-01", "premiere_to": "2010-12-31"},
+    "budget": {"budget_min": "1000000", "budget_max": "50000000"},
+    "duration": {"duration_min": "01:30:00", "duration_max": "02:30:00"},
+}
+
+
+class MovieFiltersTest(APITestCase):
+    """
+    Classe para testar os filtros da listagem de filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        admin, _ = create_user_with_token(is_admin=True)
+        cls.movie_1, cls.movie_2, cls.movie_3 = create_multiple_movies(3, admin)
+
+        Movie.objects.filter(pk=cls.movie_1.pk).update(
+            premiere="2005-05-05", budget="20000000.00"
+        )
+        Movie.objects.filter(pk=cls.movie_2.pk).update(
+            premiere="1995-05-05", budget="20000000.00"
+        )
+        cls.movie_1.genres.add(create_genre_by_name("Drama"))
+
+    def _listed_ids(self, params: dict) -> set[str]:
+        response = self.client.get(self.BASE_URL, params)
+        return {movie["id"] for movie in response.json()["results"]}
+
+    def test_filters_combined(self):
+        msg = "\nVerifique se os filtros da listagem de filmes são aplicados"
+        self.assertSetEqual(
+            {str(self.movie_1.pk), str(self.movie_2.pk)},
+            self._listed_ids(FILTER_GROUPS["budget"]),
+            msg,
+        )
+        self.assertSetEqual(
+            {str(self.movie_1.pk)},
+            self._listed_ids(
+                {**FILTER_GROUPS["budget"], "premiere_from": "2000-01-01"}
+            ),
+            msg,
+        )
+        self.assertSetEqual(
+            {str(self.movie_1.pk)}, self._listed_ids(FILTER_GROUPS["genre"]), msg
+        )
+        self.assertSetEqual(set(), self._listed_ids({"duration_max": "01:00:00"}), msg)
+
+    def test_invalid_filter_values(self):
+        response = self.client.get(
+            self.BASE_URL, {"premiere_from": "ontem", "budget_max": "muito"}
+        )
+
+        expected_data = {
+            "premiere_from": ["Enter a valid date (YYYY-MM-DD)."],
+            "budget_max": ["A valid number is required."],
+        }
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(expected_data, response.json())
+
+    def test_impossible_filter_values(self):
+        response = self.client.get(
+            self.BASE_URL,
+            {
+                "premiere_from": "2020-13-45",
+                "duration_min": "99999999999 00:00:00",
+                "budget_min": "NaN",
+                "budget_max": "Infinity",
+            },
+        )
+
+        expected_data = {
+            "premiere_from": ["Enter a valid date (YYYY-MM-DD)."],
+            "duration_min": ["Enter a valid duration (HH:MM:SS)."],
+            "budget_min": ["A valid number is required."],
+            "budget_max": ["A valid number is required."],
+        }
+        msg = "\nVerifique se valores bem formados, mas impossíveis, retornam 400"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertDictEqual(expected_data, response.json())
+
+    def test_no_filter_combination_scans_the_movie_table(self):
+        base = Movie.objects.order_by("premiere", "id")
+
+        for size in range(1, len(FILTER_GROUPS) + 1):
+            for groups in itertools.combinations(FILTER_GROUPS, size):
+                params = {
+                    key: value
+                    for group in groups
+                    for key, value in FILTER_GROUPS[group].items()
+                }
+                queryset = filter_movies(base, params)
+
+                for query in (queryset[:4].query, queryset.order_by().query):
+                    sql, sql_params = query.sql_with_params()
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", sql_params)
+                        plan = [row[-1] for row in cursor.fetchall()]
+
+                    with self.subTest(filters=groups, sql=sql):
+                        scans = [step for step in plan if step.startswith("SCAN")]
+                        msg = f"\nFull scan com os filtros {groups}: {plan}"
+                        self.assertListEqual([], scans, msg)
@@ -0,0 +1,72 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from genres.models import Genre
+from movies.models import Movie
+from tests.factories import create_genre_by_name, create_user_with_token
+
+
+class MovieGenresBatchCreationTest(APITestCase):
+    """
+    Classe para testar a resolução em lote dos gêneros na criação de filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        _, cls.admin_token = create_user_with_token(is_admin=True)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _movie_data(self, genres_names: list[str]) -> dict:
+        return {
+            "title": "O Poderoso Chefão",
+            "duration": "02:55:00",
+            "premiere": "1972-03-24",
+            "budget": "6000000.00",
+            "genres": [{"name": name} for name in genres_names],
+        }
+
+    def _post_counting_queries(self, genres_names: list[str]) -> int:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self.BASE_URL, data=self._movie_data(genres_names), format="json"
+            )
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        return len(queries.captured_queries)
+
+    def test_movie_creation_queries_do_not_grow_with_genres(self):
+        create_genre_by_name("Crime")
+
+        few_genres_queries = self._post_counting_queries(["Crime", "Drama"])
+        many_genres_queries = self._post_counting_queries(
+            ["Crime", "Drama", "Ação", "Suspense", "Romance", "Comédia"]
+        )
+
+        msg = "\nVerifique se a criação de filmes resolve os gêneros em lote"
+        self.assertEqual(few_genres_queries, many_genres_queries, msg)
+
+    def test_movie_creation_reuses_and_dedupes_genres(self):
+        crime = create_genre_by_name("Crime")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.post(
+            self.BASE_URL,
+            data=self._movie_data(["Crime", "Drama", "Crime"]),
+            format="json",
+        )
+
+        resulted_genres = response.json()["genres"]
+        expected_genres = [
+            {"id": str(crime.pk), "name": "Crime"},
+            {"id": str(Genre.objects.get(name="Drama").pk), "name": "Drama"},
+        ]
+        msg = "\nVerifique se gêneros repetidos ou já existentes são reaproveitados"
+        self.assertListEqual(expected_genres, resulted_genres, msg)
+        self.assertEqual(2, Genre.objects.count(), msg)
+        self.assertEqual(2, Movie.objects.get().genres.count(), msg)
@@ -0,0 +1,132 @@
+import uuid
+
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from _core.bloom import BloomFilter
+from _core.cache import bump_version
+from movies.id_filter import movie_id_filter
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class BloomFilterTest(SimpleTestCase):
+    """
+    Classe para testar o filtro de Bloom usado pelo filtro de ids de filmes
+    """
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+        present = [uuid.uuid4() for _ in range(10_000)]
+        for item in present:
+            bloom.add(item)
+
+        msg = "\nVerifique se o filtro nunca dá falso negativo"
+        self.assertTrue(all(item in bloom for item in present), msg)
+
+        msg = "\nVerifique se a taxa de falsos positivos respeita `error_rate`"
+        false_positives = sum(uuid.uuid4() in bloom for _ in range(10_000))
+        self.assertLess(false_positives, 200, msg)
+
+
+class MovieIdFilterTest(APITestCase):
+    """
+    Classe para testar a checagem rápida de existência de filmes nas rotas
+    de reviews
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        (cls.movie,) = create_multiple_movies(quantity=1, user=cls.admin)
+
+    def _reviews_url(self, movie_id) -> str:
+        return f"/api/movies/{movie_id}/reviews/"
+
+    def test_unknown_movie_is_rejected_without_query(self):
+        movie_id_filter.warm()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self._reviews_url(uuid.uuid4()))
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        self.assertDictEqual({"detail": "Not found."}, response.json())
+
+        msg = "\nVerifique se ids desconhecidos são recusados sem ir ao banco"
+        self.assertEqual(0, len(queries), msg)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self._reviews_url(uuid.uuid4()),
+                data={"stars": 4, "review": "Muito bom"},
+                format="json",
+            )
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        # Só a autenticação do crítico vai ao banco
+        self.assertEqual(1, len(queries), msg)
+
+    def test_known_movie_fetches_only_the_pk(self):
+        movie_id_filter.warm()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self._reviews_url(self.movie.pk),
+                data={"stars": 4, "review": "Muito bom"},
+                format="json",
+            )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        msg = "\nVerifique se a busca do filme carrega só o pk"
+        lookup = next(
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "movies_movie"')
+        )
+        self.assertTrue(
+            lookup.startswith('SELECT "movies_movie"."id" FROM "movies_movie"'),
+            msg + f": {lookup}",
+        )
+
+    def test_movie_created_by_the_api_is_known_immediately(self):
+        movie_id_filter.warm()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.post(
+            "/api/movies/",
+            data={
+                "title": "Interestelar",
+                "duration": "02:49:00",
+                "premiere": "2014-11-06",
+                "budget": "165000000.00",
+                "genres": [{"name": "Sci-Fi"}],
+            },
+            format="json",
+        )
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        msg = "\nVerifique se filmes criados pela API entram no filtro na hora"
+        response = self.client.get(self._reviews_url(response.json()["id"]))
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+
+    @override_settings(
+        MOVIE_ID_FILTER={**settings.MOVIE_ID_FILTER, "REFRESH_INTERVAL": 3600}
+    )
+    def test_bulk_created_movie_is_caught_up(self):
+        movie_id_filter.warm()
+        (movie,) = create_multiple_movies(quantity=1, user=self.admin)
+
+        msg = "\nVerifique se um filme criado sem signal entra no filtro quando "
+        msg += "a versão de `movies` muda"
+        response = self.client.get(self._reviews_url(movie.pk))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg)
+
+        bump_version("movies")
+        response = self.client.get(self._reviews_url(movie.pk))
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
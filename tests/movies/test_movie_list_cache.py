@@ -0,0 +1,94 @@
+import uuid
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from _core.cache import get_response_cache
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class MovieListCacheTest(APITestCase):
+    """
+    Classe para testar o cache versionado das listagens de filmes e reviews
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        _, cls.critic_token = create_user_with_token(is_critic=True)
+        (cls.movie,) = create_multiple_movies(quantity=1, user=cls.admin)
+        cls.REVIEWS_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+
+    def test_repeated_get_is_served_from_cache(self):
+        first = self.client.get(self.BASE_URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.BASE_URL)
+
+        msg = "\nVerifique se a segunda listagem vem do cache, sem queries"
+        self.assertEqual("MISS", first["X-Cache"])
+        self.assertEqual("HIT", second["X-Cache"], msg)
+        self.assertEqual(0, len(queries.captured_queries), msg)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_if_none_match_returns_304_without_queries(self):
+        etag = self.client.get(self.REVIEWS_URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.REVIEWS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "\nVerifique se o If-None-Match com ETag atual retorna 304 sem queries"
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code, msg)
+        self.assertEqual(0, len(queries.captured_queries), msg)
+
+    def test_query_string_is_part_of_the_key(self):
+        first_page = self.client.get(self.BASE_URL)
+        cursor_page = self.client.get(self.BASE_URL, {"cursor": ""})
+
+        self.assertEqual("MISS", cursor_page["X-Cache"])
+        self.assertNotEqual(first_page["ETag"], cursor_page["ETag"])
+
+    def test_unknown_movie_reviews_leave_nothing_in_cache(self):
+        movie_ids = [uuid.uuid4() for _ in range(50)]
+        for movie_id in movie_ids:
+            response = self.client.get(f"/api/movies/{movie_id}/reviews/")
+            self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+        msg = "\nVerifique se ids inexistentes não criam versões no cache"
+        cache = get_response_cache()
+        for movie_id in movie_ids:
+            self.assertIsNone(cache.get(f"version:reviews:{movie_id}"), msg)
+
+    def test_writes_bump_the_version(self):
+        movies_etag = self.client.get(self.BASE_URL)["ETag"]
+        reviews_etag = self.client.get(self.REVIEWS_URL)["ETag"]
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        review_data = {"stars": 5, "review": "Ótimo"}
+        self.client.post(self.REVIEWS_URL, data=review_data, format="json")
+
+        reviews = self.client.get(self.REVIEWS_URL, HTTP_IF_NONE_MATCH=reviews_etag)
+        movies = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=movies_etag)
+
+        msg = "\nVerifique se um POST de review invalida as listagens em cache"
+        self.assertEqual(status.HTTP_200_OK, reviews.status_code, msg)
+        self.assertEqual(1, len(reviews.json()["results"]), msg)
+        self.assertEqual(status.HTTP_200_OK, movies.status_code, msg)
+        self.assertEqual(1, movies.json()["results"][0]["reviews_count"], msg)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        movie_data = {
+            "title": "Novo",
+            "duration": "01:00:00",
+            "premiere": "2020-01-01",
+            "budget": "1.00",
+            "genres": [{"name": "Drama"}],
+        }
+        self.client.post(self.BASE_URL, data=movie_data, format="json")
+
+        msg = "\nVerifique se um POST de filme invalida a listagem de filmes"
+        self.assertEqual(2, self.client.get(self.BASE_URL).json()["count"], msg)
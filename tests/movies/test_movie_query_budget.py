@@ -0,0 +1,36 @@
+from rest_framework.test import APITestCase
+
+from genres.models import Genre
+from movies.models import Movie
+from tests.factories import create_multiple_movies, create_user_with_token
+from tests.query_budget import QueryBudgetMixin
+
+
+class MovieListQueryBudgetTest(QueryBudgetMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.genres = Genre.objects.bulk_create(
+            [Genre(name="Crime"), Genre(name="Drama")]
+        )
+
+    def _grow(self, quantity: int) -> None:
+        missing = quantity - Movie.objects.count()
+        movies = create_multiple_movies(quantity=missing, user=self.admin)
+
+        through_model = Movie.genres.through
+        through_model.objects.bulk_create(
+            [
+                through_model(movie_id=movie.pk, genre_id=genre.pk)
+                for movie in movies
+                for genre in self.genres
+            ]
+        )
+
+    def test_movie_list_queries_do_not_grow_with_page_size(self):
+        # COUNT, página e prefetch dos gêneros
+        self.assertConstantQueries("/api/movies/", self._grow, budget=3)
+
+    def test_movie_cursor_list_queries_do_not_grow_with_page_size(self):
+        # página e prefetch dos gêneros, sem COUNT
+        self.assertConstantQueries("/api/movies/?cursor=", self._grow, budget=2)
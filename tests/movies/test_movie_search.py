@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from movies.models import Movie
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class MovieSearchTest(APITestCase):
+    """
+    Classe para testar a busca textual da listagem de filmes
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.movie_1, cls.movie_2, cls.movie_3 = create_multiple_movies(3, cls.admin)
+
+        Movie.objects.filter(pk=cls.movie_1.pk).update(
+            title="The Godfather", overview="A saga da família Corleone."
+        )
+        Movie.objects.filter(pk=cls.movie_2.pk).update(
+            title="Goodfellas", overview="Inspirado em The Godfather, só que não."
+        )
+
+    def _search_ids(self, term: str) -> list[str]:
+        response = self.client.get(self.BASE_URL, {"search": term})
+        return [movie["id"] for movie in response.json()["results"]]
+
+    def test_search_ranks_title_matches_first(self):
+        resulted_ids = self._search_ids("godfather")
+
+        expected_ids = [str(self.movie_1.pk), str(self.movie_2.pk)]
+        msg = "\nVerifique se a busca ordena os resultados pela relevância (bm25)"
+        self.assertListEqual(expected_ids, resulted_ids, msg)
+
+    def test_search_by_prefix_and_overview(self):
+        msg = "\nVerifique se a busca aceita prefixos e procura na sinopse"
+        self.assertListEqual([str(self.movie_1.pk)], self._search_ids("corle"), msg)
+
+    def test_search_index_follows_updates_and_deletes(self):
+        movie = Movie.objects.get(pk=self.movie_3.pk)
+        movie.title = "Scarface"
+        movie.save()
+        self.assertListEqual([str(movie.pk)], self._search_ids("scarface"))
+
+        movie.delete()
+        self.assertListEqual([], self._search_ids("scarface"))
+
+    def test_search_ignores_fts_syntax(self):
+        response = self.client.get(self.BASE_URL, {"search": '"god*" OR ('})
+
+        self.assertEqual(200, response.status_code)
+
+    def test_rebuild_movie_search_command(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO movies_movie_fts(movies_movie_fts) VALUES ('delete-all')"
+            )
+        self.assertListEqual([], self._search_ids("godfather"))
+
+        out = StringIO()
+        call_command("rebuild_movie_search", stdout=out)
+
+        self.assertEqual(2, len(self._search_ids("godfather")))
+        self.assertIn("Movie search index rebuilt", out.getvalue())
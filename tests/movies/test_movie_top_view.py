@@ -0,0 +1,104 @@
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.views import status
+
+from genres.models import Genre
+from movies.models import Movie
+from movies.views import MovieTopView
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class MovieTopViewTest(APITestCase):
+    """
+    Classe para testar o ranking de filmes por média bayesiana
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/top/"
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        (
+            cls.single_five,
+            cls.many_fours,
+            cls.many_twos,
+            cls.unrated,
+        ) = create_multiple_movies(quantity=4, user=cls.admin)
+
+        drama, comedy = Genre.objects.bulk_create(
+            [Genre(name="Drama"), Genre(name="Comedy")]
+        )
+        cls.single_five.genres.add(comedy)
+        cls.many_fours.genres.add(drama)
+        cls.many_twos.genres.add(drama)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _review(self, movie: Movie, stars: int, quantity: int = 1) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        for _ in range(quantity):
+            response = self.client.post(
+                f"/api/movies/{movie.pk}/reviews/",
+                data={"stars": stars, "review": "Muito bom"},
+                format="json",
+            )
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.client.credentials()
+
+    def test_top_movies_ranking(self):
+        self._review(self.single_five, 5)
+        self._review(self.many_fours, 4, quantity=20)
+        self._review(self.many_twos, 2, quantity=20)
+
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        msg = "\nVerifique se uma única review 5 não passa à frente de muitas 4"
+        resulted_ids = [movie["id"] for movie in response.json()]
+        expected_ids = [
+            str(self.many_fours.pk),
+            str(self.single_five.pk),
+            str(self.many_twos.pk),
+        ]
+        self.assertListEqual(expected_ids, resulted_ids, msg)
+
+        msg = "\nVerifique se a nota é a média bayesiana das estrelas"
+        # (20 * 4 + 3.0 * 10) / (20 + 10)
+        self.assertAlmostEqual(110 / 30, response.json()[0]["bayesian_score"], 6)
+
+    def test_top_movies_by_genre_and_limit(self):
+        self._review(self.single_five, 5)
+        self._review(self.many_fours, 4, quantity=3)
+        self._review(self.many_twos, 2, quantity=3)
+
+        response = self.client.get(self.BASE_URL + "?genre=Drama&limit=1")
+
+        msg = "\nVerifique se o ranking respeita `genre` e `limit`"
+        resulted_ids = [movie["id"] for movie in response.json()]
+        self.assertListEqual([str(self.many_fours.pk)], resulted_ids, msg)
+
+    def test_invalid_limit(self):
+        for limit in ("0", "101", "abc"):
+            response = self.client.get(self.BASE_URL + f"?limit={limit}")
+
+            with self.subTest(limit=limit):
+                self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_top_movies_read_the_score_index(self):
+        for genre in (None, "Drama"):
+            params = {"genre": genre} if genre else {}
+            view = MovieTopView()
+            view.request = Request(APIRequestFactory().get(self.BASE_URL, params))
+            queryset = view.get_queryset()
+
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = " ".join(row[-1] for row in cursor.fetchall())
+
+            with self.subTest(genre=genre):
+                msg = f"\nVerifique se o ranking lê o índice da nota: {plan}"
+                self.assertIn("movie_bayesian_score_idx", plan, msg)
+                self.assertNotIn("TEMP B-TREE", plan, msg)
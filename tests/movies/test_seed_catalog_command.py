@@ -0,0 +1,93 @@
+from io import StringIO
+
+from django.core.management import base, call_command
+from django.db import transaction
+from django.db.models import Sum
+from django.test import TestCase
+
+from movies.models import Movie
+from reviews.models import CriticStats, Review
+from users.models import User
+
+
+class SeedCatalogCommandTest(TestCase):
+    def _seed(self, **options) -> str:
+        out = StringIO()
+        options = {
+            "users": 10,
+            "movies": 20,
+            "reviews": 100,
+            "chunk_size": 7,
+            **options,
+        }
+        call_command("seed_catalog", stdout=out, **options)
+        return out.getvalue()
+
+    def test_seed_catalog(self):
+        output = self._seed(critic_ratio=0.5)
+
+        msg = "\nVerifique se o catálogo tem as quantidades pedidas"
+        self.assertEqual(10, User.objects.count(), msg)
+        self.assertEqual(20, Movie.objects.count(), msg)
+        self.assertEqual(100, Review.objects.count(), msg)
+        self.assertIn("rows/s", output, msg)
+
+        msg = "\nVerifique se os agregados dos filmes batem com as reviews"
+        for movie in Movie.objects.all():
+            reviews = Review.objects.filter(movie=movie)
+            self.assertEqual(reviews.count(), movie.reviews_count, msg)
+            self.assertEqual(
+                reviews.filter(spoilers=False).count(),
+                movie.spoiler_free_reviews_count,
+                msg,
+            )
+            self.assertEqual(
+                reviews.aggregate(total=Sum("stars"))["total"] or 0,
+                movie.stars_sum,
+                msg,
+            )
+            self.assertTrue(movie.genres.exists(), msg)
+
+        msg = "\nVerifique se as estatísticas dos críticos são reconstruídas"
+        total = CriticStats.objects.aggregate(total=Sum("reviews_count"))["total"]
+        self.assertEqual(100, total, msg)
+        self.assertFalse(Review.objects.exclude(critic__is_critic=True).exists(), msg)
+
+        msg = "\nVerifique se todos os usuários usam a senha informada"
+        admin = User.objects.get(username="seed0_admin")
+        self.assertTrue(admin.is_superuser, msg)
+        self.assertTrue(admin.check_password("1313"), msg)
+        self.assertEqual(1, len(set(User.objects.values_list("password", flat=True))))
+
+    def test_seed_is_deterministic(self):
+        def seeded_ids() -> list:
+            with transaction.atomic():
+                self._seed(seed=42, critic_ratio=0.5)
+                ids = list(Review.objects.order_by("id").values_list("id", flat=True))
+                transaction.set_rollback(True)
+            return ids
+
+        msg = "\nVerifique se a mesma semente gera os mesmos dados"
+        self.assertListEqual(seeded_ids(), seeded_ids(), msg)
+
+    def test_seed_twice_with_same_seed(self):
+        self._seed(movies=0, reviews=0)
+
+        with self.assertRaisesMessage(base.CommandError, "Use another `--seed`"):
+            self._seed(movies=0, reviews=0)
+
+    def test_seed_movies_after_users_only_run(self):
+        self._seed(movies=0, reviews=0)
+        self._seed(users=0, movies=5, reviews=0)
+
+        msg = "\nVerifique se `--users 0` não recusa uma semente já usada"
+        self.assertEqual(5, Movie.objects.count(), msg)
+
+        msg = "\nVerifique se filmes já gerados pela semente viram CommandError"
+        with self.assertRaisesMessage(base.CommandError, "Use another `--seed`"):
+            self._seed(users=0, movies=5, reviews=0)
+        self.assertEqual(5, Movie.objects.count(), msg)
+
+    def test_reviews_require_critics(self):
+        with self.assertRaisesMessage(base.CommandError, "No critic found"):
+            self._seed(users=1, critic_ratio=0)
@@ -0,0 +1,108 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import (
+    create_genre_by_name,
+    create_multiple_movies,
+    create_multiple_reviews,
+    create_user_with_token,
+)
+
+
+class SparseFieldsTest(APITestCase):
+    """
+    Classe para testar `?fields=` e `?expand=` nas listagens
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        cls.critic, _ = create_user_with_token(is_critic=True)
+        (cls.movie,) = create_multiple_movies(quantity=1, user=cls.admin)
+        cls.movie.genres.add(create_genre_by_name("Drama"))
+        create_multiple_reviews(2, movie=cls.movie, critic=cls.critic)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _get(self, url: str, params: dict) -> tuple[dict, list[str]]:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+
+        return response.json(), [query["sql"] for query in queries.captured_queries]
+
+    def test_movie_fields_shrink_json_and_sql(self):
+        data, queries = self._get("/api/movies/", {"fields": "id,title,premiere"})
+
+        msg = "\nVerifique se `?fields=` devolve apenas os campos pedidos"
+        expected_keys = {"id", "title", "premiere"}
+        self.assertSetEqual(expected_keys, set(data["results"][0]), msg)
+
+        msg = "\nVerifique se `?fields=` evita colunas e prefetches desnecessários"
+        select = next(sql for sql in queries if '"movies_movie"."title"' in sql)
+        self.assertNotIn('"overview"', select, msg)
+        self.assertNotIn('"budget"', select, msg)
+        self.assertFalse(any("genres_genre" in sql for sql in queries), msg)
+
+    def test_movie_expand_genres(self):
+        data, queries = self._get(
+            "/api/movies/", {"fields": "id,average_stars", "expand": "genres"}
+        )
+
+        movie = data["results"][0]
+        self.assertSetEqual({"id", "average_stars", "genres"}, set(movie))
+        self.assertEqual("Drama", movie["genres"][0]["name"])
+
+    def test_review_fields_skip_critic_join(self):
+        url = f"/api/movies/{self.movie.pk}/reviews/"
+
+        data, queries = self._get(url, {"fields": "id,stars"})
+        self.assertSetEqual({"id", "stars"}, set(data["results"][0]))
+        self.assertFalse(any("users_user" in sql for sql in queries))
+
+        data, queries = self._get(url, {"fields": "id", "expand": "critic"})
+        expected_critic = {
+            "id": str(self.critic.pk),
+            "first_name": self.critic.first_name,
+            "last_name": self.critic.last_name,
+        }
+        self.assertDictEqual(expected_critic, data["results"][0]["critic"])
+        join = next(sql for sql in queries if "users_user" in sql)
+        self.assertNotIn('"password"', join)
+
+    def test_user_fields(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        data, queries = self._get("/api/users/", {"fields": "id,username"})
+
+        self.assertSetEqual({"id", "username"}, set(data["results"][0]))
+        # A primeira query de usuários é a autenticação do admin
+        select = next(
+            sql
+            for sql in queries
+            if '"users_user"."username"' in sql and "ORDER BY" in sql
+        )
+        self.assertNotIn('"email"', select)
+
+    def test_unknown_fields(self):
+        response = self.client.get(
+            "/api/movies/", {"fields": "id,password", "expand": "critic"}
+        )
+
+        expected_data = {
+            "fields": ["Unknown fields: password."],
+            "expand": ["Unknown relations: critic."],
+        }
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(expected_data, response.json())
+
+    def test_write_only_fields_are_unknown(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+        response = self.client.get("/api/users/", {"fields": "id,password"})
+
+        msg = "\nVerifique se campos write-only não podem ser pedidos em `?fields=`"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertDictEqual(
+            {"fields": ["Unknown fields: password."]}, response.json(), msg
+        )
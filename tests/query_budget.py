@@ -0,0 +1,55 @@
+from typing import Callable
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.pagination import PageNumberPagination
+
+from _core.cache import get_response_cache
+from _core.pagination import KeysetPagination
+
+
+class QueryBudgetMixin:
+    """
+    Mixin para APITestCase que garante que uma listagem roda um número
+    constante de queries, não importa quantas linhas a página tenha.
+    """
+
+    def count_list_queries(self, url: str, page_size: int) -> int:
+        # Aquece os caches do processo (ex.: o filtro de ids de filmes) fora
+        # da contagem; já o cache de respostas serviria a chamada sem query
+        self.client.get(url)
+        get_response_cache().clear()
+
+        with (
+            patch.object(PageNumberPagination, "page_size", page_size),
+            patch.object(KeysetPagination, "page_size", page_size),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            response = self.client.get(url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(page_size, len(response.json()["results"]))
+
+        return len(queries.captured_queries)
+
+    def assertConstantQueries(
+        self,
+        url: str,
+        grow: Callable[[int], None],
+        budget: int,
+        page_sizes: tuple[int, ...] = (4, 400),
+    ) -> None:
+        """
+        Para cada tamanho de página, `grow(n)` deve deixar ao menos `n` linhas
+        na listagem. Falha se a contagem de queries variar entre os tamanhos
+        ou passar de `budget`.
+        """
+        counts = {}
+        for page_size in page_sizes:
+            grow(page_size)
+            counts[page_size] = self.count_list_queries(url, page_size)
+
+        msg = f"\nQueries por tamanho de página em `{url}`: {counts}"
+        self.assertEqual(1, len(set(counts.values())), msg)
+        self.assertLessEqual(max(counts.values()), budget, msg)
@@ -0,0 +1,164 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from reviews.models import CriticStats
+from tests.factories import (
+    create_multiple_movies,
+    create_multiple_reviews,
+    create_user_with_token,
+)
+
+
+class CriticStatsTest(APITestCase):
+    """
+    Classe para testar o ranking de críticos e as estatísticas por usuário
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        cls.critics = [create_user_with_token(is_critic=True) for _ in range(3)]
+        cls.movie_1, cls.movie_2 = create_multiple_movies(quantity=2, user=cls.admin)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _review(self, token: str, stars: int, movie=None) -> None:
+        movie = movie or self.movie_1
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        response = self.client.post(
+            f"/api/movies/{movie.pk}/reviews/",
+            data={"stars": stars, "review": "Muito bom"},
+            format="json",
+        )
+        self.client.credentials()
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def _populate(self) -> None:
+        (_, token_1), (_, token_2), (_, token_3) = self.critics
+        for stars in (2, 3, 4):
+            self._review(token_1, stars)
+        for stars in (5, 5):
+            self._review(token_2, stars)
+        self._review(token_3, 1)
+        # Reviews de admins não entram no ranking de críticos
+        self._review(self.admin_token, 5, self.movie_2)
+
+    def test_leaderboard_by_reviews_count(self):
+        self._populate()
+        response = self.client.get("/api/critics/")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        resulted_data = response.json()["results"]
+
+        msg = "\nVerifique se o ranking padrão ordena por volume de reviews"
+        expected = [
+            (str(self.critics[0][0].pk), 3, 3.0),
+            (str(self.critics[1][0].pk), 2, 5.0),
+            (str(self.critics[2][0].pk), 1, 1.0),
+        ]
+        resulted = [
+            (item["critic"]["id"], item["reviews_count"], item["average_stars"])
+            for item in resulted_data
+        ]
+        self.assertListEqual(expected, resulted, msg)
+        self.assertDictEqual(
+            {"1": 0, "2": 1, "3": 1, "4": 1, "5": 0},
+            resulted_data[0]["stars_histogram"],
+            msg,
+        )
+
+    def test_leaderboard_by_average_stars_pages(self):
+        self._populate()
+
+        response = self.client.get("/api/critics/?ordering=average_stars&cursor=")
+        first_page = response.json()
+
+        msg = "\nVerifique se o ranking por média ordena pela média de estrelas"
+        self.assertEqual(
+            str(self.critics[1][0].pk), first_page["results"][0]["critic"]["id"], msg
+        )
+
+        ids = []
+        url = "/api/critics/?ordering=average_stars"
+        while url:
+            page = self.client.get(url).json()
+            ids.extend(item["critic"]["id"] for item in page["results"])
+            url = page["next"]
+
+        msg = "\nVerifique se a paginação do ranking percorre todos os críticos"
+        self.assertEqual(3, len(set(ids)), msg)
+
+    def test_leaderboard_invalid_ordering(self):
+        response = self.client.get("/api/critics/?ordering=username")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_leaderboard_reads_are_index_ordered(self):
+        queryset = CriticStats.objects.filter(critic__is_critic=True).order_by(
+            "-reviews_count", "-average_stars", "critic_id"
+        )[:5]
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+
+        msg = f"\nVerifique se o ranking lê o índice sem ordenar em memória: {plan}"
+        self.assertIn("critic_stats_volume_idx", plan, msg)
+        self.assertNotIn("TEMP B-TREE", plan, msg)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/critics/")
+
+        msg = "\nVerifique se o ranking não agrega a tabela de reviews"
+        self.assertEqual(1, len(queries), msg)
+        self.assertNotIn("reviews_review", queries[0]["sql"], msg)
+
+    def test_user_review_stats(self):
+        self._populate()
+        critic = self.critics[0][0]
+
+        response = self.client.get(f"/api/users/{critic.pk}/reviews/stats/")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        expected_data = {
+            "critic": {
+                "id": str(critic.pk),
+                "first_name": critic.first_name,
+                "last_name": critic.last_name,
+            },
+            "reviews_count": 3,
+            "average_stars": 3.0,
+            "stars_histogram": {"1": 0, "2": 1, "3": 1, "4": 1, "5": 0},
+        }
+        self.assertDictEqual(expected_data, response.json())
+
+        msg = "\nVerifique se usuários sem reviews recebem estatísticas zeradas"
+        user, _ = create_user_with_token()
+        response = self.client.get(f"/api/users/{user.pk}/reviews/stats/")
+        self.assertIsNone(response.json()["average_stars"], msg)
+        self.assertEqual(0, response.json()["reviews_count"], msg)
+
+        response = self.client.get(
+            "/api/users/5b7c7f80-820c-4594-9251-4b14fa3102c4/reviews/stats/"
+        )
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_rebuild_critic_stats_command(self):
+        self._populate()
+        critic = self.critics[0][0]
+        create_multiple_reviews(quantity=2, movie=self.movie_2, critic=critic)
+
+        out = StringIO()
+        call_command("rebuild_critic_stats", batch_size=1, stdout=out)
+
+        msg = "\nVerifique se o rebuild reconstrói as estatísticas dos críticos"
+        self.assertIn("Review stats rebuilt for 4 critics.", out.getvalue(), msg)
+        stats = CriticStats.objects.get(pk=critic.pk)
+        self.assertEqual(5, stats.reviews_count, msg)
+        self.assertEqual(stats.stars_sum / 5, stats.average_stars, msg)
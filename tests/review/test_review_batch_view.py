@@ -0,0 +1,99 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from movies.id_filter import movie_id_filter
+from movies.models import Movie
+from reviews.models import Review
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class ReviewBatchViewTest(APITestCase):
+    """
+    Classe para testar a criação de reviews em lote
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/reviews/batch/"
+        admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        _, cls.non_critic_token = create_user_with_token()
+        cls.movie_1, cls.movie_2 = create_multiple_movies(quantity=2, user=admin)
+        cls.NO_MOVIE_UUID = "5b7c7f80-820c-4594-9251-4b14fa3102c4"
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _item(self, movie: Movie, stars: int = 4) -> dict:
+        return {"movie_id": str(movie.pk), "stars": stars, "review": "Muito bom"}
+
+    def _post(self, data, token: str = None):
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + (token or self.critic_token)
+        )
+        return self.client.post(self.BASE_URL, data=data, format="json")
+
+    def test_batch_creation_without_critic_token(self):
+        response = self.client.post(self.BASE_URL, data=[], format="json")
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+        response = self._post([], token=self.non_critic_token)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_batch_creation(self):
+        data = [self._item(self.movie_1, 5), self._item(self.movie_2, 3)]
+        response = self._post(data)
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        resulted_data = response.json()
+        expected_critic = {
+            "id": str(self.critic.pk),
+            "first_name": self.critic.first_name,
+            "last_name": self.critic.last_name,
+        }
+        self.assertEqual(2, len(resulted_data))
+        self.assertDictEqual(expected_critic, resulted_data[0]["critic"])
+        self.assertEqual(str(self.movie_2.pk), resulted_data[1]["movie_id"])
+        self.assertFalse(resulted_data[1]["spoilers"])
+
+        msg = "\nVerifique se os agregados dos filmes são atualizados pelo lote"
+        self.assertEqual(5, Movie.objects.get(pk=self.movie_1.pk).stars_sum, msg)
+        self.assertEqual(1, Movie.objects.get(pk=self.movie_2.pk).reviews_count, msg)
+
+    def test_batch_creation_returns_errors_per_item(self):
+        data = [
+            self._item(self.movie_1),
+            {"movie_id": self.NO_MOVIE_UUID, "stars": 4, "review": "Bom"},
+            {"movie_id": str(self.movie_2.pk), "stars": 9},
+        ]
+        response = self._post(data)
+
+        expected_data = [
+            {},
+            {"movie_id": ["Not found."]},
+            {
+                "stars": ["Ensure this value is less than or equal to 5."],
+                "review": ["This field is required."],
+            },
+        ]
+        msg = "\nVerifique se os erros do lote vêm por item e nada é gravado"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertListEqual(expected_data, response.json(), msg)
+        self.assertEqual(0, Review.objects.count(), msg)
+
+    def test_batch_creation_queries_do_not_grow_with_items(self):
+        # Carrega o filtro de ids de filmes fora da contagem
+        movie_id_filter.warm()
+
+        query_counts = []
+        for quantity in (2, 50):
+            with CaptureQueriesContext(connection) as queries:
+                response = self._post([self._item(self.movie_1)] * quantity)
+
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+            query_counts.append(len(queries.captured_queries))
+
+        msg = "\nVerifique se o lote resolve filmes e insere reviews em lote"
+        self.assertEqual(query_counts[0], query_counts[1], msg)
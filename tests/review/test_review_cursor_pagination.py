@@ -0,0 +1,71 @@
+import base64
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import (
+    create_multiple_movies,
+    create_multiple_reviews,
+    create_user_with_token,
+)
+
+
+class ReviewCursorPaginationTest(APITestCase):
+    """
+    Classe para testar a paginação por cursor da listagem de reviews
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        critic, _ = create_user_with_token(is_critic=True)
+        cls.movie, other_movie = create_multiple_movies(quantity=2, user=admin)
+        cls.reviews = create_multiple_reviews(9, movie=cls.movie, critic=critic)
+        create_multiple_reviews(3, movie=other_movie, critic=critic)
+        cls.BASE_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+
+    def test_cursor_walks_every_review_of_the_movie(self):
+        response = self.client.get(self.BASE_URL, {"cursor": ""})
+        ids = []
+        while True:
+            resulted_data = response.json()
+            self.assertNotIn("count", resulted_data)
+            ids.extend(review["id"] for review in resulted_data["results"])
+            if not resulted_data["next"]:
+                break
+            response = self.client.get(resulted_data["next"])
+
+        msg = "\nVerifique se o cursor percorre todas as reviews do filme uma vez"
+        expected_ids = {str(review.pk) for review in self.reviews}
+        self.assertEqual(len(expected_ids), len(ids), msg)
+        self.assertSetEqual(expected_ids, set(ids), msg)
+
+    def test_cursor_page_uses_the_covering_index(self):
+        first_page = self.client.get(self.BASE_URL, {"cursor": ""}).json()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(first_page["next"])
+
+        page_query = next(
+            query["sql"] for query in queries if "reviews_review" in query["sql"]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {page_query}")
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+
+        msg = f"\nVerifique se a página usa o índice (movie, created_at, id): {plan}"
+        self.assertIn("review_movie_created_id_idx", plan, msg)
+        self.assertNotIn("TEMP B-TREE", plan, msg)
+        self.assertNotIn("COUNT(", page_query.upper(), msg)
+
+    def test_tampered_cursor(self):
+        payload = json.dumps({"p": ["2020-01-01T00:00:00+00:00", "notauuid"], "r": 0})
+        cursor = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+
+        response = self.client.get(self.BASE_URL, {"cursor": cursor})
+
+        msg = "\nVerifique se um cursor com valores inválidos retorna 404"
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg)
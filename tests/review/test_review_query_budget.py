@@ -0,0 +1,33 @@
+from rest_framework.test import APITestCase
+
+from reviews.models import Review
+from tests.factories import (
+    create_multiple_critic_users,
+    create_multiple_movies,
+    create_multiple_reviews,
+    create_user_with_token,
+)
+from tests.query_budget import QueryBudgetMixin
+
+
+class ReviewListQueryBudgetTest(QueryBudgetMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        (cls.movie,) = create_multiple_movies(quantity=1, user=cls.admin)
+        cls.critics = create_multiple_critic_users(quantity=4)
+        cls.BASE_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+
+    def _grow(self, quantity: int) -> None:
+        missing = quantity - Review.objects.filter(movie=self.movie).count()
+        per_critic = -(-missing // len(self.critics))
+        for critic in self.critics:
+            create_multiple_reviews(per_critic, movie=self.movie, critic=critic)
+
+    def test_review_list_queries_do_not_grow_with_page_size(self):
+        # filme, COUNT e página com o join do crítico
+        self.assertConstantQueries(self.BASE_URL, self._grow, budget=3)
+
+    def test_review_cursor_list_queries_do_not_grow_with_page_size(self):
+        # filme e página com o join do crítico, sem COUNT
+        self.assertConstantQueries(f"{self.BASE_URL}?cursor=", self._grow, budget=2)
@@ -0,0 +1,100 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from movies.models import Movie
+from reviews.models import Review
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class ReviewSpoilerFilterTest(APITestCase):
+    """
+    Classe para testar a listagem de reviews sem spoilers (`?spoilers=false`)
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        cls.movie_1, cls.movie_2 = create_multiple_movies(quantity=2, user=admin)
+        cls.BASE_URL = f"/api/movies/{cls.movie_1.pk}/reviews/"
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _create_reviews(self, spoilers: list[bool]) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        for value in spoilers:
+            data = {"stars": 3, "review": "Muito bom", "spoilers": value}
+            response = self.client.post(self.BASE_URL, data=data, format="json")
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.client.credentials()
+
+    def test_spoiler_free_listing(self):
+        self._create_reviews([False, True, False, True, False, False, False])
+
+        response = self.client.get(self.BASE_URL + "?spoilers=false")
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        msg = "\nVerifique se `spoilers=false` retorna apenas reviews sem spoilers"
+        resulted_data = response.json()
+        self.assertEqual(5, resulted_data["count"], msg)
+        self.assertEqual(4, len(resulted_data["results"]), msg)
+        self.assertFalse(
+            any(review["spoilers"] for review in resulted_data["results"]), msg
+        )
+
+        response = self.client.get(self.BASE_URL + "?spoilers=true")
+        resulted_data = response.json()
+        msg = "\nVerifique se `spoilers=true` retorna apenas reviews com spoilers"
+        self.assertEqual(2, resulted_data["count"], msg)
+        self.assertTrue(
+            all(review["spoilers"] for review in resulted_data["results"]), msg
+        )
+
+    def test_spoiler_free_listing_without_count_query(self):
+        self._create_reviews([False, True, False])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.BASE_URL + "?spoilers=false")
+
+        msg = "\nVerifique se o `count` vem do agregado do filme, sem COUNT"
+        self.assertEqual(2, response.json()["count"], msg)
+        counts = [q["sql"] for q in queries if "COUNT(" in q["sql"].upper()]
+        self.assertListEqual([], counts, msg)
+
+    def test_spoiler_free_listing_uses_partial_index(self):
+        queryset = Review.objects.filter(movie=self.movie_1, spoilers=False).order_by(
+            "created_at", "id"
+        )[:4]
+
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+
+        msg = f"\nVerifique se a listagem usa o índice parcial: {plan}"
+        self.assertIn("review_spoiler_free_idx", plan, msg)
+        self.assertNotIn("TEMP B-TREE", plan, msg)
+
+    def test_invalid_spoilers_param(self):
+        response = self.client.get(self.BASE_URL + "?spoilers=maybe")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(
+            {"spoilers": ["Must be `true` or `false`."]}, response.json()
+        )
+
+    def test_rebuild_review_stats_counts_spoiler_free_reviews(self):
+        self._create_reviews([False, True, False])
+        Movie.objects.update(spoiler_free_reviews_count=0)
+
+        call_command("rebuild_review_stats", stdout=StringIO())
+
+        msg = "\nVerifique se o rebuild reconstrói o total de reviews sem spoilers"
+        self.movie_1.refresh_from_db()
+        self.assertEqual(2, self.movie_1.spoiler_free_reviews_count, msg)
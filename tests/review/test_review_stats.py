@@ -0,0 +1,76 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from movies.models import Movie
+from tests.factories import (
+    create_multiple_movies,
+    create_multiple_reviews,
+    create_user_with_token,
+)
+
+
+class ReviewStatsTest(APITestCase):
+    """
+    Classe para testar os agregados de reviews mantidos em cada filme
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        cls.movie, cls.other_movie = create_multiple_movies(quantity=2, user=cls.admin)
+        cls.REVIEWS_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+        cls.DETAIL_URL = f"/api/movies/{cls.movie.pk}/"
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _post_review(self, stars: int) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        review_data = {"stars": stars, "review": "Uma review"}
+        self.client.post(self.REVIEWS_URL, data=review_data, format="json")
+
+    def test_stats_are_updated_on_review_creation(self):
+        for stars in (5, 4, 4):
+            self._post_review(stars)
+
+        resulted_data = self.client.get(self.DETAIL_URL).json()
+
+        msg = "\nVerifique se os agregados de reviews são atualizados a cada POST"
+        self.assertEqual(3, resulted_data["reviews_count"], msg)
+        self.assertEqual(4.33, resulted_data["average_stars"], msg)
+        expected_histogram = {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}
+        self.assertDictEqual(expected_histogram, resulted_data["stars_histogram"], msg)
+
+    def test_stats_in_movie_listing(self):
+        self._post_review(3)
+
+        results = self.client.get("/api/movies/").json()["results"]
+        stats = {
+            movie["id"]: (movie["reviews_count"], movie["average_stars"])
+            for movie in results
+        }
+
+        msg = "\nVerifique se os agregados aparecem na listagem de filmes"
+        self.assertEqual((1, 3.0), stats[str(self.movie.pk)], msg)
+        self.assertEqual((0, None), stats[str(self.other_movie.pk)], msg)
+
+    def test_rebuild_review_stats_command(self):
+        # bulk_create não passa pela view, então os agregados ficam defasados
+        reviews = create_multiple_reviews(4, movie=self.movie, critic=self.critic)
+        self._post_review(1)
+        Movie.objects.filter(pk=self.other_movie.pk).update(reviews_count=7)
+
+        out = StringIO()
+        call_command("rebuild_review_stats", batch_size=1, stdout=out)
+
+        movie = Movie.objects.get(pk=self.movie.pk)
+        all_stars = [review.stars for review in reviews] + [1]
+        msg = "\nVerifique se o comando reconstrói os agregados a partir das reviews"
+        self.assertEqual(5, movie.reviews_count, msg)
+        self.assertEqual(sum(all_stars), movie.stars_sum, msg)
+        self.assertEqual(all_stars.count(1), movie.stars_1, msg)
+        self.assertEqual(0, Movie.objects.get(pk=self.other_movie.pk).reviews_count)
+        self.assertIn("Review stats rebuilt for 1 movies.", out.getvalue())
@@ -0,0 +1,170 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from movies.models import Movie
+from reviews.models import Review
+from reviews.queue import ReviewFlusher, ReviewQueue
+from tests.factories import create_multiple_movies, create_user_with_token
+
+
+class ReviewWriteBehindTest(APITestCase):
+    """
+    Classe para testar a ingestão write-behind de reviews (202 + fila durável)
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin, _ = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        cls.movie_1, cls.movie_2 = create_multiple_movies(quantity=2, user=admin)
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.journal = Path(directory.name) / "queue.sqlite3"
+
+        write_behind = override_settings(
+            REVIEW_WRITE_BEHIND={
+                **settings.REVIEW_WRITE_BEHIND,
+                "ENABLED": True,
+                "JOURNAL": self.journal,
+                "BACKGROUND_FLUSHER": False,
+            }
+        )
+        write_behind.enable()
+        self.addCleanup(write_behind.disable)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+
+    def _post(self, movie: Movie, stars: int = 4):
+        return self.client.post(
+            f"/api/movies/{movie.pk}/reviews/",
+            data={"stars": stars, "review": "Muito bom"},
+            format="json",
+        )
+
+    def test_review_is_queued_with_202(self):
+        response = self._post(self.movie_1, 5)
+
+        msg = "\nVerifique se o POST no modo write-behind retorna 202"
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code, msg)
+
+        msg = "\nVerifique se a resposta já traz o id definitivo da review"
+        resulted_data = response.json()
+        self.assertIn("id", resulted_data, msg)
+        self.assertEqual(str(self.movie_1.pk), resulted_data["movie_id"], msg)
+
+        msg = "\nVerifique se a review fica só na fila até o flush"
+        self.assertFalse(Review.objects.exists(), msg)
+        self.assertEqual(1, ReviewQueue(self.journal).stats()["depth"], msg)
+
+        ReviewQueue(self.journal).drain(batch_size=100)
+
+        msg = "\nVerifique se o flush grava a review com o id retornado no 202"
+        review = Review.objects.get()
+        self.assertEqual(resulted_data["id"], str(review.pk), msg)
+
+        msg = "\nVerifique se o flush atualiza os agregados do filme"
+        self.movie_1.refresh_from_db()
+        self.assertEqual(1, self.movie_1.reviews_count, msg)
+        self.assertEqual(5, self.movie_1.stars_sum, msg)
+
+    def test_invalid_review_is_not_queued(self):
+        response = self._post(self.movie_1, 6)
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        response = self.client.post(
+            "/api/movies/5b7c7f80-820c-4594-9251-4b14fa3102c4/reviews/",
+            data={"stars": 4, "review": "Muito bom"},
+            format="json",
+        )
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+        msg = "\nVerifique se requisições inválidas não entram na fila"
+        self.assertEqual(0, ReviewQueue(self.journal).stats()["depth"], msg)
+
+    def test_flush_is_idempotent(self):
+        for stars in (1, 2, 3):
+            self._post(self.movie_1, stars)
+        self._post(self.movie_2, 4)
+
+        queue = ReviewQueue(self.journal)
+        entries = queue.peek(10)
+        # Simula uma queda entre o commit no banco e o ack no journal
+        Review.objects.bulk_create([entries[0][1]])
+        Movie.objects.record_reviews([entries[0][1]])
+
+        result = queue.drain(batch_size=2)
+
+        msg = "\nVerifique se o flush não grava de novo reviews já persistidas"
+        self.assertEqual(4, result.items, msg)
+        self.assertEqual(3, result.inserted, msg)
+        self.assertEqual(4, Review.objects.count(), msg)
+        self.movie_1.refresh_from_db()
+        self.assertEqual(3, self.movie_1.reviews_count, msg)
+        self.assertEqual(6, self.movie_1.stars_sum, msg)
+
+        msg = "\nVerifique se as métricas registram a fila vazia e os flushes"
+        stats = queue.stats()
+        self.assertEqual(0, stats["depth"], msg)
+        self.assertEqual(4, stats["flushed_items"], msg)
+        self.assertEqual(2, stats["flushes"], msg)
+
+    def test_review_of_deleted_critic_does_not_stick(self):
+        other_critic, other_token = create_user_with_token(is_critic=True)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + other_token)
+        self._post(self.movie_1, 1)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.critic_token)
+        self._post(self.movie_1, 5)
+        self._post(self.movie_2, 4)
+        other_critic.delete()
+
+        queue = ReviewQueue(self.journal)
+        result = queue.drain(batch_size=100)
+
+        msg = "\nVerifique se a review de um crítico removido é descartada"
+        self.assertEqual(3, result.items, msg)
+        self.assertEqual(2, result.inserted, msg)
+        self.assertEqual(0, queue.stats()["depth"], msg)
+        self.movie_1.refresh_from_db()
+        self.assertEqual(1, self.movie_1.reviews_count, msg)
+        self.assertEqual(5, self.movie_1.stars_sum, msg)
+
+    def test_flusher_logs_failed_flushes(self):
+        flusher = ReviewFlusher(ReviewQueue(self.journal), batch_size=10, interval=0)
+
+        def failing_drain(batch_size: int):
+            flusher.stop()
+            raise RuntimeError("banco indisponível")
+
+        flusher.queue.drain = failing_drain
+
+        msg = "\nVerifique se o flusher registra no log os flushes que falham"
+        with self.assertLogs("reviews.queue", level="ERROR") as logs:
+            flusher.run()
+        self.assertIn("banco indisponível", "\n".join(logs.output), msg)
+
+    def test_review_queue_command(self):
+        self._post(self.movie_1)
+        self._post(self.movie_2)
+
+        out = StringIO()
+        call_command("review_queue", "stats", stdout=out)
+        self.assertIn('"depth": 2', out.getvalue())
+
+        out = StringIO()
+        call_command("review_queue", "drain", stdout=out)
+
+        msg = "\nVerifique se o comando `drain` esvazia a fila no banco"
+        self.assertIn("2 queued reviews flushed, 2 inserted", out.getvalue(), msg)
+        self.assertEqual(2, Review.objects.count(), msg)
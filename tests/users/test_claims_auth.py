@@ -0,0 +1,101 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from reviews.models import Review
+from tests.factories import create_multiple_movies, create_user_with_token
+from users.tokens import ClaimsRefreshToken
+
+
+@override_settings(JWT_CLAIMS_AUTH={"ENABLED": True})
+class ClaimsAuthenticationTest(APITestCase):
+    """
+    Classe para testar a autenticação pelas claims do access token
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        cls.critic, cls.critic_token = create_user_with_token(is_critic=True)
+        cls.user, cls.user_token = create_user_with_token()
+        (cls.movie,) = create_multiple_movies(quantity=1, user=cls.admin)
+        cls.MOVIES_URL = "/api/movies/"
+        cls.REVIEWS_URL = f"/api/movies/{cls.movie.pk}/reviews/"
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _post(self, url: str, token: str, data: dict):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        return self.client.post(url, data=data, format="json")
+
+    def test_token_carries_user_claims(self):
+        access = ClaimsRefreshToken.for_user(self.critic).access_token
+
+        msg = "\nVerifique se o access token traz as flags e o updated_at do usuário"
+        self.assertTrue(access["is_critic"], msg)
+        self.assertFalse(access["is_superuser"], msg)
+        self.assertEqual(self.critic.updated_at.isoformat(), access["updated_at"], msg)
+
+    def test_login_issues_token_with_claims(self):
+        self.critic.set_password("1313")
+        self.critic.save()
+        data = {"username": self.critic.username, "password": "1313"}
+
+        response = self.client.post("/api/login/", data=data, format="json")
+
+        msg = "\nVerifique se o login emite tokens com as claims do usuário"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self._post(self.REVIEWS_URL, response.json()["access"], {})
+        with self.assertNumQueries(0, msg=msg):
+            response = self._post(self.REVIEWS_URL, response.json()["access"], {})
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+
+    def test_movie_permissions_without_queries(self):
+        msg = "\nVerifique se a permissão de admin em filmes não consulta o banco"
+        with self.assertNumQueries(0, msg=msg):
+            response = self._post(self.MOVIES_URL, self.critic_token, {})
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code, msg)
+
+        with self.assertNumQueries(0, msg=msg):
+            response = self._post(self.MOVIES_URL, self.admin_token, {})
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+
+    def test_review_permissions_without_queries(self):
+        # Carrega o filtro de ids de filmes fora da contagem
+        self.client.get(self.REVIEWS_URL)
+
+        msg = "\nVerifique se a permissão de crítico em reviews não consulta o banco"
+        with self.assertNumQueries(0, msg=msg):
+            response = self._post(self.REVIEWS_URL, self.user_token, {})
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code, msg)
+
+        for token in (self.critic_token, self.admin_token):
+            with self.assertNumQueries(0, msg=msg):
+                response = self._post(self.REVIEWS_URL, token, {})
+            self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+
+    def test_review_creation_with_claims_user(self):
+        data = {"stars": 4, "review": "Muito bom"}
+        response = self._post(self.REVIEWS_URL, self.critic_token, data)
+
+        msg = "\nVerifique se a review é gravada com o crítico do token"
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code, msg)
+        self.assertEqual(str(self.critic.pk), response.json()["critic"]["id"], msg)
+        self.assertEqual(self.critic.pk, Review.objects.get().critic_id, msg)
+
+    def test_token_without_claims_falls_back_to_database(self):
+        token = str(RefreshToken.for_user(self.critic).access_token)
+
+        msg = "\nVerifique se tokens sem as claims seguem carregando o usuário"
+        with self.assertNumQueries(1, msg=msg):
+            response = self._post(self.REVIEWS_URL, token, {})
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+
+    @override_settings(JWT_CLAIMS_AUTH={"ENABLED": False})
+    def test_disabled_mode_loads_user_from_database(self):
+        msg = "\nVerifique se, desligado, o modo por claims carrega o usuário do banco"
+        with self.assertNumQueries(1, msg=msg):
+            response = self._post(self.MOVIES_URL, self.critic_token, {})
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code, msg)
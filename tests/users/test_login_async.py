@@ -0,0 +1,133 @@
+import threading
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tests.factories import create_user_with_token
+from users.login import get_password_check_pool
+from users.models import User
+
+
+@override_settings(LOGIN={**settings.LOGIN, "MAX_ATTEMPTS": 3, "WINDOW": 300})
+class LoginAsyncViewTest(APITestCase):
+    """
+    Classe para testar o limite de tentativas e o pool do login assíncrono
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/login/"
+        cls.user, _ = create_user_with_token(
+            {
+                "username": "lucira_buster",
+                "email": "lucira_buster@kenziebuster.com",
+                "first_name": "Lucira",
+                "last_name": "Buster",
+                "password": "1313",
+            }
+        )
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _login(self, password: str, username: str = "lucira_buster"):
+        data = {"username": username, "password": password}
+        return self.client.post(self.BASE_URL, data=data, format="json")
+
+    def test_login_returns_token_for_the_user(self):
+        response = self._login("1313")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        msg = "\nVerifique se o access token pertence ao usuário logado"
+        token = AccessToken(response.json()["access"])
+        self.assertEqual(str(self.user.pk), token["user_id"], msg)
+
+    def test_login_accepts_form_data(self):
+        data = {"username": "lucira_buster", "password": "1313"}
+        response = self.client.post(self.BASE_URL, data=data)
+
+        msg = "\nVerifique se o login aceita também dados de formulário"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+
+    def test_login_with_blank_fields(self):
+        response = self._login("", username="")
+
+        expected_data = {
+            "username": ["This field may not be blank."],
+            "password": ["This field may not be blank."],
+        }
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(expected_data, response.json())
+
+    def test_login_with_inactive_user(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self._login("1313")
+
+        msg = "\nVerifique se um usuário inativo não consegue logar"
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+    def test_too_many_attempts_are_refused(self):
+        for _ in range(3):
+            response = self._login("errada")
+            self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+        response = self._login("1313")
+
+        msg = "\nVerifique se o login é recusado ao passar do limite de tentativas"
+        self.assertEqual(status.HTTP_429_TOO_MANY_REQUESTS, response.status_code, msg)
+        self.assertGreater(int(response["Retry-After"]), 0, msg)
+
+        msg = "\nVerifique se o limite é por username"
+        response = self._login("errada", username="outro_usuario")
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+    def test_successful_login_resets_attempts(self):
+        for _ in range(2):
+            self._login("errada")
+        self.assertEqual(status.HTTP_200_OK, self._login("1313").status_code)
+
+        for _ in range(2):
+            response = self._login("errada")
+
+        msg = "\nVerifique se um login bem-sucedido zera as tentativas"
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+    def test_login_refused_when_pool_is_full(self):
+        pool = get_password_check_pool()
+
+        with mock.patch.object(pool, "pending", pool.max_pending):
+            response = self._login("1313")
+
+        msg = "\nVerifique se o login responde 503 com o pool de checagem cheio"
+        self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE, response.status_code, msg)
+        self.assertEqual(0, pool.pending, msg)
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ]
+    )
+    def test_login_upgrades_outdated_hash(self):
+        threads = []
+
+        def make_password(password: str) -> str:
+            threads.append(threading.current_thread().name)
+            return hashers.make_password(password)
+
+        with mock.patch("users.views.make_password", make_password):
+            self.assertEqual(status.HTTP_200_OK, self._login("1313").status_code)
+
+        msg = "\nVerifique se o novo hash é gerado no pool, fora do event loop"
+        self.assertEqual(1, len(threads), msg)
+        self.assertTrue(threads[0].startswith("login"), msg)
+
+        msg = "\nVerifique se o hash da senha é atualizado para o hasher padrão"
+        password = User.objects.get(pk=self.user.pk).password
+        self.assertTrue(password.startswith("pbkdf2_sha256$"), msg)
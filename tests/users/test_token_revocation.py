@@ -0,0 +1,124 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import create_user_with_token
+from users.models import RevokedToken
+from users.revocation import token_denylist
+from users.tokens import ClaimsRefreshToken
+
+
+class TokenRevocationTest(APITestCase):
+    """
+    Classe para testar o logout e a revogação de tokens
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user, _ = create_user_with_token()
+        cls.MOVIES_URL = "/api/movies/"
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        self.refresh = ClaimsRefreshToken.for_user(self.user)
+        access = self.refresh.access_token
+        self.access, self.access_jti = str(access), access["jti"]
+
+    def _authenticated_post(self, url: str, data: dict = None, token: str = None):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + (token or self.access))
+        return self.client.post(url, data=data or {}, format="json")
+
+    def test_logout_revokes_access_token(self):
+        response = self._authenticated_post("/api/logout/")
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+
+        msg = "\nVerifique se o access token deixa de valer após o logout"
+        response = self._authenticated_post(self.MOVIES_URL)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+        self.assertEqual("token_not_valid", response.json()["code"], msg)
+
+    def test_logout_revokes_refresh_token(self):
+        data = {"refresh": str(self.refresh)}
+        response = self._authenticated_post("/api/logout/", data)
+
+        msg = "\nVerifique se o logout revoga também o refresh token enviado"
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code, msg)
+        revoked = set(RevokedToken.objects.values_list("token_type", flat=True))
+        self.assertSetEqual({"access", "refresh"}, revoked, msg)
+
+    def test_logout_with_invalid_refresh_token(self):
+        response = self._authenticated_post("/api/logout/", {"refresh": "invalido"})
+
+        msg = "\nVerifique se um refresh token inválido é recusado sem revogar nada"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertIn("refresh", response.json(), msg)
+        self.assertEqual(0, RevokedToken.objects.count(), msg)
+
+    def test_logout_without_token(self):
+        response = self.client.post("/api/logout/")
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    def test_revoke_token(self):
+        response = self.client.post(
+            "/api/tokens/revoke/", data={"token": self.access}, format="json"
+        )
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+
+        msg = "\nVerifique se o token revogado deixa de autenticar"
+        response = self._authenticated_post(self.MOVIES_URL)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+    def test_revoke_invalid_token(self):
+        response = self.client.post(
+            "/api/tokens/revoke/", data={"token": "invalido"}, format="json"
+        )
+
+        msg = "\nVerifique se só tokens válidos podem ser revogados"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertIn("token", response.json(), msg)
+
+    @override_settings(JWT_CLAIMS_AUTH={"ENABLED": True})
+    def test_valid_token_is_checked_without_queries(self):
+        other_token = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self._authenticated_post("/api/logout/", token=other_token)
+        # O logout muda a versão da denylist: o catch-up fica fora da contagem
+        self._authenticated_post(self.MOVIES_URL)
+
+        msg = "\nVerifique se a checagem da denylist não consulta o banco"
+        with self.assertNumQueries(0, msg=msg):
+            response = self._authenticated_post(self.MOVIES_URL)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code, msg)
+
+    def test_revocation_from_another_process(self):
+        RevokedToken.objects.create(
+            jti=uuid.UUID(self.access_jti),
+            token_type="access",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+
+        msg = "\nVerifique se revogações gravadas por outro processo entram no catch-up"
+        with override_settings(
+            TOKEN_DENYLIST={**settings.TOKEN_DENYLIST, "REFRESH_INTERVAL": 0}
+        ):
+            response = self._authenticated_post(self.MOVIES_URL)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+    @override_settings(TOKEN_DENYLIST={**settings.TOKEN_DENYLIST, "PRUNE_INTERVAL": 0})
+    def test_expired_entries_are_pruned(self):
+        expired = RevokedToken.objects.create(
+            jti=uuid.uuid4(),
+            token_type="access",
+            expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        self.assertFalse(token_denylist.is_revoked(expired.jti.hex))
+
+        msg = "\nVerifique se os tokens revogados já expirados são apagados"
+        self.assertFalse(RevokedToken.objects.filter(pk=expired.pk).exists(), msg)
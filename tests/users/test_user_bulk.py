@@ -0,0 +1,209 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth.hashers import check_password
+from django.core.management import base, call_command
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import create_user_with_token
+from users.hashing import hash_passwords
+from users.models import User
+
+
+class HashPasswordsTest(SimpleTestCase):
+    """
+    Classe para testar o hash de senhas em paralelo
+    """
+
+    @override_settings(PASSWORD_HASHING={"WORKERS": 2, "MIN_POOL_SIZE": 2})
+    def test_hash_passwords_in_process_pool(self):
+        passwords = [f"senha-{index}" for index in range(6)] + [None]
+
+        hashed = hash_passwords(passwords)
+
+        msg = "\nVerifique se os hashes voltam na ordem das senhas"
+        self.assertEqual(len(passwords), len(hashed), msg)
+        for password, encoded in zip(passwords[:-1], hashed):
+            self.assertTrue(check_password(password, encoded), msg)
+
+        msg = "\nVerifique se senha None vira uma senha inutilizável"
+        self.assertFalse(check_password("", hashed[-1]), msg)
+        self.assertTrue(hashed[-1].startswith("!"), msg)
+
+
+class UserBulkViewTest(APITestCase):
+    """
+    Classe para testar o registro de usuários em lote
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/users/bulk/"
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        _, cls.non_admin_token = create_user_with_token()
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _user(self, index: int) -> dict:
+        return {
+            "username": f"lote_{index}",
+            "email": f"lote_{index}@mail.com",
+            "first_name": "Lote",
+            "last_name": f"{index}",
+            "password": f"senha-{index}",
+            "is_critic": True,
+        }
+
+    def _post(self, data, token: str = None):
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + (token or self.admin_token)
+        )
+        return self.client.post(self.BASE_URL, data=data, format="json")
+
+    def test_bulk_creation_requires_admin(self):
+        response = self.client.post(self.BASE_URL, data=[], format="json")
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+        response = self._post([], token=self.non_admin_token)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_bulk_creation(self):
+        response = self._post([self._user(1), self._user(2)])
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        resulted_data = response.json()
+        self.assertEqual(["lote_1", "lote_2"], [u["username"] for u in resulted_data])
+        self.assertNotIn("password", resulted_data[0])
+
+        msg = "\nVerifique se as senhas do lote são gravadas com hash"
+        user = User.objects.get(username="lote_2")
+        self.assertTrue(user.check_password("senha-2"), msg)
+        self.assertTrue(user.is_critic, msg)
+
+    def test_bulk_creation_queries_do_not_grow_with_items(self):
+        query_counts = []
+        for start, quantity in ((0, 2), (100, 20)):
+            data = [self._user(start + index) for index in range(quantity)]
+            with CaptureQueriesContext(connection) as queries:
+                response = self._post(data)
+
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+            query_counts.append(len(queries.captured_queries))
+
+        msg = "\nVerifique se o lote checa unicidade e insere usuários em lote"
+        self.assertEqual(query_counts[0], query_counts[1], msg)
+
+    def test_bulk_creation_errors_per_item(self):
+        self._post([self._user(1)])
+
+        duplicated_email = {**self._user(3), "email": "lote_2@mail.com"}
+        response = self._post(
+            [self._user(1), self._user(2), duplicated_email, {"username": "x"}]
+        )
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        resulted_data = response.json()
+
+        msg = "\nVerifique se os erros do lote vêm por item e nada é gravado"
+        self.assertDictEqual(
+            {
+                "username": ["A user with that username already exists."],
+                "email": ["user with this email already exists."],
+            },
+            resulted_data[0],
+            msg,
+        )
+        self.assertDictEqual({}, resulted_data[1], msg)
+        self.assertDictEqual(
+            {"email": ["user with this email already exists."]},
+            resulted_data[2],
+            msg,
+        )
+        self.assertIn("password", resulted_data[3], msg)
+        self.assertFalse(User.objects.filter(username="lote_2").exists(), msg)
+
+    def test_bulk_creation_non_text_values(self):
+        response = self._post([{**self._user(1), "username": ["x"]}, self._user(2)])
+
+        msg = "\nVerifique se valores que não são texto viram erro do item"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertIn("username", response.json()[0], msg)
+
+    def test_bulk_creation_is_capped_per_request(self):
+        response = self._post([self._user(index) for index in range(21)])
+
+        msg = "\nVerifique se a API recusa lotes maiores que o limite da view"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        self.assertDictEqual(
+            {"non_field_errors": ["Send at most 20 users."]}, response.json(), msg
+        )
+
+    @override_settings(PASSWORD_HASHING={"WORKERS": 2, "MIN_POOL_SIZE": 2})
+    def test_bulk_creation_hashes_without_process_pool(self):
+        with patch("users.hashing.ProcessPoolExecutor") as pool:
+            response = self._post([self._user(index) for index in range(4)])
+
+        msg = "\nVerifique se a API não faz fork de um pool de processos"
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code, msg)
+        pool.assert_not_called()
+
+
+class ImportUsersCommandTest(APITestCase):
+    """
+    Classe para testar o comando `import_users`
+    """
+
+    def _write(self, lines: list[str]) -> Path:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "users.ndjson"
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+        return path
+
+    def _record(self, index: int) -> str:
+        return json.dumps(
+            {
+                "username": f"import_{index}",
+                "email": f"import_{index}@mail.com",
+                "first_name": "Import",
+                "last_name": f"{index}",
+                "password": f"senha-{index}",
+            }
+        )
+
+    def test_import_users(self):
+        path = self._write([self._record(index) for index in range(5)])
+
+        out = StringIO()
+        call_command("import_users", str(path), chunk_size=2, stdout=out)
+
+        msg = "\nVerifique se o comando importa todos os usuários"
+        self.assertIn("Imported 5 users", out.getvalue(), msg)
+        user = User.objects.get(username="import_4")
+        self.assertTrue(user.check_password("senha-4"), msg)
+
+    def test_import_users_invalid_line(self):
+        path = self._write([self._record(1), '{"username": "import_2"}'])
+
+        with self.assertRaises(base.CommandError) as err:
+            call_command("import_users", str(path), stdout=StringIO())
+
+        msg = "\nVerifique se o erro aponta a linha do registro inválido"
+        self.assertTrue(err.exception.args[0].startswith("Line 2: "), msg)
+        self.assertFalse(User.objects.exists(), msg)
+
+    def test_import_users_chunk_size_limit(self):
+        path = self._write([self._record(1)])
+
+        msg = "\nVerifique se o lote não passa do limite do serializer"
+        with self.assertRaises(base.CommandError, msg=msg):
+            call_command("import_users", str(path), chunk_size=2000, stdout=StringIO())
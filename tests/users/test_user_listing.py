@@ -0,0 +1,95 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import create_multiple_critic_users, create_user_with_token
+from users.models import User
+
+
+class UserListingTest(APITestCase):
+    """
+    Classe para testar a paginação por cursor e os filtros da listagem de
+    usuários
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/users/"
+        cls.admin, cls.admin_token = create_user_with_token(is_admin=True)
+        create_multiple_critic_users(quantity=6)
+        for _ in range(3):
+            create_user_with_token()
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.admin_token)
+
+    def _walk(self, url: str) -> list[str]:
+        usernames = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            data = response.json()
+            usernames.extend(user["username"] for user in data["results"])
+            url = data["next"]
+
+        return usernames
+
+    def test_cursor_pagination_walks_all_users_in_order(self):
+        with CaptureQueriesContext(connection) as queries:
+            usernames = self._walk(self.BASE_URL + "?cursor=")
+
+        msg = "\nVerifique se o cursor percorre todos os usuários em ordem"
+        expected = list(
+            User.objects.order_by("username", "id").values_list("username", flat=True)
+        )
+        self.assertListEqual(expected, usernames, msg)
+
+        msg = "\nVerifique se o modo cursor não faz COUNT nem OFFSET"
+        for query in queries:
+            self.assertNotIn("COUNT(", query["sql"].upper(), msg)
+            self.assertNotIn("OFFSET", query["sql"].upper(), msg)
+
+    def test_listing_does_not_read_passwords(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.BASE_URL, {"cursor": ""})
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        msg = "\nVerifique se a listagem não lê a coluna de senha"
+        listing = [query["sql"] for query in queries if "ORDER BY" in query["sql"]]
+        self.assertTrue(listing)
+        for sql in listing:
+            self.assertNotIn('"users_user"."password"', sql, msg)
+
+    def test_filters(self):
+        msg = "\nVerifique se `is_critic` e `is_superuser` filtram a listagem"
+        critics = self._walk(self.BASE_URL + "?cursor=&is_critic=true")
+        self.assertEqual(6, len(critics), msg)
+
+        admins = self._walk(self.BASE_URL + "?is_superuser=true")
+        self.assertListEqual([self.admin.username], admins, msg)
+
+        response = self.client.get(self.BASE_URL + "?is_critic=talvez")
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(
+            {"is_critic": ["Must be `true` or `false`."]}, response.json()
+        )
+
+    def test_filtered_listing_reads_the_index_in_order(self):
+        for field in ("is_critic", "is_superuser"):
+            queryset = User.objects.filter(
+                **{field: True}, username__gte="lucira_3"
+            ).order_by("username", "id")[:4]
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = " ".join(row[-1] for row in cursor.fetchall())
+
+            with self.subTest(field=field):
+                msg = f"\nVerifique se o filtro `{field}` usa índice: {plan}"
+                self.assertNotIn("TEMP B-TREE", plan, msg)
+                self.assertIn("USING INDEX", plan, msg)
@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from tests.factories import create_user_with_token
+from users.serializers import UserSerializer
+
+
+class UserUniquenessTest(APITestCase):
+    """
+    Classe para testar a checagem de unicidade no registro de usuários
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/users/"
+        cls.user_data = {
+            "username": "lucira",
+            "email": "lucira@mail.com",
+            "first_name": "Lucira",
+            "last_name": "Buster",
+            "password": "1234",
+        }
+        create_user_with_token(dict(cls.user_data))
+
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def _user_selects(self, queries) -> list[str]:
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("SELECT") and '"users_user"' in query["sql"]
+        ]
+
+    def test_registration_checks_uniqueness_in_one_query(self):
+        data = {**self.user_data, "username": "outra", "email": "outra@mail.com"}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.BASE_URL, data=data, format="json")
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        msg = "\nVerifique se username e email são checados numa única query"
+        self.assertEqual(1, len(self._user_selects(queries)), msg)
+
+    def test_duplicated_fields_errors(self):
+        data = {**self.user_data, "email": "outra@mail.com"}
+        response = self.client.post(self.BASE_URL, data=data, format="json")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual(
+            {"username": ["A user with that username already exists."]},
+            response.json(),
+        )
+
+        msg = "\nVerifique se o erro de unicidade vem junto dos demais erros"
+        data = {**self.user_data}
+        data.pop("first_name")
+        response = self.client.post(self.BASE_URL, data=data, format="json")
+        expected_data = {
+            "username": ["A user with that username already exists."],
+            "email": ["user with this email already exists."],
+            "first_name": ["This field is required."],
+        }
+        self.assertDictEqual(expected_data, response.json(), msg)
+
+    def test_concurrent_registration_is_mapped_to_field_errors(self):
+        # Simula um cadastro concorrente que passou pela checagem ao mesmo
+        # tempo: só a constraint do banco barra o INSERT
+        original = UserSerializer.find_duplicates
+        calls = []
+
+        def skip_first_check(serializer, values):
+            calls.append(values)
+            return {} if len(calls) == 1 else original(serializer, values)
+
+        with patch.object(UserSerializer, "find_duplicates", skip_first_check):
+            response = self.client.post(
+                self.BASE_URL, data=self.user_data, format="json"
+            )
+
+        msg = "\nVerifique se o IntegrityError vira os erros por campo"
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+        expected_data = {
+            "username": ["A user with that username already exists."],
+            "email": ["user with this email already exists."],
+        }
+        self.assertDictEqual(expected_data, response.json(), msg)
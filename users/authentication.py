@@ -0,0 +1,36 @@
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .models import User
+from .tokens import USER_CLAIMS, ClaimsUser
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Com `JWT_CLAIMS_AUTH["ENABLED"]`, monta o usuário a partir das claims do
+    access token (`ClaimsUser`), sem a query do `JWTAuthentication`. Tokens
+    sem as claims, emitidos antes do modo existir, seguem pelo banco.
+
+    Mudanças nas flags do usuário só valem no próximo login, e um usuário
+    desativado segue autenticado até o token expirar: o modo pressupõe
+    access tokens de vida curta.
+    """
+
+    def get_user(self, validated_token) -> User | ClaimsUser:
+        if not settings.JWT_CLAIMS_AUTH["ENABLED"] or any(
+            claim not in validated_token for claim in USER_CLAIMS
+        ):
+            return super().get_user(validated_token)
+
+        return ClaimsUser(validated_token)
+
+
+def get_request_user(request: Request) -> User:
+    """
+    Usuário da requisição como instância de `User`, para gravar e serializar
+    """
+    if isinstance(request.user, ClaimsUser):
+        return request.user.db_user
+
+    return request.user
@@ -0,0 +1,40 @@
+from typing import Callable
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+
+def _parse_bool(value: str) -> bool | None:
+    return {"true": True, "false": False}.get(value.lower())
+
+
+# parâmetro de query -> (lookup do ORM, parser, mensagem de erro)
+USER_FILTERS: dict[str, tuple[str, Callable, str]] = {
+    "is_critic": ("is_critic", _parse_bool, "Must be `true` or `false`."),
+    "is_superuser": ("is_superuser", _parse_bool, "Must be `true` or `false`."),
+}
+
+
+def filter_users(queryset: QuerySet, params: dict) -> QuerySet:
+    """
+    Aplica os filtros da listagem de usuários. Cada filtro tem um índice
+    (filtro, username, id) em `User.Meta.indexes`, que atende o filtro e a
+    ordenação da listagem sem ordenar em memória.
+    """
+    lookups, errors = {}, {}
+    for param, (lookup, parse, error_message) in USER_FILTERS.items():
+        raw = params.get(param)
+        if raw is None or raw == "":
+            continue
+
+        value = parse(raw)
+        if value is None:
+            errors[param] = [error_message]
+            continue
+
+        lookups[lookup] = value
+
+    if errors:
+        raise ValidationError(errors)
+
+    return queryset.filter(**lookups)
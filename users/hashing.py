@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    get_hasher,
+    get_hashers,
+    get_hashers_by_algorithm,
+    make_password,
+)
+
+
+def _init_worker(hashers: list[str]) -> None:
+    """
+    Prepara o processo filho. Com `fork` o Django já vem configurado; com
+    `spawn` é preciso inicializá-lo. Em ambos, usa os mesmos hashers do pai.
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_core.settings")
+    django.setup()
+
+    if list(settings.PASSWORD_HASHERS) != hashers:
+        settings.PASSWORD_HASHERS = hashers
+        get_hashers.cache_clear()
+        get_hashers_by_algorithm.cache_clear()
+
+
+def _hash_chunk(passwords: list[str | None], algorithm: str) -> list[str]:
+    return [make_password(password, hasher=algorithm) for password in passwords]
+
+
+def hash_passwords(
+    passwords: list[str | None], workers: int | None = None
+) -> list[str]:
+    """
+    Gera o hash de várias senhas, na mesma ordem, com o hasher padrão.
+
+    Lotes a partir de `MIN_POOL_SIZE` senhas são divididos entre `workers`
+    processos. O PBKDF2 do hashlib libera o GIL (ver users/login.py), mas nem
+    todo hasher configurável libera; em processos, o lote usa todos os
+    núcleos com qualquer um deles. Lotes menores, ou com um único worker,
+    rodam no próprio processo. O pool é criado com fork a cada chamada,
+    então é para comandos: no servidor, que tem threads, passe `workers=1`.
+    """
+    config = settings.PASSWORD_HASHING
+    workers = workers or config["WORKERS"] or os.cpu_count() or 1
+    algorithm = get_hasher("default").algorithm
+
+    if workers == 1 or len(passwords) < config["MIN_POOL_SIZE"]:
+        return _hash_chunk(passwords, algorithm)
+
+    size = -(-len(passwords) // workers)
+    chunks = [passwords[i : i + size] for i in range(0, len(passwords), size)]
+
+    with ProcessPoolExecutor(
+        max_workers=len(chunks),
+        initializer=_init_worker,
+        initargs=(list(settings.PASSWORD_HASHERS),),
+    ) as pool:
+        hashed = pool.map(_hash_chunk, chunks, [algorithm] * len(chunks))
+
+        return [password for chunk in hashed for password in chunk]
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+class LoginAttemptLimiter:
+    """
+    Limite em memória de tentativas de login por username numa janela
+    deslizante. A tentativa é registrada antes da checagem da senha, então
+    uma rajada de requisições simultâneas para o mesmo usuário também é
+    barrada; um login bem-sucedido zera o contador.
+
+    Guarda no máximo `max_tracked` usernames, descartando os mais antigos,
+    para que uma varredura com usernames aleatórios não esgote a memória.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._attempts: OrderedDict[str, deque] = OrderedDict()
+
+    def hit(self, username: str) -> int | None:
+        """
+        Registra uma tentativa. Retorna em quantos segundos o usuário pode
+        tentar de novo, ou None se a tentativa está liberada.
+        """
+        config = settings.LOGIN
+        now = time.monotonic()
+
+        with self._lock:
+            attempts = self._attempts.pop(username, None) or deque()
+            while attempts and attempts[0] <= now - config["WINDOW"]:
+                attempts.popleft()
+
+            self._attempts[username] = attempts
+            while len(self._attempts) > config["MAX_TRACKED_USERS"]:
+                self._attempts.popitem(last=False)
+
+            if len(attempts) >= config["MAX_ATTEMPTS"]:
+                return max(1, int(attempts[0] + config["WINDOW"] - now) + 1)
+
+            attempts.append(now)
+            return None
+
+    def reset(self, username: str) -> None:
+        with self._lock:
+            self._attempts.pop(username, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._attempts.clear()
+
+
+class PasswordCheckPool:
+    """
+    Pool limitado de threads para a checagem de senha. O PBKDF2 do hashlib
+    libera o GIL, então as checagens rodam em paralelo de verdade sem travar
+    o event loop. Com mais de `max_pending` checagens na fila, novas
+    tentativas são recusadas em vez de acumular CPU.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="login")
+        self._lock = threading.Lock()
+        self.pending = 0
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                return False
+            self.pending += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.pending -= 1
+
+
+login_limiter = LoginAttemptLimiter()
+
+_pool_lock = threading.Lock()
+_pool: PasswordCheckPool | None = None
+
+
+def get_password_check_pool() -> PasswordCheckPool:
+    """
+    Pool do processo atual, recriado se `WORKERS` ou `MAX_PENDING` mudarem
+    """
+    global _pool
+
+    config = settings.LOGIN
+    with _pool_lock:
+        if _pool is None or (_pool.workers, _pool.max_pending) != (
+            config["WORKERS"],
+            config["MAX_PENDING"],
+        ):
+            if _pool is not None:
+                _pool.executor.shutdown(wait=False)
+            _pool = PasswordCheckPool(config["WORKERS"], config["MAX_PENDING"])
+
+        return _pool
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import Q
+
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Cria um usuário administrador."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--username", default="admin")
+        parser.add_argument("--password", default="admin1234")
+        parser.add_argument("--email", default="admin@example.com")
+
+    def handle(self, *args, **options) -> None:
+        username, email = options["username"], options["email"]
+
+        # Username e email numa única query, como no cadastro pela API
+        taken = User.objects.filter(Q(username=username) | Q(email=email))
+        usernames, emails = set(), set()
+        for taken_username, taken_email in taken.values_list("username", "email"):
+            usernames.add(taken_username)
+            emails.add(taken_email)
+
+        if username in usernames:
+            raise CommandError(f"Username `{username}` already taken.")
+        if email in emails:
+            raise CommandError(f"Email `{email}` already taken.")
+
+        User.objects.create_superuser(
+            username=username, email=email, password=options["password"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Admin `{username}` successfully created!")
+        )
@@ -0,0 +1,106 @@
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import IntegrityError
+
+from _core.records import read_records
+from users.models import User
+from users.serializers import UserBulkListSerializer, UserSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa usuários (NDJSON ou CSV) em lotes: valida cada lote com o "
+        "serializer da API, gera os hashes das senhas em paralelo e grava "
+        "com bulk_create em uma transação por lote."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="Arquivo .ndjson/.jsonl ou .csv")
+        parser.add_argument(
+            "--format",
+            choices=("ndjson", "csv"),
+            help="Formato do arquivo. Por padrão é inferido pela extensão.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=UserBulkListSerializer.max_items,
+            help=f"Usuários por lote, até {UserBulkListSerializer.max_items}.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Processos para o hash das senhas. Padrão: um por CPU.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File `{path}` not found.")
+
+        file_format = options["format"] or (
+            "csv" if path.suffix.lower() == ".csv" else "ndjson"
+        )
+        chunk_size = options["chunk_size"]
+        max_chunk_size = UserBulkListSerializer.max_items
+        if not 1 <= chunk_size <= max_chunk_size:
+            raise CommandError(
+                f"`--chunk-size` must be between 1 and {max_chunk_size}."
+            )
+
+        with path.open(newline="", encoding="utf-8") as source:
+            records = read_records(source, file_format, self._clean_csv_row)
+
+            started = time.perf_counter()
+            imported = 0
+            while chunk := list(islice(records, chunk_size)):
+                imported += self._import_chunk(chunk, options["workers"])
+
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{imported} users committed ({imported / elapsed:.0f} users/s)"
+                )
+
+        elapsed = time.perf_counter() - started
+        rate = imported / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} users in {elapsed:.2f}s ({rate:.0f} users/s)."
+            )
+        )
+
+    @staticmethod
+    def _clean_csv_row(row: dict) -> dict:
+        # Colunas vazias ficam de fora, como campos ausentes no NDJSON
+        return {key: value for key, value in row.items() if value != ""}
+
+    def _import_chunk(self, chunk: list[tuple[int, dict]], workers: int | None) -> int:
+        serializer = UserSerializer(data=[record for _, record in chunk], many=True)
+
+        if not serializer.is_valid():
+            errors = serializer.errors
+            if isinstance(errors, dict):
+                raise CommandError(f"Line {chunk[0][0]}: {errors}")
+
+            for (line, _), item_errors in zip(chunk, errors):
+                if item_errors:
+                    details = "; ".join(
+                        f"`{field}` {' '.join(messages)}"
+                        for field, messages in item_errors.items()
+                    )
+                    raise CommandError(f"Line {line}: {details}")
+
+        # Valida e gera os hashes fora de transação: só o INSERT abre uma
+        try:
+            users = User.objects.bulk_create_users(
+                serializer.validated_data, workers=workers
+            )
+        except IntegrityError:
+            raise CommandError(
+                f"Line {chunk[0][0]}: some users were registered concurrently."
+            )
+
+        return len(users)
@@ -0,0 +1,20 @@
+# Generated by Django 4.1 on 2026-10-17 15:58
+
+from django.db import migrations
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_alter_user_options"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", users.models.BulkUserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.1 on 2026-10-17 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_alter_user_managers"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["is_critic", "username", "id"], name="user_critic_username_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["is_superuser", "username", "id"],
+                name="user_superuser_username_idx",
+            ),
+        ),
+    ]
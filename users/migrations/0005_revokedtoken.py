@@ -0,0 +1,31 @@
+# Generated by Django 4.1 on 2026-10-17 16:07
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_user_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                ("jti", models.UUIDField(primary_key=True, serialize=False)),
+                ("token_type", models.CharField(max_length=16)),
+                ("revoked_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("expires_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="revokedtoken",
+            index=models.Index(fields=["revoked_at"], name="revoked_token_revoked_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="revokedtoken",
+            index=models.Index(fields=["expires_at"], name="revoked_token_expires_idx"),
+        ),
+    ]
@@ -1,7 +1,39 @@
 import uuid
 
-from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.db import models, transaction
+from django.utils import timezone
+
+from .hashing import hash_passwords
+
+
+class BulkUserManager(UserManager):
+    def bulk_create_users(
+        self,
+        users_data: list[dict],
+        batch_size: int = 1000,
+        workers: int | None = None,
+    ) -> list["User"]:
+        """
+        Equivalente a `create_user` para muitos usuários: os hashes das
+        senhas são gerados em paralelo e os usuários gravados com bulk_create.
+        Só o INSERT roda em transação, para não segurar o lock do SQLite
+        enquanto os hashes são gerados.
+        """
+        passwords = hash_passwords(
+            [data.get("password") for data in users_data], workers=workers
+        )
+
+        users = []
+        for data, password in zip(users_data, passwords):
+            user = self.model(**{k: v for k, v in data.items() if k != "password"})
+            user.username = self.model.normalize_username(user.username)
+            user.email = self.normalize_email(user.email)
+            user.password = password
+            users.append(user)
+
+        with transaction.atomic():
+            return self.bulk_create(users, batch_size=batch_size)
 
 
 class User(AbstractUser):
@@ -19,5 +51,36 @@ class User(AbstractUser):
 
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BulkUserManager()
+
     class Meta:
         ordering = ("username",)
+        indexes = [
+            # Filtros da listagem de usuários, na ordem da paginação
+            models.Index(
+                fields=["is_critic", "username", "id"], name="user_critic_username_idx"
+            ),
+            models.Index(
+                fields=["is_superuser", "username", "id"],
+                name="user_superuser_username_idx",
+            ),
+        ]
+
+
+class RevokedToken(models.Model):
+    """
+    Tokens revogados antes de expirar, por logout ou revogação. As linhas
+    expiradas são removidas pela `token_denylist` (users/revocation.py).
+    """
+
+    jti = models.UUIDField(primary_key=True)
+    token_type = models.CharField(max_length=16)
+    revoked_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            # Catch-up incremental da denylist e limpeza dos expirados
+            models.Index(fields=["revoked_at"], name="revoked_token_revoked_idx"),
+            models.Index(fields=["expires_at"], name="revoked_token_expires_idx"),
+        ]
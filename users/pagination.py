@@ -0,0 +1,10 @@
+from _core.pagination import KeysetPagination
+
+
+class UserCursorPagination(KeysetPagination):
+    """
+    Modo cursor da listagem de usuários (`?cursor=`), ordenado por
+    (username, id); o `username` é único, então o índice dele já serve
+    """
+
+    ordering = ("username", "id")
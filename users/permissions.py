@@ -0,0 +1,14 @@
+from rest_framework import permissions
+from rest_framework.views import Request, View
+
+
+class IsAdminOrCreateOnly(permissions.BasePermission):
+    """
+    Cadastro liberado para todos, listagem apenas para administradores
+    """
+
+    def has_permission(self, request: Request, view: View) -> bool:
+        if request.method == "POST":
+            return True
+
+        return bool(request.user.is_authenticated and request.user.is_superuser)
@@ -0,0 +1,110 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Iterable
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from _core.bloom import CatchUpBloomFilter
+from _core.cache import bump_version
+
+from .models import RevokedToken
+
+
+def _jti_to_uuid(jti: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(jti))
+    except ValueError:
+        return None
+
+
+class TokenDenylist(CatchUpBloomFilter):
+    """
+    Denylist de tokens por `jti`, consultada a cada requisição autenticada.
+
+    Os jtis revogados e ainda não expirados ficam num filtro de Bloom em
+    memória, então um token válido é liberado sem query. Só um acerto do
+    filtro (token revogado ou falso positivo) é confirmado na tabela
+    `RevokedToken`.
+
+    Revogações feitas neste processo entram no filtro na hora; as de outros
+    processos, pelo catch-up pelo índice de `revoked_at`. A cada
+    `PRUNE_INTERVAL` segundos, as linhas expiradas são apagadas e o filtro
+    recarregado sem elas.
+    """
+
+    version_resource = "revoked_tokens"
+
+    def reset(self) -> None:
+        super().reset()
+        self.pruned_at = 0.0
+
+    def get_settings(self) -> dict:
+        return settings.TOKEN_DENYLIST
+
+    def load_ids(self) -> Iterable[uuid.UUID]:
+        jtis = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+        return jtis.values_list("jti", flat=True).iterator(chunk_size=10000)
+
+    def recent_ids(self, since: datetime) -> Iterable[uuid.UUID]:
+        recent = RevokedToken.objects.filter(revoked_at__gte=since)
+        return recent.values_list("jti", flat=True).order_by()
+
+    def _warm(self, config: dict) -> None:
+        super()._warm(config)
+        self.pruned_at = time.monotonic()
+
+    def _prune(self, config: dict) -> None:
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+
+        # O filtro não remove itens: recarrega só com os não expirados
+        self._warm(config)
+
+    def _refresh(self, config: dict) -> None:
+        if self.bloom is None:
+            self._warm(config)
+        elif time.monotonic() - self.pruned_at >= config["PRUNE_INTERVAL"]:
+            self._prune(config)
+        else:
+            super()._refresh(config)
+
+    def is_revoked(self, jti: str) -> bool:
+        key = _jti_to_uuid(jti)
+        if key is None:
+            return False
+
+        with self._lock:
+            self._refresh(self.get_settings())
+            if key not in self.bloom:
+                return False
+
+        return RevokedToken.objects.filter(jti=key).exists()
+
+
+token_denylist = TokenDenylist()
+
+
+def revoke_token(token: Token) -> None:
+    """
+    Revoga um token já validado até a sua expiração
+    """
+    jti = _jti_to_uuid(token[api_settings.JTI_CLAIM])
+    if jti is None:
+        return
+
+    RevokedToken.objects.bulk_create(
+        [
+            RevokedToken(
+                jti=jti,
+                token_type=token[api_settings.TOKEN_TYPE_CLAIM],
+                expires_at=datetime_from_epoch(token["exp"]),
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    token_denylist.add(jti)
+    bump_version("revoked_tokens")
@@ -1,27 +1,100 @@
+from collections.abc import Mapping
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
+from rest_framework.fields import empty
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import Token, UntypedToken
+
+from _core.sparse import SparseFieldsSerializerMixin
 
 from .models import User
+from .revocation import revoke_token
 
 
-class UserSerializer(serializers.Serializer):
-    id = serializers.UUIDField(read_only=True)
-    username = serializers.CharField(
-        validators=[
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="A user with that username already exists.",
+class UserBulkListSerializer(serializers.ListSerializer):
+    max_items = 1000
+
+    def to_internal_value(self, data: list) -> list[dict]:
+        """
+        Antes de validar os itens, busca com uma única query os usernames e
+        emails do lote que já existem, para que cada item cheque a unicidade
+        sem query. Depois, recusa repetições dentro do próprio lote.
+        """
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        max_items = self.context.get("max_items", self.max_items)
+        if len(data) > max_items:
+            raise serializers.ValidationError(
+                {"non_field_errors": [f"Send at most {max_items} users."]}
             )
-        ]
-    )
-    email = serializers.EmailField(
-        validators=[
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="user with this email already exists.",
+
+        items = [item for item in data if isinstance(item, Mapping)]
+        conditions = Q()
+        for field in self.child.unique_messages:
+            conditions |= Q(**{f"{field}__in": [str(i.get(field)) for i in items]})
+
+        existing = User.objects.filter(conditions).values_list(
+            *self.child.unique_messages
+        )
+        self.child.known_values = {
+            field: set(values)
+            for field, values in zip(self.child.unique_messages, zip(*existing))
+        }
+
+        # Repetições dentro do próprio lote: o primeiro item fica com o valor
+        repeated = [{} for _ in data]
+        seen = {field: set() for field in self.child.unique_messages}
+        for item_errors, item in zip(repeated, data):
+            for field, values in seen.items():
+                value = item.get(field) if isinstance(item, Mapping) else None
+                # Valores que não são texto já falham na validação do item
+                if not isinstance(value, str):
+                    continue
+                if value in values:
+                    item_errors[field] = [self.child.unique_messages[field]]
+                values.add(value)
+
+        try:
+            validated_data, errors = super().to_internal_value(data), None
+        except serializers.ValidationError as err:
+            if not isinstance(err.detail, list):
+                raise
+            validated_data, errors = None, err.detail
+
+        if errors is not None or any(repeated):
+            errors = errors or [{} for _ in data]
+            raise serializers.ValidationError(
+                [{**extra, **dict(item)} for extra, item in zip(repeated, errors)]
+            )
+
+        return validated_data
+
+    def create(self, validated_data: list[dict]) -> list[User]:
+        try:
+            # Sem pool de processos: fazer fork de um servidor com threads
+            # não é seguro, então na API os hashes são gerados aqui mesmo
+            return User.objects.bulk_create_users(validated_data, workers=1)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Some users were registered concurrently."]}
             )
-        ],
-    )
+
+
+class UserSerializer(SparseFieldsSerializerMixin, serializers.Serializer):
+    # campo único -> mensagem de erro, as mesmas do UniqueValidator do DRF
+    unique_messages = {
+        "username": "A user with that username already exists.",
+        "email": "user with this email already exists.",
+    }
+
+    id = serializers.UUIDField(read_only=True)
+    username = serializers.CharField()
+    email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
     first_name = serializers.CharField(max_length=50)
     last_name = serializers.CharField(max_length=50)
@@ -30,5 +103,95 @@ class UserSerializer(serializers.Serializer):
     is_superuser = serializers.BooleanField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
 
+    # Preenchido pelo `UserBulkListSerializer`: valores únicos já existentes
+    known_values: dict[str, set] | None = None
+
+    class Meta:
+        list_serializer_class = UserBulkListSerializer
+
+    def find_duplicates(self, values: dict) -> dict:
+        """
+        Checa todos os campos únicos com uma única query e devolve os erros
+        no formato do DRF, campo a campo
+        """
+        if not values:
+            return {}
+
+        if self.known_values is not None:
+            return {
+                field: [self.unique_messages[field]]
+                for field, value in values.items()
+                if value in self.known_values.get(field, ())
+            }
+
+        conditions = reduce(
+            or_, (Q(**{field: value}) for field, value in values.items())
+        )
+        errors = {}
+        for row in User.objects.filter(conditions).values(*values)[: len(values)]:
+            for field, value in values.items():
+                if row[field] == value:
+                    errors[field] = [self.unique_messages[field]]
+
+        return errors
+
+    def to_internal_value(self, data: dict) -> dict:
+        if not isinstance(data, Mapping):
+            return super().to_internal_value(data)
+
+        try:
+            validated_data, errors = super().to_internal_value(data), {}
+        except serializers.ValidationError as err:
+            validated_data, errors = None, dict(err.detail)
+
+        # Checa só os campos únicos que passaram na própria validação, para
+        # manter os erros de unicidade junto dos demais, como o UniqueValidator
+        values = {}
+        for field in self.unique_messages:
+            if field in errors or field not in self.fields:
+                continue
+            if validated_data is not None:
+                values[field] = validated_data[field]
+            else:
+                values[field] = self.fields[field].run_validation(
+                    data.get(field, empty)
+                )
+
+        errors.update(self.find_duplicates(values))
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return validated_data
+
     def create(self, validated_data: dict) -> User:
-        return User.objects.create_user(**validated_data)
+        """
+        A constraint única do banco é a palavra final: se um cadastro
+        concorrente passar pela checagem ao mesmo tempo, o IntegrityError
+        vira os mesmos erros por campo da validação
+        """
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(**validated_data)
+        except IntegrityError:
+            errors = self.find_duplicates(
+                {field: validated_data[field] for field in self.unique_messages}
+            )
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors)
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    token = serializers.CharField(write_only=True)
+
+    def validate_token(self, value: str) -> Token:
+        try:
+            return UntypedToken(value)
+        except TokenError as err:
+            raise serializers.ValidationError(str(err))
+
+    def save(self) -> Token:
+        token = self.validated_data["token"]
+        revoke_token(token)
+
+        return token
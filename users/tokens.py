@@ -0,0 +1,75 @@
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from .models import User
+from .revocation import token_denylist
+
+# Claims do usuário gravados no token, lidos pela `ClaimsJWTAuthentication`
+USER_CLAIMS = ("is_superuser", "is_critic", "updated_at")
+
+
+class RevocableTokenMixin:
+    """
+    Recusa, na validação, tokens cujo `jti` está na `token_denylist`
+    """
+
+    def verify(self) -> None:
+        super().verify()
+
+        if token_denylist.is_revoked(self.payload.get(api_settings.JTI_CLAIM)):
+            raise TokenError("Token is revoked")
+
+
+class RevocableAccessToken(RevocableTokenMixin, AccessToken):
+    pass
+
+
+class ClaimsRefreshToken(RevocableTokenMixin, RefreshToken):
+    """
+    Refresh token com as flags de permissão e o `updated_at` do usuário. O
+    access token gerado a partir dele herda as mesmas claims.
+    """
+
+    access_token_class = RevocableAccessToken
+
+    @classmethod
+    def for_user(cls, user: User) -> "ClaimsRefreshToken":
+        token = super().for_user(user)
+        token["is_superuser"] = user.is_superuser
+        token["is_critic"] = user.is_critic
+        token["updated_at"] = user.updated_at.isoformat()
+
+        return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
+
+class ClaimsUser(TokenUser):
+    """
+    Usuário montado só com as claims do token, sem consultar o banco. Serve
+    às checagens de permissão; quando a view precisa da linha do usuário de
+    fato, `db_user` a carrega uma única vez.
+    """
+
+    @cached_property
+    def id(self):
+        return User._meta.pk.to_python(super().id)
+
+    @cached_property
+    def is_critic(self) -> bool:
+        return self.token.get("is_critic", False)
+
+    @cached_property
+    def updated_at(self):
+        return parse_datetime(self.token["updated_at"])
+
+    @cached_property
+    def db_user(self) -> User:
+        return User.objects.get(pk=self.id)
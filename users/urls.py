@@ -1,9 +1,17 @@
 from django.urls import path
-from rest_framework_simplejwt import views as jwt_views
 
 from . import views
+from reviews import views as review_views
 
 urlpatterns = [
     path("users/", views.UserView.as_view()),
-    path("login/", jwt_views.TokenObtainPairView.as_view()),
+    path("users/bulk/", views.UserBulkView.as_view()),
+    path("login/", views.LoginView.as_view()),
+    path("logout/", views.LogoutView.as_view()),
+    path("tokens/revoke/", views.TokenRevokeView.as_view()),
+    path("critics/", review_views.CriticLeaderboardView.as_view()),
+    path(
+        "users/<uuid:user_id>/reviews/stats/",
+        review_views.CriticReviewStatsView.as_view(),
+    ),
 ]
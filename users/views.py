@@ -1,29 +1,252 @@
-from rest_framework.pagination import PageNumberPagination
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import (
+    get_hasher,
+    identify_hasher,
+    is_password_usable,
+    make_password,
+)
+from django.db.models import QuerySet
+from django.http import HttpRequest, JsonResponse
+from django.utils.crypto import get_random_string
+from django.utils.module_loading import import_string
+from django.views import View
+from rest_framework import generics, permissions
 from rest_framework.views import APIView, Request, Response, status
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from _core.pagination import CursorOptInMixin
+from _core.sparse import SparseFieldsViewMixin
+from movies.permissions import IsAdmin
 
+from .authentication import ClaimsJWTAuthentication
+from .filters import filter_users
+from .login import get_password_check_pool, login_limiter
 from .models import User
-from .serializers import UserSerializer
+from .pagination import UserCursorPagination
+from .permissions import IsAdminOrCreateOnly
+from .revocation import revoke_token
+from .serializers import TokenRevokeSerializer, UserSerializer
 
 
-class UserView(APIView, PageNumberPagination):
-    def get(self, request: Request) -> Response:
-        """
-        Listagem de usuários
-        """
-        users = User.objects.all()
-        result_page = self.paginate_queryset(users, request)
-        serializer = UserSerializer(result_page, many=True)
+class UserView(CursorOptInMixin, SparseFieldsViewMixin, generics.ListCreateAPIView):
+    """
+    Listagem de usuários (apenas administradores) e registro de usuários
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminOrCreateOnly]
+    cursor_pagination_class = UserCursorPagination
+    # colunas lidas pelo cursor mesmo quando fora de `?fields=`
+    sparse_always = ("username",)
+
+    queryset = User.objects.order_by("username", "id")
+    serializer_class = UserSerializer
+
+    def get_queryset(self) -> QuerySet:
+        queryset = filter_users(super().get_queryset(), self.request.query_params)
 
-        return self.get_paginated_response(serializer.data)
+        return self.filter_sparse_fields(queryset)
+
+
+class UserBulkView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+    # Os hashes são gerados na própria requisição, a ~0,15s cada com PBKDF2.
+    # Lotes maiores ficam para o `import_users`.
+    max_items = 20
 
     def post(self, request: Request) -> Response:
         """
-        Registro de usuários
+        Registro de usuários em lote, apenas para administradores.
+
+        Tudo ou nada: os erros voltam por item, na ordem enviada. Os
+        usuários são gravados com bulk_create.
         """
-        serializer = UserSerializer(data=request.data)
+        serializer = UserSerializer(
+            data=request.data, many=True, context={"max_items": self.max_items}
+        )
         serializer.is_valid(raise_exception=True)
 
         serializer.save()
 
         return Response(serializer.data, status.HTTP_201_CREATED)
+
+
+class LogoutView(APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        """
+        Revoga o access token da requisição e, se enviado, o refresh token
+        """
+        serializer = None
+        if "refresh" in request.data:
+            serializer = TokenRevokeSerializer(data={"token": request.data["refresh"]})
+            if not serializer.is_valid():
+                return Response(
+                    {"refresh": serializer.errors["token"]},
+                    status.HTTP_400_BAD_REQUEST,
+                )
+
+        revoke_token(request.auth)
+        if serializer is not None:
+            serializer.save()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TokenRevokeView(APIView):
+    # Quem tem o token já pode usá-lo, então pode também revogá-lo
+    authentication_classes = []
+    permission_classes = []
+
+    def post(self, request: Request) -> Response:
+        """
+        Revoga qualquer token válido (access ou refresh) até a sua expiração
+        """
+        serializer = TokenRevokeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class LoginView(View):
+    """
+    Login assíncrono, com as mesmas respostas do `TokenObtainPairView`.
+
+    A checagem da senha roda no pool limitado de `users/login.py`, fora do
+    event loop do deploy ASGI, e cada username tem um limite de tentativas
+    por janela. Pool cheio responde 503 em vez de enfileirar mais CPU.
+    """
+
+    http_method_names = ["post", "options"]
+    invalid_credentials = "No active account found with the given credentials"
+    # Hash usado quando o usuário não existe, para que o tempo de resposta
+    # não revele quais usernames estão cadastrados
+    _dummy_password: str | None = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Autenticação por senha, sem sessão: o CSRF não se aplica
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+
+        return view
+
+    @classmethod
+    def dummy_password(cls) -> str:
+        if cls._dummy_password is None:
+            cls._dummy_password = make_password(get_random_string(32))
+
+        return cls._dummy_password
+
+    @staticmethod
+    def parse_credentials(request: HttpRequest) -> tuple[dict, dict]:
+        if request.content_type == "application/json":
+            try:
+                data = json.loads(request.body or b"{}")
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                return {}, {"detail": "JSON parse error."}
+        else:
+            data = request.POST
+
+        credentials, errors = {}, {}
+        for field in ("username", "password"):
+            value = data.get(field)
+            if value is None:
+                errors[field] = ["This field is required."]
+            elif not isinstance(value, str):
+                errors[field] = ["Not a valid string."]
+            elif not value.strip():
+                errors[field] = ["This field may not be blank."]
+            else:
+                credentials[field] = value
+
+        return credentials, errors
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        credentials, errors = self.parse_credentials(request)
+        if errors:
+            return JsonResponse(errors, status=400)
+
+        username, password = credentials["username"], credentials["password"]
+        retry_after = login_limiter.hit(username)
+        if retry_after is not None:
+            response = JsonResponse(
+                {"detail": "Too many login attempts. Try again later."}, status=429
+            )
+            response["Retry-After"] = str(retry_after)
+            return response
+
+        pool = get_password_check_pool()
+        if not pool.acquire():
+            response = JsonResponse(
+                {"detail": "Too many concurrent logins. Try again later."},
+                status=503,
+            )
+            response["Retry-After"] = "1"
+            return response
+
+        try:
+            user = await sync_to_async(
+                User.objects.filter(username=username, is_active=True).first
+            )()
+            encoded = user.password if user else None
+            valid, new_encoded = await asyncio.get_running_loop().run_in_executor(
+                pool.executor, self.check_password, password, encoded
+            )
+        finally:
+            pool.release()
+
+        if user is None or not valid:
+            return JsonResponse({"detail": self.invalid_credentials}, status=401)
+
+        if new_encoded is not None:
+            user.password = new_encoded
+            await sync_to_async(user.save)(update_fields=["password"])
+
+        login_limiter.reset(username)
+        serializer_class = import_string(api_settings.TOKEN_OBTAIN_SERIALIZER)
+        refresh = await sync_to_async(serializer_class.get_token)(user)
+
+        return JsonResponse(
+            {"refresh": str(refresh), "access": str(refresh.access_token)}
+        )
+
+    @classmethod
+    def check_password(
+        cls, password: str, encoded: str | None
+    ) -> tuple[bool, str | None]:
+        """
+        Roda no pool: confere a senha (contra o hash fictício se o usuário
+        não existe) e, se o hash precisar ser atualizado, como no
+        `check_password` do Django, já devolve o novo. Assim nenhum PBKDF2
+        roda no event loop.
+        """
+        if encoded is None:
+            cls.check_password(password, cls.dummy_password())
+            return False, None
+
+        if not is_password_usable(encoded):
+            return False, None
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return False, None
+
+        if not hasher.verify(password, encoded):
+            return False, None
+
+        preferred = get_hasher("default")
+        if hasher.algorithm != preferred.algorithm or preferred.must_update(encoded):
+            return True, make_password(password)
+
+        return True, None